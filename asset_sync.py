@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Incremental asset syncing for the QRTick blog generator.
+
+Copies only files whose size, mtime or content differ from the copy already
+in the output directory, removes files that no longer exist in the source,
+and uses the cheapest copy mechanism the filesystem offers: a hardlink when
+asked for, otherwise a reflink (copy-on-write clone), copy_file_range, or a
+plain copy as the last resort.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+# ioctl request number for FICLONE on Linux (reflink / copy-on-write clone)
+FICLONE = 0x40049409
+
+
+class SyncResult:
+    """Counts of what a sync did"""
+
+    def __init__(self):
+        self.copied = []
+        # The subset of copied files that didn't exist in the destination before
+        self.added = []
+        self.removed = []
+        self.unchanged = 0
+        self.bytes_copied = 0
+
+    def merge(self, other):
+        self.copied.extend(other.copied)
+        self.added.extend(other.added)
+        self.removed.extend(other.removed)
+        self.unchanged += other.unchanged
+        self.bytes_copied += other.bytes_copied
+        return self
+
+    def summary(self):
+        return (f"{len(self.copied)} copied ({self.bytes_copied / 1024:.1f} KB), "
+                f"{len(self.removed)} removed, {self.unchanged} unchanged")
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _clone_into(src, dst):
+    """Copy src to dst using a reflink or copy_file_range when available"""
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            import fcntl
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+
+        copy_file_range = getattr(os, 'copy_file_range', None)
+        if copy_file_range is not None:
+            try:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    sent = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                if remaining == 0:
+                    return
+            except OSError:
+                pass
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+
+
+def files_match(src, dst, src_stat=None):
+    """True if dst already holds the same bytes as src"""
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        return False
+    src_stat = src_stat or os.stat(src)
+    if (src_stat.st_dev, src_stat.st_ino) == (dst_stat.st_dev, dst_stat.st_ino):
+        return True
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    # Same size but different mtime: fall back to comparing content, and
+    # resync the mtime on a match so the next check is cheap again
+    if _file_digest(src) == _file_digest(dst):
+        shutil.copystat(src, dst)
+        return True
+    return False
+
+
+def sync_file(src, dst, link=False):
+    """Make dst a copy of src if it isn't one already
+
+    Returns None when dst was already up to date, otherwise the number of
+    bytes copied (0 for a hardlink).
+    """
+    src, dst = Path(src), Path(dst)
+    src_stat = os.stat(src)
+    if files_match(src, dst, src_stat):
+        return None
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+    try:
+        if link:
+            try:
+                os.link(src, tmp)
+                os.replace(tmp, dst)
+                return 0
+            except OSError:
+                pass
+        _clone_into(src, tmp)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+    return src_stat.st_size
+
+
+def sync_tree(src_dir, dst_dir, link=False, keep=None):
+    """Mirror src_dir into dst_dir, copying changed files and removing orphans
+
+    keep, if given, is called with each destination path that has no source
+    counterpart; returning True leaves that file in place.
+    """
+    src_dir, dst_dir = Path(src_dir), Path(dst_dir)
+    result = SyncResult()
+    expected = set()
+
+    for root, _, files in os.walk(src_dir):
+        for name in files:
+            src = Path(root) / name
+            relative = src.relative_to(src_dir)
+            expected.add(relative)
+            existed = (dst_dir / relative).exists()
+            copied = sync_file(src, dst_dir / relative, link=link)
+            if copied is None:
+                result.unchanged += 1
+            else:
+                result.copied.append(str(relative))
+                if not existed:
+                    result.added.append(str(relative))
+                result.bytes_copied += copied
+
+    if dst_dir.exists():
+        for root, dirs, files in os.walk(dst_dir, topdown=False):
+            for name in files:
+                dst = Path(root) / name
+                relative = dst.relative_to(dst_dir)
+                if relative in expected or (keep and keep(dst)):
+                    continue
+                dst.unlink()
+                result.removed.append(str(relative))
+            for name in dirs:
+                directory = Path(root) / name
+                if (src_dir / directory.relative_to(dst_dir)).is_dir():
+                    continue
+                try:
+                    directory.rmdir()
+                except OSError:
+                    pass
+
+    return result
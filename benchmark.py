@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the QRTick blog generators.
+
+Synthesizes corpora shaped like the posts in blog/ (frontmatter, headings,
+lists, tables, code blocks and images), then times full, incremental and
+no-op builds of blog_generator.py and blog_generator_ai_optimized.py, each
+in a fresh subprocess. Wall time, peak RSS and the number of output files
+written are saved to a JSON results file; pass --baseline to compare against
+an earlier results file and fail when a build got slower than allowed.
+
+With --search, the same corpora are also loaded into serve.py's in-memory
+search index (search_engine.py), timing the initial index, the refresh after
+editing one post, and the p50/p95/p99 latency of a stream of random queries,
+JSON encoding included. Those posts share one 30-word vocabulary, the worst
+case for the index, so a second corpus of the same size is written from a
+Zipf-distributed vocabulary of 20,000 words, as natural text is.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+RESULTS_VERSION = 1
+REPO_DIR = Path(__file__).resolve().parent
+
+GENERATORS = {
+    'blog': REPO_DIR / "blog_generator.py",
+    'ai': REPO_DIR / "blog_generator_ai_optimized.py",
+}
+SCENARIOS = ('full', 'noop', 'incremental')
+SEARCH_MIN_DELTA_MS = 0.5
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+TAGS = ["event-planning", "jamaica", "ticketing", "qr-codes", "check-in", "platform-updates",
+        "revenue", "organizer-support", "mobile-tickets", "festivals", "concerts", "analytics"]
+WORDS = ("event organizers tickets guests check-in scan payment fast simple dashboard venue "
+         "capacity sponsors mobile entry lines revenue report team volunteers promoter stress "
+         "easy secure fraud refund update feature support night crowd party conference").split()
+EMOJI = ["🎉", "📱", "💰", "✅", "😌", "🚀", "📊", "🎫"]
+ZIPF_VOCABULARY_SIZE = 20000
+SYLLABLES = [consonant + vowel for consonant in "bcdfghjklmnprstvz" for vowel in "aeiou"]
+
+
+def zipf_vocabulary(rng, size=ZIPF_VOCABULARY_SIZE):
+    """Return (words, cumulative weights): WORDS then made-up words, the n-th word 1/n as common as the first"""
+    words = list(WORDS)
+    known = set(words)
+    while len(words) < len(WORDS) + size:
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        if word not in known:
+            known.add(word)
+            words.append(word)
+    return words, list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+
+def pick_words(rng, count, vocabulary=None):
+    """count words drawn evenly from WORDS, or from a zipf_vocabulary()"""
+    if vocabulary is None:
+        return [rng.choice(WORDS) for _ in range(count)]
+    words, cum_weights = vocabulary
+    return rng.choices(words, cum_weights=cum_weights, k=count)
+
+
+def sentence(rng, words=(8, 20), vocabulary=None):
+    text = ' '.join(pick_words(rng, rng.randint(*words), vocabulary))
+    return text[0].upper() + text[1:] + '.'
+
+
+def paragraph(rng, vocabulary=None):
+    return ' '.join(sentence(rng, vocabulary=vocabulary) for _ in range(rng.randint(2, 5)))
+
+
+def synthesize_post(rng, number, image_names, vocabulary=None):
+    """Return (file name, markdown source) for one synthetic post"""
+    title = ' '.join(pick_words(rng, rng.randint(3, 7), vocabulary)).title()
+    slug = f"post-{number:05d}-{title.lower().replace(' ', '-')}"[:60].rstrip('-')
+    month = MONTHS[number % 12]
+    year = 2020 + (number // 12) % 6
+    date = f"{month} {year}" if number % 3 else f"{month} {number % 28 + 1}, {year}"
+
+    lines = [
+        "---",
+        f'title: "{title}"',
+        f'date: "{date}"',
+        'author: "QRTick Team"',
+        f'slug: "{slug}"',
+        f'excerpt: "{sentence(rng, (12, 24), vocabulary)}"',
+        f"tags: {json.dumps(rng.sample(TAGS, rng.randint(2, 5)))}",
+    ]
+    if number % 17 == 0:
+        lines.append("featured: true")
+    lines += ["---", "", f"# {title}", f"## {sentence(rng, (4, 8), vocabulary)[:-1]}", "",
+              f"**{sentence(rng, (6, 12), vocabulary)}**", "", "---", ""]
+
+    for section in range(rng.randint(3, 6)):
+        lines += [f"## {rng.choice(EMOJI)} **{sentence(rng, (3, 6), vocabulary)[:-1]}**", "",
+                  paragraph(rng, vocabulary), ""]
+        shape = (number + section) % 4
+        if shape == 0:
+            lines += [f"- **{pick_words(rng, 1, vocabulary)[0].title()}** - {sentence(rng, (4, 10), vocabulary)}"
+                      for _ in range(rng.randint(3, 6))]
+        elif shape == 1:
+            lines += ["| Feature | Before | After |", "|---------|--------|-------|"]
+            lines += [f"| {pick_words(rng, 1, vocabulary)[0].title()} | "
+                      f"{rng.randint(1, 60)} min | {rng.randint(1, 9)} sec |"
+                      for _ in range(rng.randint(3, 6))]
+        elif shape == 2:
+            lines += ["```python", "def check_in(ticket):",
+                      "    if ticket.scanned:", "        return 'already scanned'",
+                      "    ticket.scanned = True", "    return 'welcome'", "```"]
+        elif image_names:
+            image = image_names[(number + section) % len(image_names)]
+            lines += [f"![{sentence(rng, (3, 6), vocabulary)[:-1]}](./images/bench/{image})"]
+        lines += ["", paragraph(rng, vocabulary), ""]
+
+    return f"{slug}.md", '\n'.join(lines) + '\n'
+
+
+def synthesize_corpus(root, post_count, seed=0, vocabulary=None):
+    """Write a corpus of post_count posts (plus images and the logo) under root
+
+    Posts are written from WORDS, or from a zipf_vocabulary() if one is given.
+    """
+    rng = random.Random(seed)
+    root = Path(root)
+    (root / "blog").mkdir(parents=True, exist_ok=True)
+    images_dir = root / "images" / "bench"
+    images_dir.mkdir(parents=True, exist_ok=True)
+
+    image_names = []
+    if Image is not None:
+        for number in range(min(20, max(3, post_count // 50))):
+            name = f"screenshot-{number:02d}.{'jpg' if number % 2 else 'png'}"
+            size = (1600, 900) if number % 2 else (1000, 700)
+            Image.effect_noise(size, 40 + number).convert('RGB').save(images_dir / name)
+            image_names.append(name)
+
+    for number in range(post_count):
+        name, source = synthesize_post(rng, number, image_names, vocabulary)
+        (root / "blog" / name).write_text(source, encoding='utf-8')
+
+    shutil.copy2(REPO_DIR / "qrtick-logo-alt.svg", root / "qrtick-logo-alt.svg")
+    return root
+
+
+def output_snapshot(output_dir):
+    """{relative path: (inode, size, mtime_ns)} for every file in the output"""
+    snapshot = {}
+    for path in Path(output_dir).rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            snapshot[str(path.relative_to(output_dir))] = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def run_build(script, corpus, args=()):
+    """Run one generator build in a subprocess; returns (wall seconds, peak RSS KB, log)"""
+    log_path = Path(corpus) / "build.log"
+    with open(log_path, 'w', encoding='utf-8') as log:
+        started = time.perf_counter()
+        process = subprocess.Popen([sys.executable, str(script)] + list(args), cwd=str(corpus),
+                                   stdout=log, stderr=subprocess.STDOUT)
+        if hasattr(os, 'wait4'):
+            # wait4 reports the peak RSS of this build (and any worker processes it reaped)
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -os.WTERMSIG(status)
+            peak_rss = usage.ru_maxrss
+        else:
+            process.wait()
+            peak_rss = None
+        wall = time.perf_counter() - started
+
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    if peak_rss is not None and sys.platform == 'darwin':
+        peak_rss //= 1024
+    log_text = log_path.read_text(encoding='utf-8', errors='replace')
+    if process.returncode != 0:
+        raise RuntimeError(f"{script.name} exited with status {process.returncode}:\n{log_text[-2000:]}")
+    return wall, peak_rss, log_text
+
+
+def touch_one_post(corpus):
+    """Make a small edit to one post, as an author would between builds"""
+    post = sorted((Path(corpus) / "blog").glob("*.md"))[0]
+    with open(post, 'a', encoding='utf-8') as f:
+        f.write(f"\nEdited at {time.time_ns()}.\n")
+
+
+def reset_outputs(corpus):
+    for name in ("blog_html", ".blog_cache"):
+        shutil.rmtree(Path(corpus) / name, ignore_errors=True)
+
+
+def benchmark_scenario(generator, scenario, corpus, post_count, build_args, repeat):
+    """Time one scenario `repeat` times and return its result entry"""
+    script = GENERATORS[generator]
+    walls, rss_values, written = [], [], []
+
+    for _ in range(repeat):
+        if scenario == 'full':
+            reset_outputs(corpus)
+        else:
+            # Start from a completed build so only the scenario's own work is timed
+            if not (Path(corpus) / "blog_html").exists():
+                run_build(script, corpus, build_args)
+            if scenario == 'incremental':
+                touch_one_post(corpus)
+
+        before = output_snapshot(Path(corpus) / "blog_html") if (Path(corpus) / "blog_html").exists() else {}
+        wall, peak_rss, _ = run_build(script, corpus, build_args)
+        after = output_snapshot(Path(corpus) / "blog_html")
+
+        walls.append(wall)
+        rss_values.append(peak_rss)
+        written.append(sum(1 for path, signature in after.items() if before.get(path) != signature))
+
+    return {
+        'posts': post_count,
+        'runs': repeat,
+        'wall_seconds': round(statistics.median(walls), 4),
+        'wall_seconds_min': round(min(walls), 4),
+        'peak_rss_kb': max(rss_values) if None not in rss_values else None,
+        'files_written': max(written)
+    }
+
+
+def percentile(values, fraction):
+    """The value below which `fraction` of the sorted values fall (nearest rank)"""
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def random_query(rng, vocabulary=None):
+    """A search as a reader would type it: one to three words, sometimes a tag or a miss"""
+    words = pick_words(rng, rng.randint(1, 3), vocabulary)
+    if rng.random() < 0.2:
+        words.append(rng.choice(TAGS))
+    if rng.random() < 0.05:
+        words = ["nonexistentword"]
+    return ' '.join(words)
+
+
+def benchmark_search(corpus, post_count, queries, seed, vocabulary=None):
+    """Index a corpus with serve.py's search engine and time queries against it
+
+    Queries are drawn from the vocabulary the corpus was written from.
+    """
+    from search_engine import SearchEngine
+
+    engine = SearchEngine(Path(corpus) / "blog")
+    started = time.perf_counter()
+    engine.refresh()
+    index_seconds = time.perf_counter() - started
+
+    touch_one_post(corpus)
+    started = time.perf_counter()
+    engine.refresh()
+    refresh_seconds = time.perf_counter() - started
+
+    rng = random.Random(seed)
+    for _ in range(min(100, queries)):
+        engine.search(random_query(rng, vocabulary))
+    latencies = []
+    for _ in range(queries):
+        query = random_query(rng, vocabulary)
+        started = time.perf_counter()
+        total, results = engine.search(query)
+        json.dumps({'query': query, 'total': total, 'results': results}, ensure_ascii=False)
+        latencies.append((time.perf_counter() - started) * 1000)
+    latencies.sort()
+
+    return {
+        'posts': post_count,
+        'queries': queries,
+        'index_seconds': round(index_seconds, 4),
+        'refresh_seconds': round(refresh_seconds, 4),
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'max_ms': round(latencies[-1], 3)
+    }
+
+
+def compare(results, baseline, max_regression, max_rss_regression, min_delta):
+    """Return a list of regression messages for results that got worse than allowed"""
+    failures = []
+    for key, result in sorted(results.items()):
+        old = baseline.get(key)
+        if not old:
+            continue
+        if 'p99_ms' in result:
+            p99_delta = result['p99_ms'] - old['p99_ms']
+            if p99_delta > SEARCH_MIN_DELTA_MS and p99_delta > old['p99_ms'] * max_regression:
+                failures.append(f"{key}: p99 latency {old['p99_ms']:.2f} ms -> {result['p99_ms']:.2f} ms "
+                                f"(+{p99_delta / old['p99_ms'] * 100:.0f}%)")
+            continue
+        wall_delta = result['wall_seconds'] - old['wall_seconds']
+        if wall_delta > min_delta and wall_delta > old['wall_seconds'] * max_regression:
+            failures.append(f"{key}: wall time {old['wall_seconds']:.3f}s -> {result['wall_seconds']:.3f}s "
+                            f"(+{wall_delta / old['wall_seconds'] * 100:.0f}%)")
+        if result.get('peak_rss_kb') and old.get('peak_rss_kb'):
+            if result['peak_rss_kb'] > old['peak_rss_kb'] * (1 + max_rss_regression):
+                failures.append(f"{key}: peak RSS {old['peak_rss_kb'] / 1024:.1f} MB -> "
+                                f"{result['peak_rss_kb'] / 1024:.1f} MB")
+        if result['files_written'] > old['files_written']:
+            failures.append(f"{key}: files written {old['files_written']} -> {result['files_written']}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the QRTick blog generators on synthetic corpora")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], metavar='N',
+                        help="corpus sizes in posts (default: 100 1000 10000)")
+    parser.add_argument('--generators', nargs='*', choices=sorted(GENERATORS), default=sorted(GENERATORS),
+                        help="generators to benchmark (default: both; give none to only run --search)")
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+                        help="builds to time (default: full noop incremental)")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="pass --jobs N to blog_generator.py")
+    parser.add_argument('--repeat', type=int, default=1, metavar='N',
+                        help="time every scenario N times and keep the median")
+    parser.add_argument('--search', action='store_true',
+                        help="also benchmark serve.py's in-memory /search index on every corpus")
+    parser.add_argument('--queries', type=int, default=2000, metavar='N',
+                        help="queries to time per corpus with --search (default 2000)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for the synthetic corpora")
+    parser.add_argument('--output', default='.blog_cache/benchmark-results.json', metavar='FILE',
+                        help="where to write the results (default .blog_cache/benchmark-results.json)")
+    parser.add_argument('--baseline', metavar='FILE',
+                        help="results file to compare against; exit non-zero on regressions")
+    parser.add_argument('--max-regression', type=float, default=0.10, metavar='FRACTION',
+                        help="allowed wall time increase over the baseline (default 0.10 = 10%%)")
+    parser.add_argument('--max-rss-regression', type=float, default=0.25, metavar='FRACTION',
+                        help="allowed peak RSS increase over the baseline (default 0.25 = 25%%)")
+    parser.add_argument('--min-delta', type=float, default=0.05, metavar='SECONDS',
+                        help="ignore wall time regressions smaller than this (default 0.05)")
+    parser.add_argument('--keep', action='store_true', help="keep the synthetic corpora afterwards")
+    args = parser.parse_args()
+
+    results = {}
+    work_dir = Path(tempfile.mkdtemp(prefix="qrtick-bench-"))
+    print(f"🧪 Benchmarking in {work_dir}")
+    if Image is None:
+        print("⚠️  Pillow not installed - synthetic corpora will have no images")
+
+    try:
+        for size in args.sizes:
+            for generator in args.generators:
+                corpus = synthesize_corpus(work_dir / f"{generator}-{size}", size, seed=args.seed)
+                build_args = ['--jobs', str(args.jobs)] if generator == 'blog' else []
+                for scenario in args.scenarios:
+                    key = f"{generator}/{size}/{scenario}"
+                    result = benchmark_scenario(generator, scenario, corpus, size, build_args, args.repeat)
+                    results[key] = result
+                    rss = f"{result['peak_rss_kb'] / 1024:.1f} MB" if result['peak_rss_kb'] else "n/a"
+                    print(f"⏱️  {key:<28} {result['wall_seconds']:8.3f}s  peak RSS {rss:>9}  "
+                          f"{result['files_written']:>6} files written")
+                if not args.keep:
+                    shutil.rmtree(corpus, ignore_errors=True)
+            if args.search:
+                # The shared 30-word worst case, then the same size with a natural vocabulary
+                for key, vocabulary in ((f"search/{size}", None),
+                                        (f"search/{size}/zipf", zipf_vocabulary(random.Random(args.seed)))):
+                    corpus = synthesize_corpus(work_dir / key.replace('/', '-'), size, seed=args.seed,
+                                               vocabulary=vocabulary)
+                    result = benchmark_search(corpus, size, args.queries, args.seed, vocabulary)
+                    results[key] = result
+                    print(f"🔎 {key:<28} index {result['index_seconds']:.3f}s  "
+                          f"refresh {result['refresh_seconds']:.3f}s  p50 {result['p50_ms']:.2f} ms  "
+                          f"p95 {result['p95_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms")
+                    if not args.keep:
+                        shutil.rmtree(corpus, ignore_errors=True)
+    finally:
+        if not args.keep:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': RESULTS_VERSION,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'jobs': args.jobs,
+            'results': results
+        }, f, indent=2)
+    print(f"📝 Results written to {output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('results', {})
+        failures = compare(results, baseline, args.max_regression, args.max_rss_regression, args.min_delta)
+        if failures:
+            print("❌ Regressions against baseline:")
+            for failure in failures:
+                print(f"   {failure}")
+            sys.exit(1)
+        print(f"✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,16 +12,86 @@ import os
 import re
 import markdown
 import yaml
-import shutil
 import json
+import functools
+import heapq
+import time
+import tracemalloc
 from datetime import datetime
 from pathlib import Path
 
+from asset_sync import sync_file, sync_tree
+from build_manifest import BuildManifest, file_signature, hash_bytes, hash_file, hash_json, hash_text
+from build_report import BuildReport, timed
+from feeds import FEED_FILES, FEED_TITLE, ContentStore, Feed, FeedEntry, SITE_URL
+from html_minifier import hoisted_css, inline_styles, minify_html, style_class_name
+from image_pipeline import ImagePipeline
+from markdown_renderer import MarkdownRenderer
+from output_changes import OutputChanges
+from output_stages import load_stages
+from precompress import PRECOMPRESSED_SUFFIXES, brotli, precompress_tree
+from render_cache import RenderCache
+from search_index import SearchIndex, document_terms
+from source_dates import modified_dates
+from template_compiler import CompiledTemplate
+
+MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.extra',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.toc',
+    'markdown.extensions.tables',
+    'markdown.extensions.fenced_code'
+]
+
+# Output stages that turn a standard build into the AI-optimized one
+AI_STAGES = ('ai-meta', 'json-ld')
+
 class BlogGenerator:
-    def __init__(self, blog_dir="blog", output_dir="blog_html"):
+    def __init__(self, blog_dir="blog", output_dir="blog_html", cache_dir=".blog_cache", use_cache=True,
+                 inline_critical=False, link_assets=False, stages=(), precompress=False, minify=False,
+                 per_page=10, search=False, feed_size=20):
         self.blog_dir = Path(blog_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.cache_dir = Path(cache_dir)
+        self.manifest = BuildManifest(self.cache_dir / "manifest.json")
+        self.render_cache = RenderCache(self.cache_dir / "render", enabled=use_cache)
+        # Builds one Markdown instance on first use and resets it between posts
+        self.renderer = MarkdownRenderer(self.render_cache)
+        self.image_pipeline = ImagePipeline("images", self.cache_dir / "images")
+        self.footer_config_path = Path("../shared_footer_config.json")
+        # (config hash, footer HTML) for the current build; see prepare_footer()
+        self._footer = None
+        self.site_root = "/blog/"
+        self.inline_critical = inline_critical
+        # Hardlink (rather than copy) images, logo and favicon into the output
+        self.link_assets = link_assets
+        self._stylesheets = None
+        # Minify pages, hoisting the chrome's inline styles into the shared stylesheet
+        self.minify = minify
+        self._style_classes = None
+        # Posts per numbered archive page (the index shows per_page..2*per_page-1); 0 = one page
+        self.per_page = per_page
+        # Write .br/.gz siblings of the text outputs after each build
+        self.precompress = precompress
+        # Build the sharded client-side search index and add a search box to the index
+        self.search = search
+        self.search_index = SearchIndex(self.cache_dir / "search-terms.json")
+        self._search_script = None
+        # Posts in the RSS, Atom and JSON feeds (0 = no feeds); bodies are kept for them in the store
+        self.feed_size = feed_size
+        self.content_store = ContentStore(self.cache_dir / "feed-content")
+        # Extra output stages (e.g. AI meta tags, JSON-LD) run on every page; see output_stages.py
+        self.stage_names = list(stages)
+        self.stages = load_stages(self.stage_names, self)
+        # Page templates are compiled on first use; see render_page()
+        self._compiled_templates = {}
+        self.last_render_time = 0.0
+        # Phase timings for the current build; see build_report.py
+        self.report = BuildReport()
+        self.report_path = self.cache_dir / "build-report.json"
+        # Outputs added/modified/deleted by the current build; see output_changes.py
+        self.changes = OutputChanges(self.output_dir)
         
         # QRTick brand colors and styling
         self.template_vars = {
@@ -76,316 +146,11 @@ class BlogGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title} - QRTick Blog</title>
-    <meta name="description" content="{description}">
+    {head_meta}
     <link rel="icon" type="image/png" href="https://brand.qrtick.com/png-logos/qrtickicon.png">
     <link rel="shortcut icon" href="https://brand.qrtick.com/png-logos/qrtickicon.png">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #FFFFFF;
-            color: #2D2D2D;
-            line-height: 1.7;
-            font-size: 16px;
-        }}
-        
-        .header {{
-            background: #FFFFFF;
-            border-bottom: 1px solid #E5E5E5;
-            padding: 1rem 0;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-        }}
-        
-        .header-container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .nav-left {{
-            display: flex;
-            align-items: center;
-        }}
-        
-        .nav-right {{
-            display: flex;
-            align-items: center;
-            margin-left: 3rem;
-        }}
-        
-        .logo {{
-            height: 30px;
-            width: auto;
-        }}
-        
-        .nav-links {{
-            display: flex;
-            gap: 1rem;
-            align-items: center;
-        }}
-        
-        .nav-link {{
-            color: #666666;
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 15px;
-            transition: color 0.2s;
-        }}
-        
-        .nav-link:hover {{
-            color: #2D2D2D;
-        }}
-        
-        .nav-link.primary {{
-            background: #2D2D2D;
-            color: #FFFFFF;
-            padding: 0.5rem 1rem;
-            border-radius: 6px;
-            transition: background 0.2s;
-        }}
-        
-        .nav-link.primary:hover {{
-            background: #1A1A1A;
-            color: #FFFFFF;
-        }}
-        
-        .main-container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 3rem 2rem;
-        }}
-        
-        .post-header {{
-            text-align: center;
-            margin-bottom: 3rem;
-            padding-bottom: 2rem;
-            border-bottom: 1px solid #E5E5E5;
-        }}
-        
-        .post-title {{
-            font-size: 2.5rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            margin-bottom: 1rem;
-            letter-spacing: -0.02em;
-            line-height: 1.2;
-        }}
-        
-        .post-meta {{
-            display: flex;
-            justify-content: center;
-            gap: 1rem;
-            color: #666666;
-            font-size: 0.9rem;
-            align-items: center;
-        }}
-        
-        .post-meta span {{
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }}
-        
-        .blog-content {{
-            font-size: 1.1rem;
-            line-height: 1.8;
-        }}
-        
-        .blog-content h1 {{
-            font-size: 2.25rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            margin: 2.5rem 0 1rem 0;
-            letter-spacing: -0.02em;
-        }}
-        
-        .blog-content h2 {{
-            font-size: 1.75rem;
-            font-weight: 600;
-            color: #2D2D2D;
-            margin: 2rem 0 1rem 0;
-            letter-spacing: -0.01em;
-        }}
-        
-        .blog-content h3 {{
-            font-size: 1.375rem;
-            font-weight: 600;
-            color: #2D2D2D;
-            margin: 1.5rem 0 0.75rem 0;
-        }}
-        
-        .blog-content p {{
-            margin-bottom: 1.5rem;
-            color: #2D2D2D;
-        }}
-        
-        .blog-content strong {{
-            font-weight: 600;
-            color: #1A1A1A;
-        }}
-        
-        .blog-content ul, .blog-content ol {{
-            margin: 1.5rem 0;
-            padding-left: 1.5rem;
-        }}
-        
-        .blog-content li {{
-            margin-bottom: 0.75rem;
-            color: #2D2D2D;
-        }}
-        
-        .blog-content blockquote {{
-            border-left: 4px solid #FDC230;
-            margin: 2rem 0;
-            padding: 1.5rem 0 1.5rem 2rem;
-            background: #FFF9EA;
-            border-radius: 0 8px 8px 0;
-            font-style: italic;
-            color: #2D2D2D;
-        }}
-        
-        .blog-content code {{
-            background: #F5F5F5;
-            padding: 0.2rem 0.4rem;
-            border-radius: 4px;
-            font-family: 'SF Mono', Monaco, Menlo, Consolas, monospace;
-            font-size: 0.9em;
-        }}
-        
-        .blog-content pre {{
-            background: #F5F5F5;
-            padding: 1.5rem;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 1.5rem 0;
-        }}
-        
-        .blog-content pre code {{
-            background: none;
-            padding: 0;
-        }}
-        
-        .blog-content img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 12px;
-            margin: 2rem 0;
-            display: block;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .back-to-blog {{
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            color: #666666;
-            text-decoration: none;
-            font-weight: 500;
-            margin-bottom: 2rem;
-            padding: 0.75rem 0;
-            transition: color 0.2s;
-        }}
-        
-        .back-to-blog:hover {{
-            color: #2D2D2D;
-        }}
-        
-        .footer {{
-            background: #FFFFFF;
-            padding: 3rem 0 2rem 0;
-            margin-top: 4rem;
-            border-top: 1px solid #E5E5E5;
-            text-align: center;
-        }}
-        
-        .footer-content {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: center;
-            gap: 3rem;
-        }}
-        
-        .footer-logo {{
-            height: 32px;
-            margin-bottom: 1rem;
-        }}
-        
-        .footer-text {{
-            color: #666666;
-            font-size: 0.9rem;
-            margin-bottom: 1rem;
-        }}
-        
-        .footer-links {{
-            display: flex;
-            justify-content: center;
-            gap: 2rem;
-        }}
-        
-        .footer-link {{
-            color: #666666;
-            text-decoration: none;
-            font-size: 0.9rem;
-            transition: color 0.2s;
-        }}
-        
-        .footer-link:hover {{
-            color: #2D2D2D;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header-container {{
-                padding: 0 1rem;
-            }}
-            
-            .nav-links {{
-                gap: 1rem;
-            }}
-            
-            .main-container {{
-                padding: 2rem 1rem;
-            }}
-            
-            .post-title {{
-                font-size: 2rem;
-            }}
-            
-            .post-meta {{
-                flex-direction: column;
-                gap: 0.5rem;
-            }}
-            
-            .blog-content {{
-                font-size: 1rem;
-            }}
-            
-            .blog-content h1 {{
-                font-size: 1.75rem;
-            }}
-            
-            .blog-content h2 {{
-                font-size: 1.5rem;
-            }}
-            
-            .footer-links {{
-                flex-direction: column;
-                gap: 1rem;
-            }}
-        }}
-    </style>
+    {stylesheets}
 </head>
 <body>
     <header class="header">
@@ -418,358 +183,12 @@ class BlogGenerator:
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>The QR Code - QRTick Blog</title>
-    <meta name="description" content="Making event management stress-free for organisers across Jamaica. Tips, insights, and solutions for better events.">
+    <title>{page_title} - QRTick Blog</title>
+    {head_meta}
     <link rel="icon" type="image/png" href="https://brand.qrtick.com/png-logos/qrtickicon.png">
     <link rel="shortcut icon" href="https://brand.qrtick.com/png-logos/qrtickicon.png">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #FFFFFF;
-            color: #2D2D2D;
-            line-height: 1.7;
-            font-size: 16px;
-        }}
-        
-        .header {{
-            background: #FFFFFF;
-            border-bottom: 1px solid #E5E5E5;
-            padding: 1rem 0;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-        }}
-        
-        .header-container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .nav-left {{
-            display: flex;
-            align-items: center;
-        }}
-        
-        .nav-right {{
-            display: flex;
-            align-items: center;
-            margin-left: 3rem;
-        }}
-        
-        .logo {{
-            height: 30px;
-            width: auto;
-        }}
-        
-        .nav-links {{
-            display: flex;
-            gap: 1rem;
-            align-items: center;
-        }}
-        
-        .nav-link {{
-            color: #666666;
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 15px;
-            transition: color 0.2s;
-        }}
-        
-        .nav-link:hover {{
-            color: #2D2D2D;
-        }}
-        
-        .nav-link.primary {{
-            background: #2D2D2D;
-            color: #FFFFFF;
-            padding: 0.5rem 1rem;
-            border-radius: 6px;
-            transition: background 0.2s;
-        }}
-        
-        .nav-link.primary:hover {{
-            background: #1A1A1A;
-            color: #FFFFFF;
-        }}
-        
-        .hero-section {{
-            background: linear-gradient(135deg, #FFF9EA 0%, #FFFFFF 100%);
-            padding: 4rem 0 3rem 0;
-            text-align: center;
-            border-bottom: 1px solid #E5E5E5;
-        }}
-        
-        .hero-container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem;
-        }}
-        
-        .blog-title {{
-            font-size: 3rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            margin-bottom: 1rem;
-            letter-spacing: -0.02em;
-        }}
-        
-        .blog-subtitle {{
-            font-size: 1.25rem;
-            color: #666666;
-            font-weight: 400;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .blog-tagline {{
-            font-size: 1rem;
-            color: #888888;
-            margin-top: 0.5rem;
-        }}
-        
-        .main-container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 3rem 2rem;
-        }}
-        
-        .featured-post {{
-            background: linear-gradient(135deg, #FFF9EA 0%, #FFFFFF 100%);
-            border: 1px solid #E5E5E5;
-            border-radius: 16px;
-            padding: 2.5rem;
-            margin-bottom: 3rem;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .featured-badge {{
-            position: absolute;
-            top: 1.5rem;
-            right: 1.5rem;
-            background: #FDC230;
-            color: #2D2D2D;
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.8rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        
-        .featured-post h2 {{
-            font-size: 2rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            margin-bottom: 1rem;
-            letter-spacing: -0.02em;
-            line-height: 1.3;
-        }}
-        
-        .featured-post h2 a {{
-            color: #2D2D2D;
-            text-decoration: none;
-        }}
-        
-        .featured-post h2 a:hover {{
-            color: #1A1A1A;
-        }}
-        
-        .blog-post {{
-            border-bottom: 1px solid #E5E5E5;
-            padding: 2rem 0;
-            transition: transform 0.2s;
-        }}
-        
-        .blog-post:last-child {{
-            border-bottom: none;
-        }}
-        
-        .blog-post:hover {{
-            transform: translateY(-2px);
-        }}
-        
-        .blog-post h2 {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: #2D2D2D;
-            margin-bottom: 0.75rem;
-            letter-spacing: -0.01em;
-            line-height: 1.4;
-        }}
-        
-        .blog-post h2 a {{
-            color: #2D2D2D;
-            text-decoration: none;
-        }}
-        
-        .blog-post h2 a:hover {{
-            color: #1A1A1A;
-        }}
-        
-        .blog-meta {{
-            font-size: 0.9rem;
-            color: #666666;
-            margin-bottom: 1rem;
-            display: flex;
-            gap: 1rem;
-            align-items: center;
-        }}
-        
-        .blog-meta span {{
-            display: flex;
-            align-items: center;
-            gap: 0.25rem;
-        }}
-        
-        .blog-excerpt {{
-            margin-bottom: 1.5rem;
-            line-height: 1.7;
-            color: #2D2D2D;
-        }}
-        
-        .read-more {{
-            color: #666666;
-            text-decoration: none;
-            font-weight: 500;
-            font-size: 0.9rem;
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            transition: color 0.2s;
-        }}
-        
-        .read-more:hover {{
-            color: #2D2D2D;
-        }}
-        
-        .read-more::after {{
-            content: '→';
-            transition: transform 0.2s;
-        }}
-        
-        .read-more:hover::after {{
-            transform: translateX(2px);
-        }}
-        
-        .tags {{
-            display: flex;
-            gap: 0.5rem;
-            margin-top: 1rem;
-            flex-wrap: wrap;
-        }}
-        
-        .tag {{
-            background: #F5F5F5;
-            color: #666666;
-            padding: 0.25rem 0.75rem;
-            border-radius: 12px;
-            font-size: 0.8rem;
-            text-decoration: none;
-            transition: all 0.2s;
-        }}
-        
-        .tag:hover {{
-            background: #E5E5E5;
-            color: #2D2D2D;
-        }}
-        
-        .footer {{
-            background: #FFFFFF;
-            padding: 3rem 0 2rem 0;
-            margin-top: 4rem;
-            border-top: 1px solid #E5E5E5;
-            text-align: center;
-        }}
-        
-        .footer-content {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: center;
-            gap: 3rem;
-        }}
-        
-        .footer-logo {{
-            height: 32px;
-            margin-bottom: 1rem;
-        }}
-        
-        .footer-text {{
-            color: #666666;
-            font-size: 0.9rem;
-            margin-bottom: 1rem;
-        }}
-        
-        .footer-links {{
-            display: flex;
-            justify-content: center;
-            gap: 2rem;
-        }}
-        
-        .footer-link {{
-            color: #666666;
-            text-decoration: none;
-            font-size: 0.9rem;
-            transition: color 0.2s;
-        }}
-        
-        .footer-link:hover {{
-            color: #2D2D2D;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header-container {{
-                padding: 0 1rem;
-            }}
-            
-            .nav-links {{
-                gap: 1rem;
-            }}
-            
-            .blog-title {{
-                font-size: 2.25rem;
-            }}
-            
-            .blog-subtitle {{
-                font-size: 1.1rem;
-            }}
-            
-            .main-container {{
-                padding: 2rem 1rem;
-            }}
-            
-            .featured-post {{
-                padding: 2rem;
-            }}
-            
-            .featured-post h2 {{
-                font-size: 1.75rem;
-            }}
-            
-            .blog-meta {{
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 0.5rem;
-            }}
-            
-            .footer-links {{
-                flex-direction: column;
-                gap: 1rem;
-            }}
-        }}
-    </style>
+    {stylesheets}
 </head>
 <body>
     <header class="header">
@@ -805,6 +224,731 @@ class BlogGenerator:
 </body>
 </html>"""
 
+    def get_critical_css(self):
+        """Above-the-fold rules shared by every page (reset, header and navigation)"""
+        return """* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: #FFFFFF;
+    color: #2D2D2D;
+    line-height: 1.7;
+    font-size: 16px;
+}
+
+.header {
+    background: #FFFFFF;
+    border-bottom: 1px solid #E5E5E5;
+    padding: 1rem 0;
+    position: sticky;
+    top: 0;
+    z-index: 100;
+}
+
+.header-container {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 0 2rem;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+}
+
+.nav-left {
+    display: flex;
+    align-items: center;
+}
+
+.nav-right {
+    display: flex;
+    align-items: center;
+    margin-left: 3rem;
+}
+
+.logo {
+    height: 30px;
+    width: auto;
+}
+
+.nav-links {
+    display: flex;
+    gap: 1rem;
+    align-items: center;
+}
+
+.nav-link {
+    color: #666666;
+    text-decoration: none;
+    font-weight: 500;
+    font-size: 15px;
+    transition: color 0.2s;
+}
+
+.nav-link:hover {
+    color: #2D2D2D;
+}
+
+.nav-link.primary {
+    background: #2D2D2D;
+    color: #FFFFFF;
+    padding: 0.5rem 1rem;
+    border-radius: 6px;
+    transition: background 0.2s;
+}
+
+.nav-link.primary:hover {
+    background: #1A1A1A;
+    color: #FFFFFF;
+}
+
+@media (max-width: 768px) {
+    .header-container {
+        padding: 0 1rem;
+    }
+
+    .nav-links {
+        gap: 1rem;
+    }
+}
+"""
+
+    def get_shared_css(self):
+        """Remaining rules shared by every page (layout container and footer)"""
+        return """.main-container {
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 3rem 2rem;
+}
+
+.footer {
+    background: #FFFFFF;
+    padding: 3rem 0 2rem 0;
+    margin-top: 4rem;
+    border-top: 1px solid #E5E5E5;
+    text-align: center;
+}
+
+.footer-content {
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 0 2rem;
+    display: flex;
+    justify-content: center;
+    gap: 3rem;
+}
+
+.footer-logo {
+    height: 32px;
+    margin-bottom: 1rem;
+}
+
+.footer-text {
+    color: #666666;
+    font-size: 0.9rem;
+    margin-bottom: 1rem;
+}
+
+.footer-links {
+    display: flex;
+    justify-content: center;
+    gap: 2rem;
+}
+
+.footer-link {
+    color: #666666;
+    text-decoration: none;
+    font-size: 0.9rem;
+    transition: color 0.2s;
+}
+
+.footer-link:hover {
+    color: #2D2D2D;
+}
+
+@media (max-width: 768px) {
+    .main-container {
+        padding: 2rem 1rem;
+    }
+
+    .footer-links {
+        flex-direction: column;
+        gap: 1rem;
+    }
+}
+"""
+
+    def get_post_css(self):
+        """Rules only used by individual blog post pages"""
+        return """.post-header {
+    text-align: center;
+    margin-bottom: 3rem;
+    padding-bottom: 2rem;
+    border-bottom: 1px solid #E5E5E5;
+}
+
+.post-title {
+    font-size: 2.5rem;
+    font-weight: 700;
+    color: #2D2D2D;
+    margin-bottom: 1rem;
+    letter-spacing: -0.02em;
+    line-height: 1.2;
+}
+
+.post-meta {
+    display: flex;
+    justify-content: center;
+    gap: 1rem;
+    color: #666666;
+    font-size: 0.9rem;
+    align-items: center;
+}
+
+.post-meta span {
+    display: flex;
+    align-items: center;
+    gap: 0.25rem;
+}
+
+.blog-content {
+    font-size: 1.1rem;
+    line-height: 1.8;
+}
+
+.blog-content h1 {
+    font-size: 2.25rem;
+    font-weight: 700;
+    color: #2D2D2D;
+    margin: 2.5rem 0 1rem 0;
+    letter-spacing: -0.02em;
+}
+
+.blog-content h2 {
+    font-size: 1.75rem;
+    font-weight: 600;
+    color: #2D2D2D;
+    margin: 2rem 0 1rem 0;
+    letter-spacing: -0.01em;
+}
+
+.blog-content h3 {
+    font-size: 1.375rem;
+    font-weight: 600;
+    color: #2D2D2D;
+    margin: 1.5rem 0 0.75rem 0;
+}
+
+.blog-content p {
+    margin-bottom: 1.5rem;
+    color: #2D2D2D;
+}
+
+.blog-content strong {
+    font-weight: 600;
+    color: #1A1A1A;
+}
+
+.blog-content ul, .blog-content ol {
+    margin: 1.5rem 0;
+    padding-left: 1.5rem;
+}
+
+.blog-content li {
+    margin-bottom: 0.75rem;
+    color: #2D2D2D;
+}
+
+.blog-content blockquote {
+    border-left: 4px solid #FDC230;
+    margin: 2rem 0;
+    padding: 1.5rem 0 1.5rem 2rem;
+    background: #FFF9EA;
+    border-radius: 0 8px 8px 0;
+    font-style: italic;
+    color: #2D2D2D;
+}
+
+.blog-content code {
+    background: #F5F5F5;
+    padding: 0.2rem 0.4rem;
+    border-radius: 4px;
+    font-family: 'SF Mono', Monaco, Menlo, Consolas, monospace;
+    font-size: 0.9em;
+}
+
+.blog-content pre {
+    background: #F5F5F5;
+    padding: 1.5rem;
+    border-radius: 8px;
+    overflow-x: auto;
+    margin: 1.5rem 0;
+}
+
+.blog-content pre code {
+    background: none;
+    padding: 0;
+}
+
+.blog-content img {
+    max-width: 100%;
+    height: auto;
+    border-radius: 12px;
+    margin: 2rem 0;
+    display: block;
+    box-shadow: 0 4px 20px rgba(0, 0, 0, 0.1);
+}
+
+.back-to-blog {
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    color: #666666;
+    text-decoration: none;
+    font-weight: 500;
+    margin-bottom: 2rem;
+    padding: 0.75rem 0;
+    transition: color 0.2s;
+}
+
+.back-to-blog:hover {
+    color: #2D2D2D;
+}
+
+@media (max-width: 768px) {
+    .post-title {
+        font-size: 2rem;
+    }
+
+    .post-meta {
+        flex-direction: column;
+        gap: 0.5rem;
+    }
+
+    .blog-content {
+        font-size: 1rem;
+    }
+
+    .blog-content h1 {
+        font-size: 1.75rem;
+    }
+
+    .blog-content h2 {
+        font-size: 1.5rem;
+    }
+}
+"""
+
+    def get_index_css(self):
+        """Rules only used by the blog index page"""
+        return """.hero-section {
+    background: linear-gradient(135deg, #FFF9EA 0%, #FFFFFF 100%);
+    padding: 4rem 0 3rem 0;
+    text-align: center;
+    border-bottom: 1px solid #E5E5E5;
+}
+
+.hero-container {
+    max-width: 800px;
+    margin: 0 auto;
+    padding: 0 2rem;
+}
+
+.blog-title {
+    font-size: 3rem;
+    font-weight: 700;
+    color: #2D2D2D;
+    margin-bottom: 1rem;
+    letter-spacing: -0.02em;
+}
+
+.blog-subtitle {
+    font-size: 1.25rem;
+    color: #666666;
+    font-weight: 400;
+    margin-bottom: 0.5rem;
+}
+
+.blog-tagline {
+    font-size: 1rem;
+    color: #888888;
+    margin-top: 0.5rem;
+}
+
+.featured-post {
+    background: linear-gradient(135deg, #FFF9EA 0%, #FFFFFF 100%);
+    border: 1px solid #E5E5E5;
+    border-radius: 16px;
+    padding: 2.5rem;
+    margin-bottom: 3rem;
+    position: relative;
+    overflow: hidden;
+}
+
+.featured-badge {
+    position: absolute;
+    top: 1.5rem;
+    right: 1.5rem;
+    background: #FDC230;
+    color: #2D2D2D;
+    padding: 0.25rem 0.75rem;
+    border-radius: 12px;
+    font-size: 0.8rem;
+    font-weight: 600;
+    text-transform: uppercase;
+    letter-spacing: 0.5px;
+}
+
+.featured-post h2 {
+    font-size: 2rem;
+    font-weight: 700;
+    color: #2D2D2D;
+    margin-bottom: 1rem;
+    letter-spacing: -0.02em;
+    line-height: 1.3;
+}
+
+.featured-post h2 a {
+    color: #2D2D2D;
+    text-decoration: none;
+}
+
+.featured-post h2 a:hover {
+    color: #1A1A1A;
+}
+
+.blog-post {
+    border-bottom: 1px solid #E5E5E5;
+    padding: 2rem 0;
+    transition: transform 0.2s;
+}
+
+.blog-post:last-child {
+    border-bottom: none;
+}
+
+.blog-post:hover {
+    transform: translateY(-2px);
+}
+
+.blog-post h2 {
+    font-size: 1.5rem;
+    font-weight: 600;
+    color: #2D2D2D;
+    margin-bottom: 0.75rem;
+    letter-spacing: -0.01em;
+    line-height: 1.4;
+}
+
+.blog-post h2 a {
+    color: #2D2D2D;
+    text-decoration: none;
+}
+
+.blog-post h2 a:hover {
+    color: #1A1A1A;
+}
+
+.blog-meta {
+    font-size: 0.9rem;
+    color: #666666;
+    margin-bottom: 1rem;
+    display: flex;
+    gap: 1rem;
+    align-items: center;
+}
+
+.blog-meta span {
+    display: flex;
+    align-items: center;
+    gap: 0.25rem;
+}
+
+.blog-meta a {
+    color: inherit;
+    text-decoration: none;
+}
+
+.blog-meta a:hover {
+    color: #2D2D2D;
+}
+
+.blog-excerpt {
+    margin-bottom: 1.5rem;
+    line-height: 1.7;
+    color: #2D2D2D;
+}
+
+.read-more {
+    color: #666666;
+    text-decoration: none;
+    font-weight: 500;
+    font-size: 0.9rem;
+    display: inline-flex;
+    align-items: center;
+    gap: 0.5rem;
+    transition: color 0.2s;
+}
+
+.read-more:hover {
+    color: #2D2D2D;
+}
+
+.read-more::after {
+    content: '→';
+    transition: transform 0.2s;
+}
+
+.read-more:hover::after {
+    transform: translateX(2px);
+}
+
+.tags {
+    display: flex;
+    gap: 0.5rem;
+    margin-top: 1rem;
+    flex-wrap: wrap;
+}
+
+.tag {
+    background: #F5F5F5;
+    color: #666666;
+    padding: 0.25rem 0.75rem;
+    border-radius: 12px;
+    font-size: 0.8rem;
+    text-decoration: none;
+    transition: all 0.2s;
+}
+
+.tag:hover {
+    background: #E5E5E5;
+    color: #2D2D2D;
+}
+
+.listing-title {
+    font-size: 1.5rem;
+    font-weight: 600;
+    color: #2D2D2D;
+    margin-bottom: 2rem;
+}
+
+.pagination {
+    display: flex;
+    justify-content: space-between;
+    gap: 1rem;
+    margin-top: 2rem;
+}
+
+.pagination a {
+    color: #666666;
+    text-decoration: none;
+    font-weight: 500;
+    transition: color 0.2s;
+}
+
+.pagination a:hover {
+    color: #2D2D2D;
+}
+
+.pagination .pagination-older {
+    margin-left: auto;
+}
+
+.search-form {
+    margin-bottom: 2rem;
+}
+
+.search-form input {
+    width: 100%;
+    padding: 0.75rem 1rem;
+    font: inherit;
+    color: #2D2D2D;
+    border: 1px solid #E5E5E5;
+    border-radius: 8px;
+    background: #FFFFFF;
+}
+
+.search-form input:focus {
+    outline: none;
+    border-color: #FDC230;
+}
+
+.search-results {
+    margin-bottom: 3rem;
+}
+
+@media (max-width: 768px) {
+    .blog-title {
+        font-size: 2.25rem;
+    }
+
+    .blog-subtitle {
+        font-size: 1.1rem;
+    }
+
+    .featured-post {
+        padding: 2rem;
+    }
+
+    .featured-post h2 {
+        font-size: 1.75rem;
+    }
+
+    .blog-meta {
+        flex-direction: column;
+        align-items: flex-start;
+        gap: 0.5rem;
+    }
+}
+"""
+
+    def get_stylesheets(self):
+        """Return {kind: (filename, css)} for the content-hashed stylesheets
+        
+        'styles' holds the rules every page shares; 'post' and 'index' hold
+        the rules specific to each page type. File names embed a hash of the
+        CSS so they can be cached forever.
+        """
+        if self._stylesheets is None:
+            sources = {
+                'styles': self.get_critical_css() + '\n' + self.get_shared_css() + self.get_hoisted_css(),
+                'post': self.get_post_css(),
+                'index': self.get_index_css()
+            }
+            self._stylesheets = {}
+            for kind, css in sources.items():
+                css = '@charset "UTF-8";\n' + css
+                self._stylesheets[kind] = (f"{kind}.{hash_text(css)[:10]}.css", css)
+        return self._stylesheets
+    
+    def get_style_classes(self):
+        """Return {inline style: class name} for the styles in the chrome of every page"""
+        if self._style_classes is None:
+            chrome = self.get_overview_html() + self.get_cta_html() + self.get_footer_html()
+            self._style_classes = {style: style_class_name(style) for style in inline_styles(chrome)}
+        return self._style_classes
+    
+    def get_hoisted_css(self):
+        """Return the class rules that replace the chrome's inline styles in minified pages"""
+        if not self.minify:
+            return ''
+        return '\n/* Inline styles hoisted by --minify */\n' + hoisted_css(self.get_style_classes())
+    
+    def minify_page(self, page_bytes):
+        """Return the minified page (as UTF-8 bytes)"""
+        return minify_html(page_bytes.decode('utf-8'), self.get_style_classes()).encode('utf-8')
+    
+    def stylesheet_tags(self, page_type):
+        """Return the <link>/<style> tags a 'post' or 'index' page needs in its head"""
+        stylesheets = self.get_stylesheets()
+        shared_href = f"{self.site_root}{stylesheets['styles'][0]}"
+        page_href = f"{self.site_root}{stylesheets[page_type][0]}"
+        
+        if not self.inline_critical:
+            return (f'<link rel="stylesheet" href="{shared_href}">\n'
+                    f'    <link rel="stylesheet" href="{page_href}">')
+        
+        # Inline the header/nav rules and load the shared sheet without blocking render
+        critical_css = ' '.join(self.get_critical_css().split())
+        return (f'<style>{critical_css}</style>\n'
+                f'    <link rel="stylesheet" href="{shared_href}" media="print" onload="this.media=\'all\'">\n'
+                f'    <noscript><link rel="stylesheet" href="{shared_href}"></noscript>\n'
+                f'    <link rel="stylesheet" href="{page_href}">')
+    
+    def write_stylesheets(self):
+        """Write the hashed stylesheets and matching cache headers to the output directory"""
+        stylesheets = self.get_stylesheets()
+        current = {filename for filename, _ in stylesheets.values()}
+        
+        for filename, css in stylesheets.values():
+            if self.changes.write(self.output_dir / filename, css.encode('utf-8')):
+                print(f"🎨 Wrote stylesheet: {filename}")
+        
+        # Remove stylesheets from previous builds
+        for css_file in self.output_dir.glob("*.css"):
+            if re.match(r'^(styles|post|index)\.[0-9a-f]{10}\.css$', css_file.name) and css_file.name not in current:
+                self.changes.remove(css_file)
+        
+        immutable = sorted(current)
+        if self.search:
+            filename, script = self.get_search_script()
+            if self.changes.write(self.output_dir / filename, script):
+                print(f"🔎 Wrote search script: {filename}")
+            immutable.append(filename)
+        for js_file in self.output_dir.glob("search.*.js"):
+            if js_file.name not in immutable:
+                self.changes.remove(js_file)
+        
+        self.write_headers_file(immutable)
+    
+    def get_search_script(self):
+        """Return (content-hashed filename, bytes) for search.js"""
+        if self._search_script is None:
+            script = Path(__file__).with_name("search.js").read_bytes()
+            self._search_script = (f"search.{hash_bytes(script)[:10]}.js", script)
+        return self._search_script
+    
+    def write_headers_file(self, immutable_files):
+        """Publish _headers with immutable caching rules for the hashed assets
+        
+        Netlify reads _headers from the publish directory, so the repo's
+        _headers is copied there with the generated rules appended.
+        """
+        headers_source = Path("_headers")
+        base = headers_source.read_text(encoding='utf-8').rstrip() + '\n' if headers_source.exists() else ''
+        lines = [base, '\n# Content-hashed assets (generated by blog_generator.py)\n']
+        for filename in immutable_files:
+            lines.append(f"/{filename}\n  Cache-Control: public, max-age=31536000, immutable\n")
+        if self.feed_size:
+            # Feed readers poll; make them revalidate (the bytes, and so the ETag, only change with the posts)
+            for _, name, mime_type in FEED_FILES:
+                lines.append(f"/{name}\n  Content-Type: {mime_type}; charset=utf-8\n  Cache-Control: no-cache\n")
+        if self.search:
+            # Shards are content-hashed; the index naming them must be revalidated
+            lines.append("/search/terms-*\n  Cache-Control: public, max-age=31536000, immutable\n"
+                         "/search/docs-*\n  Cache-Control: public, max-age=31536000, immutable\n"
+                         "/search/index.json\n  Cache-Control: no-cache\n")
+        headers = ''.join(lines)
+        
+        if self.changes.write(self.output_dir / "_headers", headers.encode('utf-8')):
+            print("📄 Updated _headers with stylesheet cache rules")
+    
+    def render_page(self, template_name, **values):
+        """Render the 'post' or 'index' page template to bytes
+        
+        Each template is compiled once per generator into pre-encoded chunks;
+        the time taken by the render is left in self.last_render_time.
+        """
+        template = self._compiled_templates.get(template_name)
+        if template is None:
+            source = self.get_html_template() if template_name == 'post' else self.get_index_template()
+            template = self._compiled_templates[template_name] = CompiledTemplate(source)
+        
+        started = time.perf_counter()
+        page = template.render(**values)
+        self.last_render_time = time.perf_counter() - started
+        return page
+    
+    def head_meta(self, description, hook, *args):
+        """Return the page's description tag plus any <head> markup from the output stages"""
+        parts = []
+        if not any(stage.replaces_description for stage in self.stages):
+            parts.append(f'<meta name="description" content="{description}">')
+        for stage in self.stages:
+            parts.append(getattr(stage, hook)(*args).strip())
+        parts.append(self.feed_links())
+        return '\n    '.join(part for part in parts if part)
+    
+    def feed_links(self):
+        """<link rel="alternate"> tags announcing the feeds, so readers and browsers can find them"""
+        if not self.feed_size:
+            return ''
+        return '\n    '.join(f'<link rel="alternate" type="{mime_type}" title="{FEED_TITLE}" '
+                              f'href="{self.site_root}{name}">' for _, name, mime_type in FEED_FILES)
+    
     def parse_frontmatter(self, content):
         """Parse YAML frontmatter from markdown content"""
         if content.startswith('---'):
@@ -819,7 +963,7 @@ class BlogGenerator:
         return {}, content
     
     def generate_post_html(self, post_data, content_html):
-        """Generate HTML for individual blog post"""
+        """Generate HTML (as UTF-8 bytes) for individual blog post"""
         read_time = max(1, len(content_html.split()) // 200)  # Estimate reading time
         
         post_content = f"""
@@ -837,17 +981,39 @@ class BlogGenerator:
                 </header>
                 
                 <div class="blog-content">
-                    <!-- QRTick Overview Section -->
+                    {self.get_overview_html()}
+                    
+                    {content_html}
+                    
+                    {self.get_cta_html()}
+                </div>
+            </article>
+        </main>
+        """
+        
+        footer_html = self.get_footer_html()
+        return self.render_page(
+            'post',
+            title=post_data.get('title', 'Untitled'),
+            stylesheets=self.stylesheet_tags('post'),
+            head_meta=self.head_meta(post_data.get('excerpt', 'QRTick Blog Post'), 'post_head', post_data),
+            content=post_content,
+            footer_html=footer_html
+        )
+    
+    def get_overview_html(self):
+        """The 'About QRTick' box shown above every post"""
+        return """<!-- QRTick Overview Section -->
                     <div class="qrtick-overview" style="background: #f8f9fa; padding: 1.5rem; border-radius: 8px; margin-bottom: 2rem; border-left: 4px solid #FDC230;">
                         <h3 style="margin-top: 0; color: #2D2D2D;">About QRTick</h3>
                         <p style="margin-bottom: 0; color: #666666; line-height: 1.6;">
                             Stop losing sleep over ticket sales and check-in chaos. QRTick handles the technical stuff so you can focus on what matters most - creating amazing experiences for your attendees.
                         </p>
-                    </div>
-                    
-                    {content_html}
-                    
-                    <!-- CTA Section -->
+                    </div>"""
+    
+    def get_cta_html(self):
+        """The call-to-action block shown below every post"""
+        return """<!-- CTA Section -->
                     <div class="blog-cta" style="background: linear-gradient(135deg, #2D2D2D 0%, #1A1A1A 100%); padding: 2rem; border-radius: 12px; margin-top: 3rem; text-align: center; color: white;">
                         <h3 style="margin-top: 0; color: white; font-size: 1.5rem;">Ready to get started?</h3>
                         <p style="margin-bottom: 1.5rem; color: #E0E0E0; font-size: 1.1rem;">
@@ -857,30 +1023,94 @@ class BlogGenerator:
                            style="display: inline-block; background: #FDC230; color: #2D2D2D; padding: 0.75rem 1.5rem; border-radius: 8px; text-decoration: none; font-weight: 600; font-size: 1.1rem; transition: all 0.3s ease;">
                             Create Your Event
                         </a>
-                    </div>
-                </div>
-            </article>
-        </main>
-        """
-        
-        footer_html = self.generate_footer_from_config()
-        return self.get_html_template().format(
-            title=post_data.get('title', 'Untitled'),
-            description=post_data.get('excerpt', 'QRTick Blog Post'),
-            content=post_content,
-            footer_html=footer_html
-        )
+                    </div>"""
     
-    def generate_index_html(self, posts):
-        """Generate HTML for blog index page"""
-        posts_html = ""
+    def generate_index_html(self, posts, older=None):
+        """Generate HTML (as UTF-8 bytes) for blog index page
         
+        older is the newest numbered archive page (relative to the blog root), if any.
+        """
         # Sort posts: pinned first, then featured, then by date
         sorted_posts = sorted(posts, key=lambda p: (
             not p['data'].get('pinned', False),
             not p['data'].get('featured', False),
             self.parse_date(p['data'].get('date')).timestamp()
         ), reverse=True)
+        posts_html = (self.search_html() + self.post_cards_html(sorted_posts, highlight_first=True)
+                      + self.pagination_html(None, older))
+        
+        footer_html = self.get_footer_html()
+        head_meta = self.head_meta("Making event management stress-free for organisers across Jamaica. "
+                                   "Tips, insights, and solutions for better events.", 'index_head', posts)
+        return self.render_page('index', posts=posts_html, footer_html=footer_html, page_title="The QR Code",
+                                stylesheets=self.stylesheet_tags('index'),
+                                head_meta=head_meta + self.pagination_links(None, older))
+    
+    def generate_listing_html(self, posts, title, heading, path, newer=None, older=None):
+        """Generate HTML (as UTF-8 bytes) for a listing page other than the index, newest post first
+        
+        path is the page's own path relative to the blog root; newer/older are
+        the neighbouring pages in the same sequence, if any.
+        """
+        sorted_posts = sorted(posts, key=lambda p: self.parse_date(p['data'].get('date')).timestamp(), reverse=True)
+        posts_html = (f'\n                <h2 class="listing-title">{heading}</h2>\n'
+                      + self.post_cards_html(sorted_posts) + self.pagination_html(newer, older))
+        
+        footer_html = self.get_footer_html()
+        head_meta = self.head_meta(f"{heading} on The QR Code, QRTick's blog about stress-free event management.",
+                                   'listing_head', posts, title, path)
+        return self.render_page('index', posts=posts_html, footer_html=footer_html,
+                                page_title=f"The QR Code - {title}", stylesheets=self.stylesheet_tags('index'),
+                                head_meta=head_meta + self.pagination_links(newer, older))
+    
+    def search_html(self):
+        """Search box and results list for the index (empty unless the search index is built)"""
+        if not self.search:
+            return ''
+        script_href = f"{self.site_root}{self.get_search_script()[0]}"
+        return f"""
+                <form class="search-form" role="search" data-search="{self.site_root}search/" data-root="{self.site_root}">
+                    <input type="search" name="q" placeholder="Search posts" aria-label="Search posts" autocomplete="off">
+                </form>
+                <div class="search-results" aria-live="polite" hidden></div>
+                <script src="{script_href}" defer></script>
+                """
+    
+    def listing_url(self, path):
+        """URL of a listing page given its path relative to the blog root"""
+        return self.site_root if path == "index.html" else f"{self.site_root}{path}"
+    
+    def pagination_links(self, newer, older):
+        """<link rel=prev/next> tags pointing at the neighbouring listing pages"""
+        links = ''
+        if newer:
+            links += f'\n    <link rel="prev" href="{self.listing_url(newer)}">'
+        if older:
+            links += f'\n    <link rel="next" href="{self.listing_url(older)}">'
+        return links
+    
+    def pagination_html(self, newer, older):
+        """Newer/older navigation shown below a listing"""
+        if not newer and not older:
+            return ''
+        links = []
+        if newer:
+            links.append(f'<a href="{self.listing_url(newer)}" rel="prev" class="pagination-newer">← Newer posts</a>')
+        if older:
+            links.append(f'<a href="{self.listing_url(older)}" rel="next" class="pagination-older">Older posts →</a>')
+        links_html = '\n                    '.join(links)
+        return f"""
+                <nav class="pagination">
+                    {links_html}
+                </nav>
+                """
+    
+    def post_cards_html(self, sorted_posts, highlight_first=False):
+        """Render a list of index records as post cards
+        
+        With highlight_first, a leading featured or pinned post gets the large featured card.
+        """
+        posts_html = ""
         
         for i, post in enumerate(sorted_posts):
             post_data = post['data']
@@ -888,19 +1118,25 @@ class BlogGenerator:
             
             if post_data.get('tags'):
                 tags_html = '<div class="tags">' + ''.join([
-                    f'<span class="tag">#{tag}</span>' for tag in post_data['tags'][:4]
+                    f'<a href="{self.listing_url(self.tag_page_path(tag))}" class="tag">#{tag}</a>'
+                    if self.tag_slug(tag) else f'<span class="tag">#{tag}</span>'
+                    for tag in post_data['tags'][:4]
                 ]) + '</div>'
             
-            read_time = max(1, len(post['content'].split()) // 200)
+            read_time = max(1, post['word_count'] // 200)
+            date_html = post_data.get('date', 'Unknown Date')
+            month = self.month_key(post)
+            if month:
+                date_html = f'<a href="{self.listing_url(self.month_page_path(month))}">{date_html}</a>'
             
             # Featured post gets special treatment
-            if i == 0 and (post_data.get('featured') or post_data.get('pinned')):
+            if highlight_first and i == 0 and (post_data.get('featured') or post_data.get('pinned')):
                 posts_html += f"""
                 <article class="featured-post">
                     {'<div class="featured-badge">Featured</div>' if post_data.get('featured') else ''}
                     <h2><a href="/blog/{post_data.get('slug', 'untitled')}.html">{post_data.get('title', 'Untitled')}</a></h2>
                     <div class="blog-meta">
-                        <span>📅 {post_data.get('date', 'Unknown Date')}</span>
+                        <span>📅 {date_html}</span>
                         <span>👤 {post_data.get('author', 'QRTick Team')}</span>
                         <span>⏱️ {read_time} min read</span>
                     </div>
@@ -914,7 +1150,7 @@ class BlogGenerator:
                 <article class="blog-post">
                     <h2><a href="/blog/{post_data.get('slug', 'untitled')}.html">{post_data.get('title', 'Untitled')}</a></h2>
                     <div class="blog-meta">
-                        <span>📅 {post_data.get('date', 'Unknown Date')}</span>
+                        <span>📅 {date_html}</span>
                         <span>👤 {post_data.get('author', 'QRTick Team')}</span>
                         <span>⏱️ {read_time} min read</span>
                     </div>
@@ -923,25 +1159,34 @@ class BlogGenerator:
                     {tags_html}
                 </article>
                 """
-        
-        footer_html = self.generate_footer_from_config()
-        return self.get_index_template().format(posts=posts_html, footer_html=footer_html)
+        return posts_html
     
-    def copy_images(self):
-        """Copy images directory to output directory"""
+    def copy_images(self, jobs=1):
+        """Sync images directory (plus responsive variants) to output directory, copying only what changed"""
         images_source = Path("images")
         images_dest = self.output_dir / "images"
         
         if images_source.exists():
-            # Remove existing images directory if it exists
-            if images_dest.exists():
-                shutil.rmtree(images_dest)
+            if not self.image_pipeline.enabled:
+                print("⚠️  Pillow not installed - publishing images without responsive variants")
+            
+            # Resize new/changed images, then keep their variants out of the orphan cleanup
+            self.image_pipeline.build(jobs=jobs)
+            variants = {images_dest / name for name in self.image_pipeline.published_variants()}
+            
+            def keep(path):
+                # Precompressed siblings belong to precompress_outputs(), which drops orphaned ones itself
+                return path in variants or (path.suffix in PRECOMPRESSED_SUFFIXES
+                                            and path.with_suffix('').exists())
             
-            # Copy entire images directory
-            shutil.copytree(images_source, images_dest)
-            print("🖼️  Copied images directory to output")
+            result = sync_tree(images_source, images_dest, link=self.link_assets, keep=keep)
+            result.merge(self.image_pipeline.publish(images_dest, link=self.link_assets))
+            self.changes.record_sync(result, images_dest)
+            print(f"🖼️  Synced images directory to output: {result.summary()}")
+            return result
         else:
             print("⚠️  No images directory found")
+            return None
     
     def copy_favicon(self):
         """Copy favicon from main project to blog output"""
@@ -954,29 +1199,57 @@ class BlogGenerator:
         
         for favicon_path in favicon_paths:
             if favicon_path.exists():
-                favicon_dest = self.output_dir / "favicon.png"
-                shutil.copy2(favicon_path, favicon_dest)
-                print(f"📄 Copied favicon from {favicon_path}")
+                copied = self.sync_asset(favicon_path, self.output_dir / "favicon.png")
+                if copied is not None:
+                    print(f"📄 Copied favicon from {favicon_path} ({copied / 1024:.1f} KB)")
                 return
         
         print("⚠️  No favicon found to copy")
     
     def load_footer_config(self):
         """Load shared footer configuration from JSON file"""
-        config_path = Path("../shared_footer_config.json")
+        config_path = self.footer_config_path
         if config_path.exists():
             with open(config_path, 'r') as f:
                 return json.load(f)
         return None
     
-    def generate_footer_from_config(self):
+    def prepare_footer(self):
+        """Render the footer once per build, reusing it while the config is unchanged
+        
+        Returns (footer_hash, footer_html). The hash is of the raw config file
+        ('default' when there is none), so the manifest and the render workers
+        can share the same precomputed fragment.
+        """
+        try:
+            config_bytes = self.footer_config_path.read_bytes()
+        except FileNotFoundError:
+            config_bytes = None
+        footer_hash = hash_bytes(config_bytes) if config_bytes is not None else 'default'
+        
+        if self._footer is None or self._footer[0] != footer_hash:
+            config = json.loads(config_bytes) if config_bytes is not None else None
+            self._footer = (footer_hash, self.generate_footer_from_config(config))
+            # Minified pages hoist the footer's inline styles into the shared stylesheet
+            self._style_classes = None
+            self._stylesheets = None
+        return self._footer
+    
+    def get_footer_html(self):
+        """Return the footer fragment for the current build"""
+        if self._footer is None:
+            self.prepare_footer()
+        return self._footer[1]
+    
+    def generate_footer_from_config(self, config=None):
         """Generate footer HTML from shared configuration"""
-        config = self.load_footer_config()
+        if config is None:
+            config = self.load_footer_config()
         if not config:
             return self.get_default_footer()
         
         # Build footer HTML from config
-        footer_html = f"""
+        parts = [f"""
         <footer class="footer" style="background: {config['styles']['background']}; color: {config['styles']['color']}; padding: {config['styles']['padding']}; margin-top: {config['styles']['margin_top']}; border-top: {config['styles']['border_top']}; text-align: center;">
             <div class="footer-content" style="max-width: 800px; margin: 0 auto; padding: 0 2rem;">
                 <img src="{config['logo']['url']}" alt="{config['logo']['alt']}" style="height: {config['logo']['height']}; margin-bottom: 1rem;">
@@ -984,23 +1257,23 @@ class BlogGenerator:
                     {config['tagline']}
                 </p>
                 <div class="footer-links" style="display: flex; justify-content: center; gap: 2rem; margin-bottom: 1rem;">
-        """
+        """]
         
         # Add links
         for link in config['links']:
             external_attrs = 'target="_blank" rel="noopener noreferrer"' if link['external'] else ''
-            footer_html += f'<a href="{link["url"]}" {external_attrs} style="color: #666666; text-decoration: none; font-size: 0.9rem; transition: color 0.2s;">{link["text"]}</a>'
+            parts.append(f'<a href="{link["url"]}" {external_attrs} style="color: #666666; text-decoration: none; font-size: 0.9rem; transition: color 0.2s;">{link["text"]}</a>')
         
-        footer_html += f"""
+        parts.append(f"""
                 </div>
                 <p style="color: #666666; font-size: 0.9rem;">
                     {config['copyright']}
                 </p>
             </div>
         </footer>
-        """
+        """)
         
-        return footer_html
+        return ''.join(parts)
     
     def get_default_footer(self):
         """Fallback to default footer if config not available"""
@@ -1023,88 +1296,841 @@ class BlogGenerator:
         </footer>
         """
     
-    def generate_blog(self):
-        """Main function to generate the entire blog"""
-        print("🚀 Generating QRTick Blog...")
+    def compute_template_hash(self):
+        """Hash everything besides the post itself that shapes a rendered page"""
+        return hash_text('\n'.join([
+            self.get_html_template(),
+            self.get_index_template(),
+            Path(__file__).read_text(encoding='utf-8'),
+            markdown.__version__,
+            json.dumps(MARKDOWN_EXTENSIONS),
+            f"inline_critical={self.inline_critical}",
+            f"minify={self.minify}",
+            f"search={self.get_search_script()[0] if self.search else None}",
+            f"feeds={bool(self.feed_size)}",
+            f"responsive_images={self.image_pipeline.enabled}:{self.image_pipeline.widths}",
+            *(stage.fingerprint() for stage in self.stages),
+        ]))
+    
+    def build_post(self, md_file, source_bytes, date_modified=None):
+        """Render one markdown source, returning its index record and page HTML
+        
+        date_modified is the source's content-derived last-modified date (see
+        source_dates.py), passed to the output stages as post_data['date_modified'].
+        """
+        timings = {}
+        
+        with timed(timings, 'frontmatter'):
+            # Decode the way text-mode open() would, normalising newlines
+            content = source_bytes.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+            
+            # Parse frontmatter and content
+            frontmatter, markdown_content = self.parse_frontmatter(content)
+            # Round-trip through JSON so fresh and manifest-cached metadata look identical
+            frontmatter = json.loads(json.dumps(frontmatter, default=str))
+        
+        with timed(timings, 'markdown'):
+            # Convert markdown to HTML (the renderer resets its processor before each
+            # conversion so footnote/toc/abbr state can't leak between posts)
+            content_html = self.renderer.render(markdown_content, MARKDOWN_EXTENSIONS)['html']
+        
+        with timed(timings, 'images'):
+            # Fix image paths - ensure they work with Flask routes
+            content_html = content_html.replace('src="./images/', 'src="/blog/images/')
+            
+            # Point images at their responsive variants and lazy-load them
+            content_html, images = self.image_pipeline.rewrite_images(content_html, f"{self.site_root}images/")
+        
+        # Generate slug if not provided
+        slug = frontmatter.get('slug') or re.sub(r'[^a-zA-Z0-9\-_]', '-', frontmatter.get('title', md_file.stem).lower()).strip('-')
+        frontmatter['slug'] = slug
+        
+        # Generate individual post HTML
+        with timed(timings, 'template'):
+            page_data = dict(frontmatter, date_modified=date_modified) if date_modified else frontmatter
+            post_html = self.generate_post_html(page_data, content_html)
+        info = {
+            'timings': timings,
+            'image_deps': self.image_pipeline.dependencies(images)
+        }
+        
+        if self.search:
+            # Tokenized here, once per render, so unchanged posts are never re-read
+            with timed(timings, 'search'):
+                info['search'] = document_terms(frontmatter, content_html)
+        
+        if self.feed_size:
+            # The bare body, before the template, goes into the feeds
+            info['content'] = content_html
+        
+        if self.minify:
+            with timed(timings, 'minify'):
+                minified = self.minify_page(post_html)
+            info['minified'] = (len(post_html), len(minified))
+            post_html = minified
         
-        # Ensure logo is copied to output directory
+        record = {
+            'data': frontmatter,
+            'word_count': len(markdown_content.split())
+        }
+        return record, post_html, info
+    
+    def generator_options(self):
+        """Constructor arguments that recreate this generator (e.g. in a worker)"""
+        return {
+            'blog_dir': str(self.blog_dir),
+            'output_dir': str(self.output_dir),
+            'cache_dir': str(self.cache_dir),
+            'use_cache': self.render_cache.enabled,
+            'inline_critical': self.inline_critical,
+            'link_assets': self.link_assets,
+            'stages': self.stage_names,
+            'precompress': self.precompress,
+            'minify': self.minify,
+            'per_page': self.per_page,
+            'search': self.search,
+            'feed_size': self.feed_size
+        }
+    
+    def render_posts(self, sources, jobs=1):
+        """Render (md_file, source_bytes, date_modified) tuples, returning results in input order
+        
+        Each result is a (record, page_bytes, info) tuple, or the exception raised
+        while rendering that post. With jobs > 1 the posts are spread over a
+        process pool in which every worker has its own renderer.
+        """
+        if not sources:
+            return []
+        if jobs <= 1 or len(sources) <= 1:
+            results = []
+            for md_file, source_bytes, date_modified in sources:
+                try:
+                    results.append(self.build_post(md_file, source_bytes, date_modified))
+                except Exception as e:
+                    results.append(e)
+            return results
+        
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=min(jobs, len(sources)),
+                                 initializer=_init_render_worker,
+                                 initargs=(self.generator_options(), self._footer,
+                                           self.image_pipeline.images,
+                                           tracemalloc.is_tracing())) as pool:
+            futures = [pool.submit(_render_post_in_worker, str(md_file), source_bytes, date_modified)
+                       for md_file, source_bytes, date_modified in sources]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append(e)
+            return results
+    
+    def copy_logo(self):
+        """Ensure logo is copied to output directory"""
         logo_source = Path("qrtick-logo-alt.svg")
         logo_dest = self.output_dir / "qrtick-logo-alt.svg"
         if logo_source.exists():
-            shutil.copy2(logo_source, logo_dest)
-            print("📄 Copied logo to output directory")
+            copied = self.sync_asset(logo_source, logo_dest)
+            if copied is not None:
+                print(f"📄 Copied logo to output directory ({copied / 1024:.1f} KB)")
+    
+    def sync_asset(self, source, dest):
+        """sync_file() a single asset into the output, recording the change"""
+        existed = dest.exists()
+        copied = sync_file(source, dest, link=self.link_assets)
+        if copied is not None:
+            self.changes.record(dest, existed)
+        return copied
+    
+    def copy_assets(self, jobs=1):
+        """Copy the logo, images and favicon into the output directory"""
+        self.copy_logo()
+        self.copy_images(jobs=jobs)
+        self.copy_favicon()
+    
+    def build_pages(self, force=False, jobs=1):
+        """Render post pages and the index, reusing anything still up to date
         
-        # Copy images directory
-        self.copy_images()
+        Posts whose source, templates and footer config are unchanged since the
+        last build (per the build manifest) are reused instead of re-rendered.
+        Pass force=True to ignore the manifest and rebuild every page, and
+        jobs > 1 to render changed posts in that many worker processes.
+        """
+        report = self.report
+        
+        with report.phase('scan'):
+            self.manifest.load()
+            if not self.image_pipeline.images:
+                self.image_pipeline.load()
+            # The footer goes first: minified pages hoist its styles into the stylesheets
+            footer_hash, _ = self.prepare_footer()
+            self.write_stylesheets()
+            template_hash = self.compute_template_hash()
+            previous_posts = self.manifest.posts
+            current_posts = {}
+            
+            # Work out which markdown files actually need rendering
+            posts, pending, reused = self.scan_posts(force, previous_posts, current_posts,
+                                                     template_hash, footer_hash)
         
-        # Copy favicon
-        self.copy_favicon()
+        # Render the changed posts, fanning out to worker processes if asked to
+        with report.phase('render'):
+            results = self.render_posts([(item[1], item[5], item[6]) for item in pending], jobs)
         
-        # Process all markdown files
-        posts = []
-        markdown_processor = markdown.Markdown(extensions=[
-            'markdown.extensions.extra',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code'
-        ])
-        
-        for md_file in self.blog_dir.glob("*.md"):
+        rendered = 0
+        minified = [0, 0]
+        for (slot, md_file, entry, signature, source_hash, _, date_modified), result in zip(pending, results):
             print(f"📝 Processing: {md_file.name}")
             
             try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                if isinstance(result, Exception):
+                    raise result
+                record, output_bytes, info = result
                 
-                # Parse frontmatter and content
-                frontmatter, markdown_content = self.parse_frontmatter(content)
+                # Write post file
+                post_file = self.output_dir / f"{record['data']['slug']}.html"
+                with timed(info['timings'], 'write'):
+                    written = self.changes.write(post_file, output_bytes)
+                report.add_post(md_file.name, info['timings'])
                 
-                # Convert markdown to HTML
-                content_html = markdown_processor.convert(markdown_content)
+                current_posts[md_file.name] = {
+                    'source_hash': source_hash,
+                    'source_signature': signature,
+                    'frontmatter_hash': hash_json(record['data']),
+                    'template_hash': template_hash,
+                    'footer_hash': footer_hash,
+                    'frontmatter': record['data'],
+                    'word_count': record['word_count'],
+                    'image_deps': info['image_deps'],
+                    'date_modified': date_modified,
+                    'output': post_file.name,
+                    'output_hash': hash_bytes(output_bytes),
+                    'output_signature': file_signature(post_file),
+                    'content_hash': self.content_store.put(info['content']) if 'content' in info else None
+                }
                 
-                # Fix image paths - ensure they work with Flask routes
-                content_html = content_html.replace('src="./images/', 'src="/blog/images/')
+                # Store post data for index generation
+                posts[slot] = record
+                if 'search' in info:
+                    self.search_index.update(md_file.name, source_hash, record['data'], *info['search'])
+                rendered += 1
                 
-                # Generate slug if not provided
-                slug = frontmatter.get('slug') or re.sub(r'[^a-zA-Z0-9\-_]', '-', frontmatter.get('title', md_file.stem).lower()).strip('-')
-                frontmatter['slug'] = slug
+                print(f"✅ Generated: {post_file.name}" if written else f"✅ Unchanged: {post_file.name}")
+                if 'minified' in info:
+                    print(f"   🧹 {minify_summary(*info['minified'])}")
+                    minified[0] += info['minified'][0]
+                    minified[1] += info['minified'][1]
                 
-                # Generate individual post HTML
-                post_html = self.generate_post_html(frontmatter, content_html)
+            except Exception as e:
+                print(f"❌ Error processing {md_file.name}: {e}")
+                if entry:
+                    # Keep the old page around, but force a re-render next time
+                    current_posts[md_file.name] = dict(entry, source_hash=None, source_signature=None)
+        
+        posts = [post for post in posts if post is not None]
+        
+        with report.phase('index'):
+            current_pages = {}
+            self.build_index(posts, force, template_hash, footer_hash, current_pages)
+            self.build_taxonomy_pages(posts, force, template_hash, footer_hash, current_pages)
+        
+        if self.search:
+            with report.phase('search'):
+                self.write_search_index(current_posts)
+        else:
+            self.remove_search_index()
+        
+        if self.feed_size:
+            with report.phase('feeds'):
+                self.write_feeds(previous_posts, current_posts, force, current_pages)
+        
+        with report.phase('manifest'):
+            # Listing pages and feeds this build no longer has
+            self.remove_stale_pages(current_pages)
+
+            # Remove pages whose source was deleted or whose slug changed
+            live_outputs = {entry['output'] for entry in current_posts.values()}
+            for entry in previous_posts.values():
+                stale_file = self.output_dir / entry['output']
+                if entry['output'] not in live_outputs and stale_file.exists():
+                    self.changes.remove(stale_file)
+                    print(f"🗑️  Removed stale page: {entry['output']}")
+            
+            self.manifest.data['posts'] = current_posts
+            self.manifest.data['pages'] = current_pages
+            # Lets serve.py --watch rebuild with the same flags as the last build
+            self.manifest.data['options'] = self.generator_options()
+            self.manifest.save()
+            self.render_cache.evict()
+        
+        report.counts.update(rendered=rendered, reused=reused)
+        print(f"♻️  Rendered {rendered} posts, reused {reused} unchanged")
+        if rendered and self.minify:
+            print(f"🧹 Minified {rendered} posts: {minify_summary(*minified)}")
+    
+    def scan_posts(self, force, previous_posts, current_posts, template_hash, footer_hash):
+        """Split the markdown sources into reusable and pending posts
+        
+        Unchanged posts are copied into current_posts and the posts list; every
+        other post gets a None placeholder in posts and an entry in pending.
+        Returns (posts, pending, reused count).
+        """
+        posts = []
+        pending = []
+        reused = 0
+        md_files = sorted(self.blog_dir.glob("*.md"))
+        # Only the output stages print dates, so plain builds skip the git lookup
+        dates = modified_dates(self.blog_dir, [md_file.name for md_file in md_files]) if self.stages else {}
+        
+        for md_file in md_files:
+            entry = previous_posts.get(md_file.name)
+            date_modified = dates.get(md_file.name)
+            
+            try:
+                signature = file_signature(md_file)
+                source_bytes = None
+                if entry and entry['source_signature'] == signature:
+                    source_hash = entry['source_hash']
+                else:
+                    source_bytes = md_file.read_bytes()
+                    source_hash = hash_bytes(source_bytes)
                 
-                # Write post file
-                post_file = self.output_dir / f"{slug}.html"
-                with open(post_file, 'w', encoding='utf-8') as f:
-                    f.write(post_html)
+                if (not force and entry
+                        and entry['source_hash'] == source_hash
+                        and entry['template_hash'] == template_hash
+                        and entry['footer_hash'] == footer_hash
+                        and entry.get('date_modified') == date_modified
+                        and entry.get('image_deps', {}) == self.image_pipeline.dependencies(entry.get('image_deps', {}))
+                        and (not self.search or self.search_index.is_current(md_file.name, source_hash))
+                        and (not self.feed_size or self.content_store.has(entry.get('content_hash')))
+                        and self.manifest.output_is_current(self.output_dir / entry['output'],
+                                                            entry['output_hash'],
+                                                            entry['output_signature'])):
+                    entry['source_signature'] = signature
+                    current_posts[md_file.name] = entry
+                    posts.append({'data': entry['frontmatter'], 'word_count': entry['word_count']})
+                    reused += 1
+                    continue
                 
-                # Store post data for index generation
-                posts.append({
-                    'data': frontmatter,
-                    'content': markdown_content
-                })
+                if source_bytes is None:
+                    source_bytes = md_file.read_bytes()
+                    source_hash = hash_bytes(source_bytes)
                 
-                print(f"✅ Generated: {slug}.html")
+                # Keep a slot in the posts list so index order matches the serial path
+                posts.append(None)
+                pending.append((len(posts) - 1, md_file, entry, signature, source_hash, source_bytes, date_modified))
                 
             except Exception as e:
                 print(f"❌ Error processing {md_file.name}: {e}")
+                if entry:
+                    current_posts[md_file.name] = dict(entry, source_hash=None, source_signature=None)
         
-        # Generate index page
-        if posts:
-            index_html = self.generate_index_html(posts)
-            index_file = self.output_dir / "index.html"
-            with open(index_file, 'w', encoding='utf-8') as f:
-                f.write(index_html)
-            print(f"🏠 Generated blog index with {len(posts)} posts")
-        else:
+        return posts, pending, reused
+    
+    def paginate(self, posts):
+        """Split posts into (index posts, [(page number, posts)]) with stable page boundaries
+        
+        Numbered pages are cut from the oldest post forwards, per_page posts
+        each, so publishing a post never moves an archived post to another
+        page. The index keeps the newest per_page to 2*per_page-1 posts; when
+        it would reach 2*per_page, its oldest per_page posts become the next
+        numbered page. Archived posts that are pinned stay on the index too,
+        up to per_page of them (the newest), so the index stays under three
+        pages' worth however many posts are pinned; featured posts stay on
+        their archive pages.
+        """
+        if not self.per_page or len(posts) < 2 * self.per_page:
+            return posts, []
+        chronological = sorted(posts, key=lambda p: (self.parse_date(p['data'].get('date')).timestamp(),
+                                                     p['data'].get('slug', '')))
+        archived = (len(posts) // self.per_page - 1) * self.per_page
+        pages = [(number, chronological[start:start + self.per_page])
+                 for number, start in enumerate(range(0, archived, self.per_page), start=1)]
+        pinned = [post for post in chronological[:archived] if post['data'].get('pinned')]
+        return pinned[-self.per_page:] + chronological[archived:], pages
+    
+    def archive_page_path(self, number):
+        return f"page/{number}.html"
+    
+    def write_listing(self, path, state, render, force, current_pages):
+        """Write a listing page unless everything it shows is unchanged; True if written
+        
+        state is a JSON-able description of the page's contents (its posts,
+        neighbours, templates...) and render() returns the page bytes. The
+        page's manifest entry goes into current_pages under path.
+        """
+        output_file = self.output_dir / path
+        digest = hash_json(state)
+        previous = self.manifest.pages.get(path, {})
+        if (not force
+                and previous.get('digest') == digest
+                and self.manifest.output_is_current(output_file, previous.get('output_hash'),
+                                                    previous.get('output_signature'))):
+            current_pages[path] = previous
+            return False
+        
+        page_bytes = render()
+        if self.minify:
+            original_size = len(page_bytes)
+            page_bytes = self.minify_page(page_bytes)
+            print(f"🧹 {path}: {minify_summary(original_size, len(page_bytes))}")
+        self.changes.write(output_file, page_bytes)
+        current_pages[path] = {
+            'digest': digest,
+            'output_hash': hash_bytes(page_bytes),
+            'output_signature': file_signature(output_file)
+        }
+        return True
+    
+    def build_index(self, posts, force, template_hash, footer_hash, current_pages):
+        """Write the index and numbered archive pages whose listings or templates changed"""
+        if not posts:
             print("⚠️ No posts found to generate index")
+            current_pages.update(self.manifest.pages)
+            return
+        
+        index_posts, archive = self.paginate(posts)
+        templates = {'template_hash': template_hash, 'footer_hash': footer_hash}
+        older = self.archive_page_path(len(archive)) if archive else None
+        if self.write_listing("index.html", dict(templates, posts=index_posts, older=older),
+                              lambda: self.generate_index_html(index_posts, older=older),
+                              force, current_pages):
+            print(f"🏠 Generated blog index with {len(index_posts)} posts")
+        else:
+            print("🏠 Blog index unchanged")
+        
+        written = 0
+        for number, page_posts in archive:
+            path = self.archive_page_path(number)
+            newer = self.archive_page_path(number + 1) if number < len(archive) else "index.html"
+            older = self.archive_page_path(number - 1) if number > 1 else None
+            first, last = page_posts[0]['data'].get('date'), page_posts[-1]['data'].get('date')
+            heading = f"Posts from {first} to {last}" if first != last else f"Posts from {first}"
+            state = dict(templates, posts=page_posts, path=path, newer=newer, older=older)
+            render = functools.partial(self.generate_listing_html, page_posts, f"Archive page {number}",
+                                       heading, path, newer, older)
+            written += self.write_listing(path, state, render, force, current_pages)
+        if archive:
+            print(f"📚 Archive pages: {written} written, {len(archive) - written} unchanged "
+                  f"({self.per_page} posts per page)")
+    
+    def tag_slug(self, tag):
+        """URL-safe form of a tag, made the same way as post slugs"""
+        return re.sub(r'[^a-zA-Z0-9\-_]', '-', str(tag).lower()).strip('-')
+    
+    def tag_page_path(self, tag):
+        return f"tag/{self.tag_slug(tag)}.html"
+    
+    def month_key(self, post):
+        """(year, month) of a post's date, or None if it has no date"""
+        date = self.parse_date(post['data'].get('date'))
+        return None if date == datetime.min else (date.year, date.month)
+    
+    def month_page_path(self, month):
+        return f"archive/{month[0]:04d}-{month[1]:02d}.html"
+    
+    def build_taxonomy(self, posts):
+        """Invert posts into ({tag slug: (tag, [posts])}, {(year, month): [posts]}) in one pass
         
+        Tags that slug the same ("event management", "event-management") share
+        a page, named after the first spelling seen. Posts keep their order
+        within each list, so unchanged sets compare (and hash) equal.
+        """
+        tags = {}
+        months = {}
+        for post in posts:
+            seen = set()
+            for tag in post['data'].get('tags') or []:
+                slug = self.tag_slug(tag)
+                if slug and slug not in seen:
+                    seen.add(slug)
+                    tags.setdefault(slug, (str(tag), []))[1].append(post)
+            month = self.month_key(post)
+            if month:
+                months.setdefault(month, []).append(post)
+        return tags, months
+    
+    def build_taxonomy_pages(self, posts, force, template_hash, footer_hash, current_pages):
+        """Write the tag and monthly archive pages whose posts or templates changed"""
+        if not posts:
+            return
+        tags, months = self.build_taxonomy(posts)
+        templates = {'template_hash': template_hash, 'footer_hash': footer_hash}
+        
+        written = 0
+        for slug, (tag, tag_posts) in sorted(tags.items()):
+            path = self.tag_page_path(slug)
+            render = functools.partial(self.generate_listing_html, tag_posts, f"#{tag}",
+                                       f"Posts tagged #{tag}", path)
+            written += self.write_listing(path, dict(templates, posts=tag_posts, path=path, tag=tag),
+                                          render, force, current_pages)
+        if tags:
+            print(f"🏷️  Tag pages: {written} written, {len(tags) - written} unchanged")
+        
+        written = 0
+        ordered = sorted(months)
+        for i, month in enumerate(ordered):
+            path = self.month_page_path(month)
+            newer = self.month_page_path(ordered[i + 1]) if i + 1 < len(ordered) else None
+            older = self.month_page_path(ordered[i - 1]) if i > 0 else None
+            title = datetime(month[0], month[1], 1).strftime("%B %Y")
+            month_posts = months[month]
+            render = functools.partial(self.generate_listing_html, month_posts, title,
+                                       f"Posts from {title}", path, newer, older)
+            written += self.write_listing(path, dict(templates, posts=month_posts, path=path,
+                                                     newer=newer, older=older),
+                                          render, force, current_pages)
+        if months:
+            print(f"🗓️  Monthly archives: {written} written, {len(months) - written} unchanged")
+    
+    def remove_stale_pages(self, current_pages):
+        """Delete listing pages written by the last build that this build no longer has"""
+        for path in sorted(set(self.manifest.pages) - set(current_pages)):
+            stale_file = self.output_dir / path
+            if stale_file.exists():
+                self.changes.remove(stale_file)
+                print(f"🗑️  Removed stale page: {path}")
+    
+    def write_search_index(self, current_posts):
+        """Rewrite the search index shards from the cached terms of the current posts"""
+        self.search_index.retain(current_posts)
+        written, removed = self.search_index.write(self.output_dir / "search", self.changes)
+        if written or removed:
+            print(f"🔎 Search index: {written} files written, {removed} removed "
+                  f"({len(self.search_index.data['posts'])} posts)")
+        else:
+            print("🔎 Search index unchanged")
+    
+    def remove_search_index(self):
+        """Delete the search index left by an earlier build with search enabled"""
+        stale = sorted((self.output_dir / "search").glob("*.json"))
+        for path in stale:
+            self.changes.remove(path)
+        if stale:
+            print(f"🗑️  Removed search index ({len(stale)} files)")
+    
+    def write_feeds(self, previous_posts, current_posts, force, current_pages):
+        """Write the RSS, Atom and JSON feeds of the feed_size newest posts, unless those posts are unchanged
+        
+        The feeds' manifest entry digests the chosen posts' frontmatter and
+        body hashes (plus feeds.py itself), so editing an older post or any
+        template leaves them alone.
+        """
+        dates = {}
+        
+        def post_date(entry):
+            # Many posts share a date string; parse each one once
+            date = entry['frontmatter'].get('date')
+            if date not in dates:
+                dates[date] = self.parse_date(date)
+            return dates[date]
+        
+        # Same-day posts are ordered by slug, so the order never depends on file order
+        newest = heapq.nlargest(self.feed_size, (entry for entry in current_posts.values()
+                                                 if entry.get('content_hash')),
+                                key=lambda entry: (post_date(entry), entry['frontmatter'].get('slug', '')))
+        state = {
+            'feeds': hash_file(Path(__file__).with_name("feeds.py")),
+            'site': SITE_URL + self.site_root,
+            'posts': [[entry['frontmatter'], entry['content_hash']] for entry in newest]
+        }
+        digest = hash_json(state)
+        feed = Feed([FeedEntry(entry['frontmatter'], None if post_date(entry) == datetime.min else post_date(entry),
+                               entry['content_hash'], self.content_store, SITE_URL, self.site_root)
+                     for entry in newest], SITE_URL, self.site_root)
+        
+        written = 0
+        for kind, path, _ in FEED_FILES:
+            output_file = self.output_dir / path
+            previous = self.manifest.pages.get(path, {})
+            if (not force
+                    and previous.get('digest') == digest
+                    and self.manifest.output_is_current(output_file, previous.get('output_hash'),
+                                                        previous.get('output_signature'))):
+                current_pages[path] = previous
+                continue
+            changed, output_hash = self.changes.write_stream(output_file, feed.chunks(kind))
+            written += changed
+            current_pages[path] = {
+                'digest': digest,
+                'output_hash': output_hash,
+                'output_signature': file_signature(output_file)
+            }
+        if written:
+            print(f"📡 Feeds: {written} written ({len(newest)} newest posts in RSS, Atom and JSON Feed)")
+        else:
+            print("📡 Feeds unchanged")
+        
+        # Bodies only a deleted or re-rendered post pointed at
+        self.content_store.discard({entry.get('content_hash') for entry in previous_posts.values()}
+                                   - {entry.get('content_hash') for entry in current_posts.values()})
+    
+    def precompress_outputs(self, jobs=1):
+        """Write Brotli/gzip siblings for text outputs that changed since they were last compressed"""
+        compressed, removed = precompress_tree(self.output_dir, jobs=jobs,
+                                               state_path=self.cache_dir / "precompress-state.json")
+        for relative in removed:
+            self.changes.deleted.add(relative)
+        
+        original_bytes = 0
+        totals = {}
+        for relative, (size, siblings) in compressed.items():
+            original_bytes += size
+            for suffix, (compressed_size, existed, written) in siblings.items():
+                sibling = self.output_dir / (relative + suffix)
+                if compressed_size is None:
+                    if existed:
+                        self.changes.deleted.add(sibling.relative_to(self.output_dir).as_posix())
+                    continue
+                if written:
+                    self.changes.record(sibling, existed)
+                totals[suffix] = totals.get(suffix, 0) + compressed_size
+        
+        if compressed:
+            sizes = ', '.join(f"{suffix[1:]} {total / 1024:.1f} KB" for suffix, total in totals.items())
+            print(f"🗜️  Precompressed {len(compressed)} file(s): {original_bytes / 1024:.1f} KB -> {sizes}")
+        if brotli is None:
+            print("⚠️  Brotli not installed - wrote gzip siblings only")
+    
+    def generate_blog(self, force=False, jobs=1):
+        """Main function to generate the entire blog"""
+        print("🚀 Generating QRTick Blog...")
+        
+        self.report = BuildReport(jobs=jobs)
+        self.changes = OutputChanges(self.output_dir)
+        with self.report.phase('assets'):
+            self.copy_assets(jobs=jobs)
+        self.build_pages(force=force, jobs=jobs)
+        if self.precompress:
+            with self.report.phase('precompress'):
+                self.precompress_outputs(jobs=jobs)
+        
+        previous = self.report.finish().save(self.report_path)
+        for line in self.report.summary(previous):
+            print(line)
+        self.changes.save(self.cache_dir)
+        print(f"📦 Output changes: {self.changes.summary()} (see {self.cache_dir / 'changed-files.txt'})")
         print(f"🎉 Blog generation complete! View at {self.output_dir}/index.html")
+    
+    def watch_signatures(self):
+        """Return a {path: signature} snapshot of the posts, the logo and the footer config
+        
+        The posts are read with a single os.scandir pass, cheap enough to repeat
+        every few milliseconds.
+        """
+        signatures = {}
+        try:
+            entries = os.scandir(self.blog_dir)
+        except FileNotFoundError:
+            entries = None
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    if entry.name.endswith('.md') and entry.is_file():
+                        stat = entry.stat()
+                        signatures[str(self.blog_dir / entry.name)] = [stat.st_size, stat.st_mtime_ns]
+        for path in (Path("qrtick-logo-alt.svg"), self.footer_config_path):
+            signatures[str(path)] = file_signature(path)
+        return signatures
+    
+    def image_signatures(self):
+        """Return a {path: signature} snapshot of everything under images/"""
+        images_source = Path("images")
+        if not images_source.exists():
+            return {}
+        return {str(path): file_signature(path) for path in images_source.rglob("*") if path.is_file()}
+    
+    def rebuild_for_changes(self, changed_paths):
+        """Rebuild only the outputs affected by the given changed input paths
+        
+        Post edits re-render that post (and the index if its listing changed),
+        footer config edits re-render every page, image edits re-sync images
+        (and re-render posts that show them) and logo edits re-copy the logo
+        and favicon.
+        """
+        changed = [Path(path) for path in changed_paths]
+        self.report = BuildReport()
+        self.changes = OutputChanges(self.output_dir)
+        footer_changed = self.footer_config_path in changed
+        posts_changed = any(path.suffix == '.md' and path.parent == self.blog_dir for path in changed)
+        images_changed = any(Path("images") in path.parents for path in changed)
+        logo_changed = Path("qrtick-logo-alt.svg") in changed
+        
+        with self.report.phase('assets'):
+            if images_changed:
+                self.copy_images()
+                # Posts showing a changed image need new srcset/width/height attributes
+                posts_changed = True
+            if logo_changed:
+                self.copy_logo()
+                self.copy_favicon()
+        if posts_changed or footer_changed:
+            # The manifest's footer hash makes a footer change re-render everything
+            self.build_pages()
+        if self.precompress:
+            with self.report.phase('precompress'):
+                self.precompress_outputs()
+        self.report.finish().save(self.report_path)
+        self.changes.save(self.cache_dir)
+    
+    def watch(self, interval=0.02, on_rebuild=None, stop_event=None, images_interval=1.0):
+        """Poll the blog inputs and rebuild affected outputs whenever they change
+        
+        The posts, the logo and the footer config are checked every interval
+        seconds (20 ms by default), so an edit is noticed almost at once.
+        images/ needs a recursive walk and is only checked every
+        images_interval seconds. If scanning blog/ itself gets slow (thousands
+        of posts), polls are spaced out so they take at most a fifth of the time.
+        
+        on_rebuild, if given, is called with the set of changed input paths
+        after each successful rebuild (serve.py uses it to trigger live reload).
+        """
+        print("👀 Watching blog/, images/, the logo and footer config for changes (Ctrl+C to stop)")
+        snapshot = self.watch_signatures()
+        images = self.image_signatures()
+        images_due = time.monotonic() + images_interval
+        delay = interval
+        
+        while stop_event is None or not stop_event.is_set():
+            time.sleep(delay)
+            started = time.perf_counter()
+            current = self.watch_signatures()
+            delay = max(interval, (time.perf_counter() - started) * 4)
+            changed = changed_paths(snapshot, current)
+            snapshot = current
+            if time.monotonic() >= images_due:
+                current = self.image_signatures()
+                changed |= changed_paths(images, current)
+                images = current
+                images_due = time.monotonic() + images_interval
+            if not changed:
+                continue
+            
+            started = time.perf_counter()
+            try:
+                self.rebuild_for_changes(changed)
+            except Exception as e:
+                print(f"❌ Rebuild failed: {e}")
+                continue
+            print(f"⚡ Rebuilt {len(changed)} changed input(s) in {(time.perf_counter() - started) * 1000:.0f} ms")
+            
+            if on_rebuild:
+                on_rebuild(changed)
+
+def changed_paths(before, after):
+    """The paths whose signature differs between two watch snapshots (added and removed included)"""
+    return {path for path in set(before) | set(after) if before.get(path) != after.get(path)}
+
+# Per-process state for parallel rendering: one generator (and so one
+# markdown renderer) per worker, created by the pool initializer
+_worker_state = {}
+
+def minify_summary(original_size, minified_size):
+    """Describe the bytes minification saved, e.g. '14.2 KB -> 10.9 KB (saved 3.3 KB, 23%)'"""
+    saved = original_size - minified_size
+    percent = saved * 100 // original_size if original_size else 0
+    return (f"{original_size / 1024:.1f} KB -> {minified_size / 1024:.1f} KB "
+            f"(saved {saved / 1024:.1f} KB, {percent}%)")
+
+def _init_render_worker(options, footer, images, trace_memory=False):
+    """Set up a render worker process"""
+    if trace_memory:
+        tracemalloc.start()
+    _worker_state['generator'] = BlogGenerator(**options)
+    # Share the parent's precomputed footer and image metadata instead of re-reading them
+    _worker_state['generator']._footer = footer
+    _worker_state['generator'].image_pipeline.images = images
+
+def _render_post_in_worker(md_path, source_bytes, date_modified=None):
+    """Render a single post inside a worker process"""
+    return _worker_state['generator'].build_post(Path(md_path), source_bytes, date_modified)
+
+def verify_reproducible(options=(), jobs=1):
+    """Build the blog twice from scratch and report whether the outputs match byte for byte
+    
+    The two builds run in separate processes with different hash seeds and job
+    counts, so neither set ordering nor worker scheduling can hide in the output.
+    """
+    import subprocess
+    import sys
+    import tempfile
+    
+    print("🔁 Building twice to verify the output is reproducible...")
+    with tempfile.TemporaryDirectory(prefix="qrtick-repro-") as tmp:
+        outputs = []
+        for run, run_jobs in enumerate((1, max(2, jobs)), start=1):
+            output_dir = Path(tmp) / f"build-{run}"
+            command = [sys.executable, str(Path(__file__).resolve()), 'build', '--force', '--no-cache',
+                       '--output-dir', str(output_dir), '--cache-dir', str(Path(tmp) / f"cache-{run}"),
+                       '--jobs', str(run_jobs)] + list(options)
+            result = subprocess.run(command, env=dict(os.environ, PYTHONHASHSEED=str(run)),
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+            if result.returncode != 0:
+                print(result.stdout)
+                print(f"❌ Build {run} failed")
+                return False
+            outputs.append(output_dir)
+        
+        trees = [{path.relative_to(output): path for path in output.rglob("*") if path.is_file()}
+                 for output in outputs]
+        differences = sorted(str(relative) for relative in set(trees[0]) | set(trees[1])
+                             if relative not in trees[0] or relative not in trees[1]
+                             or trees[0][relative].read_bytes() != trees[1][relative].read_bytes())
+    
+    if differences:
+        print(f"❌ Output is not reproducible; {len(differences)} file(s) differ:")
+        for relative in differences:
+            print(f"   {relative}")
+        return False
+    print(f"✅ Output is reproducible: {len(trees[0])} files identical across both builds")
+    return True
 
 def main():
     """Main function to run the blog generator"""
+    import argparse
     import sys
     
+    parser = argparse.ArgumentParser(description="Generate the QRTick blog")
+    parser.add_argument('command', nargs='?', choices=['build', 'watch'], default='build',
+                        help="build once (default) or keep rebuilding as inputs change")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore the build manifest and rebuild every page")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="render posts in N worker processes (0 = one per CPU core)")
+    parser.add_argument('--inline-critical', action='store_true',
+                        help="inline the above-the-fold CSS and load the shared stylesheet asynchronously")
+    parser.add_argument('--link-assets', action='store_true',
+                        help="hardlink images, logo and favicon into the output instead of copying")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="neither read nor write the markdown render cache")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="empty the markdown render cache before building")
+    parser.add_argument('--precompress', action='store_true',
+                        help="write .br and .gz siblings of every HTML/CSS/SVG/JSON/XML output")
+    parser.add_argument('--minify', action='store_true',
+                        help="minify pages and hoist the inline styles they all repeat into the shared stylesheet")
+    parser.add_argument('--search', action='store_true',
+                        help="build a sharded client-side search index and add a search box to the index")
+    parser.add_argument('--feed-size', type=int, default=20, metavar='N',
+                        help="posts in the RSS, Atom and JSON feeds (default 20; 0 = no feeds)")
+    parser.add_argument('--per-page', type=int, default=10, metavar='N',
+                        help="posts per numbered archive page; the index shows N to 2N-1 (0 = no pagination)")
+    parser.add_argument('--ai', action='store_true',
+                        help="add the AI-optimized meta tags and JSON-LD structured data to every page")
+    parser.add_argument('--profile', nargs='?', const='.blog_cache/build.prof', metavar='FILE',
+                        help="run the build under cProfile and save the stats (default .blog_cache/build.prof)")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="record tracemalloc peak memory for every build phase")
+    parser.add_argument('--output-dir', default='blog_html', metavar='DIR',
+                        help="where to write the site (default blog_html)")
+    parser.add_argument('--cache-dir', default='.blog_cache', metavar='DIR',
+                        help="where to keep the build manifest and caches (default .blog_cache)")
+    parser.add_argument('--verify-reproducible', action='store_true',
+                        help="build twice from scratch and fail unless the outputs are byte-identical")
+    args = parser.parse_args()
+    
     # Check if required libraries are available
     try:
         import markdown
@@ -1114,8 +2140,46 @@ def main():
         print("Install with: pip install markdown PyYAML")
         sys.exit(1)
     
-    generator = BlogGenerator()
-    generator.generate_blog()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.verify_reproducible:
+        options = [flag for flag, enabled in (('--inline-critical', args.inline_critical),
+                                              ('--precompress', args.precompress),
+                                              ('--minify', args.minify),
+                                              ('--search', args.search),
+                                              ('--ai', args.ai)) if enabled]
+        options += ['--per-page', str(args.per_page), '--feed-size', str(args.feed_size)]
+        sys.exit(0 if verify_reproducible(options, jobs) else 1)
+    
+    generator = BlogGenerator(output_dir=args.output_dir, cache_dir=args.cache_dir,
+                              use_cache=not args.no_cache, inline_critical=args.inline_critical,
+                              link_assets=args.link_assets, stages=AI_STAGES if args.ai else (),
+                              precompress=args.precompress, minify=args.minify, per_page=args.per_page,
+                              search=args.search, feed_size=args.feed_size)
+    if args.clear_cache:
+        generator.render_cache.clear()
+        print("🧹 Cleared markdown render cache")
+    if args.trace_memory:
+        tracemalloc.start()
+    
+    if args.profile:
+        import cProfile
+        import pstats
+        
+        profiler = cProfile.Profile()
+        profiler.runcall(generator.generate_blog, force=args.force, jobs=jobs)
+        Path(args.profile).parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(args.profile)
+        print(f"🔬 Saved profile to {args.profile}; slowest calls (cumulative):")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    else:
+        generator.generate_blog(force=args.force, jobs=jobs)
+    print(f"📝 Build report written to {generator.report_path}")
+    
+    if args.command == 'watch':
+        try:
+            generator.watch()
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
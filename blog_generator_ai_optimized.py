@@ -7,31 +7,26 @@ Enhanced blog generator with AI optimization features:
 - Structured data (JSON-LD)
 - Enhanced local SEO
 - AI crawler optimization
+
+The features are output stages of the standard BlogGenerator pipeline, so
+an AI-optimized build parses and renders every post once and writes the
+same pages as a standard build, with the extra markup in their <head>.
 """
 
-import os
+import json
 import re
-import markdown
-import yaml
-import shutil
 from datetime import datetime
 from pathlib import Path
 
+from build_manifest import hash_text
+from output_stages import OutputStage
+
 class AIOptimizedBlogGenerator:
-    def __init__(self, blog_dir="blog", output_dir="blog_html"):
+    def __init__(self, blog_dir="blog", output_dir="blog_html", cache_dir=".blog_cache", use_cache=True):
         self.blog_dir = Path(blog_dir)
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
-        
-        # QRTick brand colors and styling
-        self.template_vars = {
-            'bg_color': '#FFFFFF',
-            'header_bg': '#FFFFFF',
-            'accent_color': '#FDC230',
-            'text_color': '#2D2D2D',
-            'meta_color': '#666666',
-            'border_color': '#E5E5E5'
-        }
+        self.cache_dir = Path(cache_dir)
+        self.use_cache = use_cache
     
     def generate_ai_optimized_meta_tags(self, post_data):
         """Generate AI-optimized meta tags for blog posts"""
@@ -50,6 +45,10 @@ class AIOptimizedBlogGenerator:
         # Enhanced description with local context
         enhanced_description = f"Jamaica's leading event management blog: {excerpt} Stress-free event planning for Jamaican organizers."
         
+        # Content-derived, so rebuilding an unchanged post produces identical bytes
+        _, modified = self.content_dates(post_data)
+        last_modified = f'<meta name="last-modified" content="{modified}">' if modified else ''
+        
         return f"""
     <meta name="description" content="{enhanced_description}">
     <meta name="keywords" content="{keywords_str}">
@@ -60,7 +59,7 @@ class AIOptimizedBlogGenerator:
     <meta name="language" content="en-JM">
     <meta name="geo.country" content="JM">
     <meta name="geo.position" content="18.0179;-76.8099">
-    <meta name="last-modified" content="{datetime.now().strftime('%Y-%m-%d')}">
+    {last_modified}
     <meta name="revisit-after" content="1 week">
     
     <!-- Open Graph for Social Media -->
@@ -82,19 +81,10 @@ class AIOptimizedBlogGenerator:
         """Generate JSON-LD structured data for blog posts"""
         title = post_data.get('title', '')
         excerpt = post_data.get('excerpt', '')
-        date = post_data.get('date', '')
         slug = post_data.get('slug', '')
         tags = post_data.get('tags', [])
         
-        # Parse date for structured data
-        try:
-            if date:
-                parsed_date = datetime.strptime(date, "%B %Y")
-                iso_date = parsed_date.strftime("%Y-%m-%d")
-            else:
-                iso_date = datetime.now().strftime("%Y-%m-%d")
-        except:
-            iso_date = datetime.now().strftime("%Y-%m-%d")
+        published, modified = self.content_dates(post_data)
         
         structured_data = {
             "@context": "https://schema.org",
@@ -121,8 +111,11 @@ class AIOptimizedBlogGenerator:
                     "url": "https://qrtick.com/logo.png"
                 }
             },
-            "datePublished": iso_date,
-            "dateModified": iso_date,
+        }
+        if published:
+            structured_data["datePublished"] = published
+            structured_data["dateModified"] = modified
+        structured_data.update({
             "mainEntityOfPage": {
                 "@type": "WebPage",
                 "@id": f"https://qrtick.com/blog/{slug}"
@@ -138,615 +131,74 @@ class AIOptimizedBlogGenerator:
                 "name": "The QR Code - QRTick Jamaica Blog",
                 "url": "https://qrtick.com/blog"
             }
-        }
-        
-        return f"""
-    <script type="application/ld+json">
-    {yaml.dump(structured_data, default_flow_style=False, sort_keys=False)}
-    </script>
-    """
-    
-    def generate_ai_optimized_template(self, post_data):
-        """Generate AI-optimized HTML template"""
-        title = post_data.get('title', '')
-        excerpt = post_data.get('excerpt', '')
-        content = post_data.get('content', '')
-        date = post_data.get('date', '')
-        author = post_data.get('author', 'QRTick Team')
-        tags = post_data.get('tags', [])
-        slug = post_data.get('slug', '')
-        
-        # Generate AI-optimized meta tags
-        meta_tags = self.generate_ai_optimized_meta_tags(post_data)
-        
-        # Generate structured data
-        structured_data = self.generate_structured_data(post_data)
-        
-        # Generate tags HTML
-        tags_html = ""
-        if tags:
-            tags_html = f"""
-        <div class="tags">
-            <h4>Tags:</h4>
-            <div class="tag-list">
-                {''.join([f'<span class="tag">{tag}</span>' for tag in tags])}
-            </div>
-        </div>
-        """
-        
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - QRTick Jamaica Blog</title>
-    {meta_tags}
-    <link rel="canonical" href="https://qrtick.com/blog/{slug}">
-    <link rel="icon" type="image/png" sizes="32x32" href="https://qrtick.com/favicon-32x32.png">
-    <link rel="icon" type="image/png" sizes="192x192" href="https://qrtick.com/favicon-192x192.png">
-    <link rel="apple-touch-icon" sizes="180x180" href="https://qrtick.com/favicon-180x180.png">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
-    {structured_data}
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #FFFFFF;
-            color: #2D2D2D;
-            line-height: 1.7;
-            font-size: 16px;
-        }}
-        
-        .header {{
-            background: #FFFFFF;
-            border-bottom: 1px solid #E5E5E5;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            padding: 1rem 0;
-        }}
-        
-        .header-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .logo {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            text-decoration: none;
-        }}
-        
-        .nav {{
-            display: flex;
-            gap: 2rem;
-            align-items: center;
-        }}
-        
-        .nav a {{
-            color: #666666;
-            text-decoration: none;
-            font-weight: 500;
-            transition: color 0.2s;
-        }}
-        
-        .nav a:hover {{
-            color: #FDC230;
-        }}
-        
-        .cta-button {{
-            background: #FDC230;
-            color: #2D2D2D;
-            padding: 0.75rem 1.5rem;
-            border-radius: 6px;
-            text-decoration: none;
-            font-weight: 600;
-            transition: background 0.2s;
-        }}
-        
-        .cta-button:hover {{
-            background: #E6B800;
-        }}
-        
-        .container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 2rem;
-        }}
+        })
         
-        .post-header {{
-            margin-bottom: 3rem;
-        }}
-        
-        .post-title {{
-            font-size: 2.5rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            margin-bottom: 1rem;
-            line-height: 1.2;
-        }}
-        
-        .post-meta {{
-            color: #666666;
-            font-size: 0.9rem;
-            margin-bottom: 2rem;
-        }}
-        
-        .post-content {{
-            font-size: 1.1rem;
-            line-height: 1.8;
-        }}
-        
-        .post-content h1, .post-content h2, .post-content h3 {{
-            margin: 2rem 0 1rem 0;
-            color: #2D2D2D;
-        }}
-        
-        .post-content h2 {{
-            font-size: 1.8rem;
-            font-weight: 600;
-        }}
-        
-        .post-content h3 {{
-            font-size: 1.4rem;
-            font-weight: 600;
-        }}
-        
-        .post-content p {{
-            margin-bottom: 1.5rem;
-        }}
-        
-        .post-content ul, .post-content ol {{
-            margin: 1.5rem 0;
-            padding-left: 2rem;
-        }}
-        
-        .post-content li {{
-            margin-bottom: 0.5rem;
-        }}
-        
-        .post-content strong {{
-            font-weight: 600;
-            color: #2D2D2D;
-        }}
-        
-        .post-content em {{
-            font-style: italic;
-            color: #666666;
-        }}
-        
-        .tags {{
-            margin-top: 3rem;
-            padding-top: 2rem;
-            border-top: 1px solid #E5E5E5;
-        }}
-        
-        .tags h4 {{
-            margin-bottom: 1rem;
-            color: #2D2D2D;
-        }}
-        
-        .tag-list {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.5rem;
-        }}
-        
-        .tag {{
-            background: #F8F9FA;
-            color: #666666;
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.85rem;
-            font-weight: 500;
-        }}
-        
-        .footer {{
-            background: #F8F9FA;
-            padding: 2rem 0;
-            margin-top: 4rem;
-            text-align: center;
-        }}
-        
-        .footer-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-        }}
-        
-        .footer p {{
-            color: #666666;
-            margin-bottom: 1rem;
-        }}
-        
-        .footer a {{
-            color: #FDC230;
-            text-decoration: none;
-        }}
-        
-        .footer a:hover {{
-            text-decoration: underline;
-        }}
-        
-        @media (max-width: 768px) {{
-            .header-content {{
-                padding: 0 1rem;
-            }}
-            
-            .nav {{
-                gap: 1rem;
-            }}
-            
-            .container {{
-                padding: 1rem;
-            }}
-            
-            .post-title {{
-                font-size: 2rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <header class="header">
-        <div class="header-content">
-            <a href="https://qrtick.com" class="logo">QRTick Jamaica</a>
-            <nav class="nav">
-                <a href="https://qrtick.com/blog">Blog</a>
-                <a href="https://qrtick.com/support">Support</a>
-                <a href="https://qrtick.com">Events</a>
-                <a href="https://qrtick.com" class="cta-button">Try QRTick</a>
-            </nav>
-        </div>
-    </header>
+        return self.json_ld_script(structured_data)
     
-    <main class="container">
-        <article class="post-header">
-            <h1 class="post-title">{title}</h1>
-            <div class="post-meta">
-                <span>By {author}</span> • <span>{date}</span>
-            </div>
-        </article>
-        
-        <div class="post-content">
-            {content}
-        </div>
-        
-        {tags_html}
-    </main>
-    
-    <footer class="footer">
-        <div class="footer-content">
-            <p>Part of <a href="https://qrtick.com">QRTick Jamaica</a> - Jamaica's leading event technology platform</p>
-            <p>Making event management stress-free for organizers across Jamaica</p>
-        </div>
-    </footer>
-</body>
-</html>"""
-
-    def generate_blog_index(self, posts):
-        """Generate AI-optimized blog index page"""
-        # Sort posts by date (newest first)
-        sorted_posts = sorted(posts, key=lambda x: self.parse_date(x.get('date', '')), reverse=True)
-        
-        # Generate post cards HTML
-        post_cards = ""
-        for post in sorted_posts:
-            title = post.get('title', '')
-            excerpt = post.get('excerpt', '')
-            date = post.get('date', '')
-            slug = post.get('slug', '')
-            tags = post.get('tags', [])
-            featured = post.get('featured', False)
-            pinned = post.get('pinned', False)
-            
-            # Calculate reading time (approximate)
-            content = post.get('content', '')
-            word_count = len(content.split())
-            reading_time = max(1, word_count // 200)
-            
-            # Generate tags HTML
-            tags_html = ""
-            if tags:
-                tags_html = f"""
-                <div class="post-tags">
-                    {''.join([f'<span class="tag">{tag}</span>' for tag in tags[:3]])}
-                </div>
-                """
-            
-            # Featured post styling
-            card_class = "post-card"
-            if featured or pinned:
-                card_class += " featured-post"
-            
-            post_cards += f"""
-            <article class="{card_class}">
-                <div class="post-content">
-                    <h2 class="post-title">
-                        <a href="{slug}.html">{title}</a>
-                    </h2>
-                    <p class="post-excerpt">{excerpt}</p>
-                    {tags_html}
-                </div>
-                <div class="post-meta">
-                    <span class="post-date">{date}</span>
-                    <span class="reading-time">{reading_time} min read</span>
-                </div>
-            </article>
-            """
-        
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>The QR Code - QRTick Jamaica Blog</title>
+    def generate_index_meta_tags(self):
+        """Generate AI-optimized meta tags for the blog index"""
+        return """
     <meta name="description" content="Jamaica's leading event management blog. Stress-free event planning, organizer support, and practical solutions for Jamaican event organizers.">
     <meta name="keywords" content="Jamaican events, Kingston event planning, Montego Bay events, stress-free organizing, QRTick Jamaica, event management blog">
     <meta name="author" content="QRTick Jamaica - Leading Event Technology Platform">
     <meta name="geo.region" content="JM">
     <meta name="geo.placename" content="Jamaica">
     <link rel="canonical" href="https://qrtick.com/blog">
-    <link rel="icon" type="image/png" sizes="32x32" href="https://qrtick.com/favicon-32x32.png">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap" rel="stylesheet">
+    """
+    
+    def generate_listing_meta_tags(self, title, path):
+        """Generate AI-optimized meta tags for archive and listing pages"""
+        url_path = path[:-len('.html')] if path.endswith('.html') else path
+        return f"""
+    <meta name="description" content="{title} - The QR Code, Jamaica's leading event management blog. Stress-free event planning for Jamaican organizers.">
+    <meta name="author" content="QRTick Jamaica - Leading Event Technology Platform">
+    <meta name="geo.region" content="JM">
+    <meta name="geo.placename" content="Jamaica">
+    <link rel="canonical" href="https://qrtick.com/blog/{url_path}">
+    """
+    
+    def generate_index_structured_data(self):
+        """Generate JSON-LD structured data for the blog index"""
+        return self.json_ld_script({
+            "@context": "https://schema.org",
+            "@type": "Blog",
+            "name": "The QR Code - QRTick Jamaica Blog",
+            "description": "Jamaica's leading event management blog focused on stress-free event planning",
+            "url": "https://qrtick.com/blog",
+            "publisher": {
+                "@type": "Organization",
+                "name": "QRTick Jamaica",
+                "url": "https://qrtick.com"
+            },
+            "inLanguage": "en-JM"
+        })
+    
+    def json_ld_script(self, data):
+        """Embed structured data as a JSON-LD <script> block"""
+        # "</" is escaped so post text can never close the script element early
+        payload = json.dumps(data, indent=4, ensure_ascii=False).replace('</', '<\\/').replace('\n', '\n    ')
+        return f"""
     <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "Blog",
-        "name": "The QR Code - QRTick Jamaica Blog",
-        "description": "Jamaica's leading event management blog focused on stress-free event planning",
-        "url": "https://qrtick.com/blog",
-        "publisher": {{
-            "@type": "Organization",
-            "name": "QRTick Jamaica",
-            "url": "https://qrtick.com"
-        }},
-        "inLanguage": "en-JM"
-    }}
+    {payload}
     </script>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #FFFFFF;
-            color: #2D2D2D;
-            line-height: 1.7;
-        }}
-        
-        .header {{
-            background: #FFFFFF;
-            border-bottom: 1px solid #E5E5E5;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            padding: 1rem 0;
-        }}
-        
-        .header-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .logo {{
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            text-decoration: none;
-        }}
-        
-        .nav {{
-            display: flex;
-            gap: 2rem;
-            align-items: center;
-        }}
-        
-        .nav a {{
-            color: #666666;
-            text-decoration: none;
-            font-weight: 500;
-            transition: color 0.2s;
-        }}
-        
-        .nav a:hover {{
-            color: #FDC230;
-        }}
-        
-        .cta-button {{
-            background: #FDC230;
-            color: #2D2D2D;
-            padding: 0.75rem 1.5rem;
-            border-radius: 6px;
-            text-decoration: none;
-            font-weight: 600;
-            transition: background 0.2s;
-        }}
-        
-        .cta-button:hover {{
-            background: #E6B800;
-        }}
-        
-        .hero {{
-            background: linear-gradient(135deg, #FFF9EA 0%, #FFFFFF 100%);
-            padding: 4rem 0;
-            text-align: center;
-        }}
-        
-        .hero-content {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 0 2rem;
-        }}
-        
-        .hero h1 {{
-            font-size: 3rem;
-            font-weight: 700;
-            color: #2D2D2D;
-            margin-bottom: 1rem;
-        }}
-        
-        .hero p {{
-            font-size: 1.2rem;
-            color: #666666;
-            margin-bottom: 2rem;
-        }}
-        
-        .container {{
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 4rem 2rem;
-        }}
-        
-        .post-card {{
-            border-bottom: 1px solid #E5E5E5;
-            padding: 2rem 0;
-            transition: transform 0.2s;
-        }}
-        
-        .post-card:hover {{
-            transform: translateY(-2px);
-        }}
-        
-        .featured-post {{
-            background: linear-gradient(135deg, #FFF9EA 0%, #FFFFFF 100%);
-            border-radius: 8px;
-            padding: 2rem;
-            margin-bottom: 2rem;
-            border: 1px solid #FDC230;
-        }}
-        
-        .post-title {{
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-bottom: 1rem;
-        }}
-        
-        .post-title a {{
-            color: #2D2D2D;
-            text-decoration: none;
-            transition: color 0.2s;
-        }}
-        
-        .post-title a:hover {{
-            color: #FDC230;
-        }}
-        
-        .post-excerpt {{
-            color: #666666;
-            margin-bottom: 1rem;
-        }}
-        
-        .post-tags {{
-            display: flex;
-            gap: 0.5rem;
-            margin-bottom: 1rem;
-        }}
-        
-        .tag {{
-            background: #F8F9FA;
-            color: #666666;
-            padding: 0.25rem 0.75rem;
-            border-radius: 20px;
-            font-size: 0.85rem;
-            font-weight: 500;
-        }}
-        
-        .post-meta {{
-            display: flex;
-            gap: 1rem;
-            color: #666666;
-            font-size: 0.9rem;
-        }}
-        
-        .footer {{
-            background: #F8F9FA;
-            padding: 2rem 0;
-            margin-top: 4rem;
-            text-align: center;
-        }}
-        
-        .footer-content {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 0 2rem;
-        }}
-        
-        .footer p {{
-            color: #666666;
-            margin-bottom: 1rem;
-        }}
-        
-        .footer a {{
-            color: #FDC230;
-            text-decoration: none;
-        }}
-        
-        .footer a:hover {{
-            text-decoration: underline;
-        }}
-        
-        @media (max-width: 768px) {{
-            .hero h1 {{
-                font-size: 2rem;
-            }}
-            
-            .container {{
-                padding: 2rem 1rem;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <header class="header">
-        <div class="header-content">
-            <a href="https://qrtick.com" class="logo">QRTick Jamaica</a>
-            <nav class="nav">
-                <a href="https://qrtick.com/blog">Blog</a>
-                <a href="https://qrtick.com/support">Support</a>
-                <a href="https://qrtick.com">Events</a>
-                <a href="https://qrtick.com" class="cta-button">Try QRTick</a>
-            </nav>
-        </div>
-    </header>
-    
-    <section class="hero">
-        <div class="hero-content">
-            <h1>The QR Code</h1>
-            <p>Making event management stress-free for organizers across Jamaica</p>
-        </div>
-    </section>
+    """
     
-    <main class="container">
-        {post_cards}
-    </main>
+    def content_dates(self, post_data):
+        """Return (published, modified) as YYYY-MM-DD strings, never from the clock
+        
+        published is the frontmatter date and modified is 'date_modified', set
+        by the pipeline from the source's last commit or SOURCE_DATE_EPOCH (see
+        source_dates.py). Each falls back to the other; both are None if
+        neither is known.
+        """
+        published = None
+        if post_data.get('date'):
+            parsed = self.parse_date(str(post_data['date']))
+            if parsed != datetime.min:
+                published = parsed.strftime('%Y-%m-%d')
+        modified = post_data.get('date_modified') or published
+        return published or modified, modified
     
-    <footer class="footer">
-        <div class="footer-content">
-            <p>Part of <a href="https://qrtick.com">QRTick Jamaica</a> - Jamaica's leading event technology platform</p>
-            <p>Making event management stress-free for organizers across Jamaica</p>
-        </div>
-    </footer>
-</body>
-</html>"""
-
     def parse_date(self, date_str):
         """Parse date string in various formats and return a datetime object for sorting"""
         if not date_str:
@@ -781,58 +233,82 @@ class AIOptimizedBlogGenerator:
         # If all else fails, return a very old date so it appears last
         print(f"Warning: Could not parse date '{date_str}', using fallback")
         return datetime.min
-
-    def generate_blog(self):
-        """Generate the complete blog with AI optimization"""
-        posts = []
-        
-        # Process all markdown files
-        for md_file in self.blog_dir.glob("*.md"):
-            with open(md_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Split frontmatter and content
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    frontmatter = parts[1]
-                    markdown_content = parts[2]
-                    
-                    try:
-                        post_data = yaml.safe_load(frontmatter)
-                        post_data['content'] = markdown.markdown(markdown_content)
-                        posts.append(post_data)
-                    except yaml.YAMLError as e:
-                        print(f"Error parsing YAML in {md_file}: {e}")
-                        continue
-        
-        # Generate individual post pages
-        for post in posts:
-            slug = post.get('slug', '')
-            if slug:
-                html_content = self.generate_ai_optimized_template(post)
-                output_file = self.output_dir / f"{slug}.html"
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(html_content)
-                print(f"Generated: {output_file}")
+    
+    def generate_blog(self, force=False, jobs=1):
+        """Generate the complete blog with AI optimization in a single pass"""
+        from blog_generator import AI_STAGES, BlogGenerator
         
-        # Generate blog index
-        index_html = self.generate_blog_index(posts)
-        index_file = self.output_dir / "index.html"
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_html)
-        print(f"Generated: {index_file}")
+        generator = BlogGenerator(blog_dir=self.blog_dir, output_dir=self.output_dir, cache_dir=self.cache_dir,
+                                  use_cache=self.use_cache, stages=AI_STAGES)
+        generator.generate_blog(force=force, jobs=jobs)
         
-        print(f"\nBlog generation complete! {len(posts)} posts processed.")
         print("AI optimization features included:")
         print("- Jamaica-specific meta tags")
         print("- Structured data (JSON-LD)")
         print("- Enhanced local SEO")
         print("- AI crawler optimization")
+        return generator
 
-if __name__ == "__main__":
-    generator = AIOptimizedBlogGenerator()
-    generator.generate_blog()
+
+class AIStage(OutputStage):
+    """Output stage backed by an AIOptimizedBlogGenerator"""
+    
+    def __init__(self, generator):
+        super().__init__(generator)
+        self.ai = AIOptimizedBlogGenerator(blog_dir=generator.blog_dir, output_dir=generator.output_dir,
+                                           cache_dir=generator.cache_dir)
+    
+    def fingerprint(self):
+        # The markup comes from this module, so any edit to it re-renders the pages
+        return f"{self.name}:{hash_text(Path(__file__).read_text(encoding='utf-8'))}"
+
+
+class AIMetaTagsStage(AIStage):
+    """Jamaica-specific SEO, Open Graph and Twitter meta tags"""
+    
+    name = 'ai-meta'
+    replaces_description = True
+    
+    def post_head(self, post_data):
+        slug = post_data.get('slug', '')
+        return (self.ai.generate_ai_optimized_meta_tags(post_data).strip()
+                + f'\n    <link rel="canonical" href="https://qrtick.com/blog/{slug}">')
+    
+    def index_head(self, posts):
+        return self.ai.generate_index_meta_tags()
+    
+    def listing_head(self, posts, title, path):
+        return self.ai.generate_listing_meta_tags(title, path)
 
 
+class StructuredDataStage(AIStage):
+    """schema.org JSON-LD for posts (BlogPosting) and the index (Blog)"""
+    
+    name = 'json-ld'
+    
+    def post_head(self, post_data):
+        return self.ai.generate_structured_data(post_data)
+    
+    def index_head(self, posts):
+        return self.ai.generate_index_structured_data()
 
+if __name__ == "__main__":
+    import argparse
+    import os
+    
+    parser = argparse.ArgumentParser(description="Generate the AI-optimized QRTick blog")
+    parser.add_argument('--force', action='store_true',
+                        help="ignore the build manifest and rebuild every page")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="render posts in N worker processes (0 = one per CPU core)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="neither read nor write the markdown render cache")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="empty the markdown render cache before building")
+    args = parser.parse_args()
+    
+    generator = AIOptimizedBlogGenerator(use_cache=not args.no_cache)
+    if args.clear_cache:
+        from render_cache import RenderCache
+        RenderCache(generator.cache_dir / "render").clear()
+    generator.generate_blog(force=args.force, jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Build manifest for the QRTick blog generator.
+
+Records, for every source post, the hashes of the inputs that went into its
+page (source, frontmatter, templates, footer config) together with the output
+path and output hash, so unchanged posts can be skipped on the next build.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_VERSION = 2
+
+
+def hash_bytes(data):
+    """Return the hex SHA-256 digest of a bytes object"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_text(text):
+    """Return the hex SHA-256 digest of a string"""
+    return hash_bytes(text.encode('utf-8'))
+
+
+def hash_json(value):
+    """Return a stable digest of a JSON-serialisable value"""
+    return hash_text(json.dumps(value, sort_keys=True, default=str))
+
+
+def hash_file(path):
+    """Return the digest of a file's contents, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hash_bytes(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def file_signature(path):
+    """Return a cheap (size, mtime_ns) signature used to avoid rehashing files"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class BuildManifest:
+    """Persistent record of the inputs and outputs of the previous build"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.data = self._empty()
+
+    def _empty(self):
+        return {'version': MANIFEST_VERSION, 'posts': {}, 'pages': {}}
+
+    def load(self):
+        """Load the manifest from disk, starting fresh if it is missing or stale"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return self
+        if data.get('version') == MANIFEST_VERSION:
+            self.data = data
+        return self
+
+    def save(self):
+        """Atomically write the manifest back to disk"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, indent=1, sort_keys=True, default=str)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def posts(self):
+        return self.data['posts']
+
+    @property
+    def pages(self):
+        """{path: {digest, output_hash, output_signature}} for the index and other listing pages"""
+        return self.data['pages']
+
+    def output_is_current(self, output_path, output_hash, output_signature):
+        """Check that an output file still holds the bytes we last wrote"""
+        if not output_hash:
+            return False
+        signature = file_signature(output_path)
+        if signature is None:
+            return False
+        if signature == output_signature:
+            return True
+        return hash_file(output_path) == output_hash
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Build timing report for the QRTick blog generator.
+
+Records how long each build phase takes (and, when tracemalloc is tracing,
+how much memory it peaked at), both for the build as a whole and for every
+post rendered, and writes the result as a JSON report that later builds can
+be compared against.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPORT_VERSION = 1
+
+# Phases that run once per build in the main process, in report order
+BUILD_PHASES = ('assets', 'scan', 'render', 'index', 'search', 'feeds', 'manifest', 'precompress')
+# Phases timed for every rendered post (summed across posts and workers)
+POST_PHASES = ('frontmatter', 'markdown', 'images', 'template', 'minify', 'search', 'write')
+
+# Peak-memory bookkeeping for the phases currently open in this process
+_open_phases = []
+
+
+def _reset_peak():
+    # tracemalloc.reset_peak() is new in Python 3.9; on older versions peaks
+    # are the high-water mark since tracing started
+    reset_peak = getattr(tracemalloc, 'reset_peak', None)
+    if reset_peak is not None:
+        reset_peak()
+
+
+@contextmanager
+def timed(record, name):
+    """Add the time spent in a block to record['seconds'][name]
+
+    While tracemalloc is tracing, the peak traced memory above the level at
+    the start of the block is kept in record['peak_bytes'][name].
+    """
+    tracing = tracemalloc.is_tracing()
+    frame = None
+    if tracing:
+        # Propagate the current peak to any enclosing phase before resetting it
+        peak = tracemalloc.get_traced_memory()[1]
+        for outer in _open_phases:
+            outer['peak'] = max(outer['peak'], peak)
+        _reset_peak()
+        frame = {'start': tracemalloc.get_traced_memory()[0], 'peak': 0}
+        _open_phases.append(frame)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = record.setdefault('seconds', {})
+        seconds[name] = seconds.get(name, 0.0) + time.perf_counter() - started
+        if frame is not None and tracemalloc.is_tracing():
+            _open_phases.remove(frame)
+            peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+            for outer in _open_phases:
+                outer['peak'] = max(outer['peak'], peak)
+            peaks = record.setdefault('peak_bytes', {})
+            peaks[name] = max(peaks.get(name, 0), peak - frame['start'])
+
+
+class BuildReport:
+    """Per-phase and per-post timings for a single build"""
+
+    def __init__(self, jobs=1):
+        self.jobs = jobs
+        self.started = time.perf_counter()
+        self.total_seconds = None
+        self.build = {}
+        self.post_totals = {}
+        self.posts = {}
+        self.counts = {}
+
+    def phase(self, name):
+        """Context manager timing one of the build-wide phases"""
+        return timed(self.build, name)
+
+    def add_post(self, post_name, record):
+        """Record the phase timings of one rendered post"""
+        self.posts[post_name] = record
+        for key, values in record.items():
+            totals = self.post_totals.setdefault(key, {})
+            for name, value in values.items():
+                if key == 'seconds':
+                    totals[name] = totals.get(name, 0.0) + value
+                else:
+                    totals[name] = max(totals.get(name, 0), value)
+
+    def finish(self, **counts):
+        """Stop the build clock and record summary counts (rendered, reused, ...)"""
+        self.total_seconds = time.perf_counter() - self.started
+        self.counts.update(counts)
+        return self
+
+    def as_dict(self):
+        def phases(record, order):
+            names = [name for name in order if name in record.get('seconds', {})]
+            names += sorted(set(record.get('seconds', {})) - set(names))
+            result = {}
+            for name in names:
+                result[name] = {'seconds': round(record['seconds'][name], 6)}
+                if name in record.get('peak_bytes', {}):
+                    result[name]['peak_bytes'] = record['peak_bytes'][name]
+            return result
+
+        return {
+            'version': REPORT_VERSION,
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'jobs': self.jobs,
+            'trace_memory': any('peak_bytes' in record for record in [self.build] + list(self.posts.values())),
+            'total_seconds': round(self.total_seconds or 0.0, 6),
+            'counts': self.counts,
+            'phases': phases(self.build, BUILD_PHASES),
+            'post_phases': phases(self.post_totals, POST_PHASES),
+            'posts': {name: phases(record, POST_PHASES) for name, record in sorted(self.posts.items())}
+        }
+
+    def save(self, path):
+        """Write the report as JSON, returning the previous report at path (if any)"""
+        path = Path(path)
+        previous = load_report(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, indent=2)
+        os.replace(tmp, path)
+        return previous
+
+    def summary(self, previous=None):
+        """Human-readable summary lines, with deltas against a previous report"""
+        report = self.as_dict()
+        old_phases = (previous or {}).get('phases', {})
+        old_post_phases = (previous or {}).get('post_phases', {})
+
+        def line(label, name, values, old, indent):
+            text = f"{' ' * indent}{label:<{20 - indent}}{values['seconds'] * 1000:9.1f} ms"
+            if name in old:
+                text += f"  ({(values['seconds'] - old[name]['seconds']) * 1000:+.1f})"
+            if 'peak_bytes' in values:
+                text += f"  peak {values['peak_bytes'] / 1024:.0f} KB"
+            return text
+
+        counts = ', '.join(f"{value} {name}" for name, value in report['counts'].items())
+        header = f"📊 Build took {report['total_seconds'] * 1000:.1f} ms"
+        if previous:
+            header += f" ({(report['total_seconds'] - previous['total_seconds']) * 1000:+.1f} vs last build)"
+        lines = [header + (f" - {counts}" if counts else "")]
+        for name, values in report['phases'].items():
+            lines.append(line(name, name, values, old_phases, 3))
+            if name == 'render':
+                for post_name, post_values in report['post_phases'].items():
+                    lines.append(line(post_name, post_name, post_values, old_post_phases, 5))
+
+        if report['posts']:
+            slowest = max(report['posts'], key=lambda post: sum(
+                values['seconds'] for values in report['posts'][post].values()))
+            seconds = sum(values['seconds'] for values in report['posts'][slowest].values())
+            lines.append(f"   slowest post: {slowest} ({seconds * 1000:.1f} ms)")
+        if self.jobs > 1 and report['post_phases']:
+            lines.append(f"   (post phases are summed across {self.jobs} worker processes)")
+        return lines
+
+
+def load_report(path):
+    """Load a saved build report, or None if there isn't a readable one"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return report if report.get('version') == REPORT_VERSION else None
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+RSS 2.0, Atom and JSON Feed output for the QRTick blog.
+
+Every rendered post body is kept in a content-addressed ContentStore in
+.blog_cache, so the newest posts can go into the feeds without re-rendering
+the ones reused from the last build. Each feed is produced as a stream of
+byte chunks, one post at a time, and written to disk as it is generated
+(see OutputChanges.write_stream), so a feed is never held in memory whole.
+
+Nothing in a feed depends on when it was built - even its own updated date
+is that of the newest post - so the same posts always give the same bytes,
+and feed readers polling with If-None-Match keep getting the same ETag.
+"""
+
+import email.utils
+import json
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+from build_manifest import hash_text
+from output_changes import write_atomic
+
+SITE_URL = "https://qrtick.com"
+FEED_TITLE = "The QR Code"
+FEED_DESCRIPTION = ("Making event management stress-free for organisers across Jamaica. "
+                    "Tips, insights, and solutions for better events.")
+DEFAULT_AUTHOR = "QRTick Team"
+
+# (format, file name relative to the blog root, MIME type)
+FEED_FILES = (
+    ('rss', 'rss.xml', 'application/rss+xml'),
+    ('atom', 'atom.xml', 'application/atom+xml'),
+    ('json', 'feed.json', 'application/feed+json'),
+)
+
+ROOT_RELATIVE_URL = re.compile(r'(\s(?:src|href|poster)=")/(?!/)')
+SRCSET = re.compile(r'(\ssrcset=")([^"]*)"')
+
+
+def absolute_urls(content_html, site_url=SITE_URL):
+    """Point the root-relative links and images of a post body at site_url, as feed readers need"""
+    content_html = ROOT_RELATIVE_URL.sub(lambda match: f"{match.group(1)}{site_url}/", content_html)
+
+    def absolute_srcset(match):
+        candidates = [candidate.strip() for candidate in match.group(2).split(',')]
+        candidates = [site_url + candidate if candidate.startswith('/') and not candidate.startswith('//')
+                      else candidate for candidate in candidates]
+        return f'{match.group(1)}{", ".join(candidates)}"'
+
+    return SRCSET.sub(absolute_srcset, content_html)
+
+
+def rfc822(date):
+    """A naive datetime (taken as UTC) in RSS's date format"""
+    return email.utils.format_datetime(date.replace(tzinfo=timezone.utc))
+
+
+def rfc3339(date):
+    """A naive datetime (taken as UTC) in Atom and JSON Feed's date format"""
+    return date.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class ContentStore:
+    """Rendered post bodies on disk, named by the hash of their contents"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+    def _file(self, content_hash):
+        return self.path / content_hash[:2] / f"{content_hash}.html"
+
+    def put(self, content_html):
+        """Store a post body (if not already there) and return its hash"""
+        content_hash = hash_text(content_html)
+        path = self._file(content_hash)
+        if not path.exists():
+            write_atomic(path, content_html.encode('utf-8'))
+        return content_hash
+
+    def has(self, content_hash):
+        return bool(content_hash) and self._file(content_hash).exists()
+
+    def get(self, content_hash):
+        """The stored body, or None if it is missing"""
+        try:
+            return self._file(content_hash).read_text(encoding='utf-8')
+        except (FileNotFoundError, TypeError):
+            return None
+
+    def discard(self, content_hashes):
+        """Delete bodies no post refers to any more"""
+        for content_hash in content_hashes:
+            try:
+                os.unlink(self._file(content_hash))
+            except (FileNotFoundError, TypeError):
+                pass
+
+
+class FeedEntry:
+    """One post as the feeds show it; the body is only read from the store when written"""
+
+    def __init__(self, post_data, date, content_hash, store, site_url, site_root):
+        self.title = str(post_data.get('title', 'Untitled'))
+        self.url = f"{site_url}{site_root}{post_data.get('slug', 'untitled')}.html"
+        # None for posts without a date
+        self.date = date
+        self.excerpt = ' '.join(str(post_data.get('excerpt', '')).split())
+        self.author = str(post_data.get('author') or DEFAULT_AUTHOR)
+        self.tags = [str(tag) for tag in post_data.get('tags') or []]
+        self.content_hash = content_hash
+        self.store = store
+        self.site_url = site_url
+
+    def content_html(self):
+        content = self.store.get(self.content_hash)
+        if content is None:
+            return escape(self.excerpt)
+        return absolute_urls(content, self.site_url)
+
+
+class Feed:
+    """The channel-level details shared by all three formats"""
+
+    def __init__(self, entries, site_url=SITE_URL, site_root="/blog/"):
+        self.entries = entries
+        self.home_url = f"{site_url}{site_root}"
+        self.urls = {kind: f"{site_url}{site_root}{name}" for kind, name, _ in FEED_FILES}
+        dates = [entry.date for entry in entries if entry.date is not None]
+        # The newest post's date, so rebuilding the same posts gives the same bytes
+        self.updated = max(dates) if dates else datetime(1970, 1, 1)
+
+    def chunks(self, kind):
+        """The feed in the given format, as UTF-8 byte chunks"""
+        return {'rss': self.rss_chunks, 'atom': self.atom_chunks, 'json': self.json_chunks}[kind]()
+
+    def rss_chunks(self):
+        yield (f'<?xml version="1.0" encoding="utf-8"?>\n'
+               f'<rss version="2.0" xmlns:atom="http://www.w3.org/2005/Atom" '
+               f'xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+               f'xmlns:dc="http://purl.org/dc/elements/1.1/">\n'
+               f'<channel>\n'
+               f'<title>{escape(FEED_TITLE)}</title>\n'
+               f'<link>{escape(self.home_url)}</link>\n'
+               f'<description>{escape(FEED_DESCRIPTION)}</description>\n'
+               f'<language>en</language>\n'
+               f'<lastBuildDate>{rfc822(self.updated)}</lastBuildDate>\n'
+               f'<atom:link href={quoteattr(self.urls["rss"])} rel="self" type="application/rss+xml"/>\n'
+               ).encode('utf-8')
+        for entry in self.entries:
+            parts = ['<item>\n',
+                     f'<title>{escape(entry.title)}</title>\n',
+                     f'<link>{escape(entry.url)}</link>\n',
+                     f'<guid isPermaLink="true">{escape(entry.url)}</guid>\n']
+            if entry.date is not None:
+                parts.append(f'<pubDate>{rfc822(entry.date)}</pubDate>\n')
+            parts.append(f'<dc:creator>{escape(entry.author)}</dc:creator>\n')
+            parts += [f'<category>{escape(tag)}</category>\n' for tag in entry.tags]
+            parts.append(f'<description>{escape(entry.excerpt)}</description>\n')
+            parts.append(f'<content:encoded>{escape(entry.content_html())}</content:encoded>\n')
+            parts.append('</item>\n')
+            yield ''.join(parts).encode('utf-8')
+        yield b'</channel>\n</rss>\n'
+
+    def atom_chunks(self):
+        yield (f'<?xml version="1.0" encoding="utf-8"?>\n'
+               f'<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="en">\n'
+               f'<title>{escape(FEED_TITLE)}</title>\n'
+               f'<subtitle>{escape(FEED_DESCRIPTION)}</subtitle>\n'
+               f'<link href={quoteattr(self.home_url)}/>\n'
+               f'<link href={quoteattr(self.urls["atom"])} rel="self" type="application/atom+xml"/>\n'
+               f'<id>{escape(self.home_url)}</id>\n'
+               f'<updated>{rfc3339(self.updated)}</updated>\n'
+               f'<author><name>{escape(DEFAULT_AUTHOR)}</name></author>\n'
+               ).encode('utf-8')
+        for entry in self.entries:
+            # Atom requires a date on every entry; undated posts take the feed's
+            date = rfc3339(entry.date if entry.date is not None else self.updated)
+            parts = ['<entry>\n',
+                     f'<title>{escape(entry.title)}</title>\n',
+                     f'<link href={quoteattr(entry.url)}/>\n',
+                     f'<id>{escape(entry.url)}</id>\n',
+                     f'<published>{date}</published>\n',
+                     f'<updated>{date}</updated>\n',
+                     f'<author><name>{escape(entry.author)}</name></author>\n']
+            parts += [f'<category term={quoteattr(tag)}/>\n' for tag in entry.tags]
+            if entry.excerpt:
+                parts.append(f'<summary>{escape(entry.excerpt)}</summary>\n')
+            parts.append(f'<content type="html">{escape(entry.content_html())}</content>\n')
+            parts.append('</entry>\n')
+            yield ''.join(parts).encode('utf-8')
+        yield b'</feed>\n'
+
+    def json_chunks(self):
+        head = json.dumps({
+            'version': 'https://jsonfeed.org/version/1.1',
+            'title': FEED_TITLE,
+            'home_page_url': self.home_url,
+            'feed_url': self.urls['json'],
+            'description': FEED_DESCRIPTION,
+            'language': 'en',
+            'authors': [{'name': DEFAULT_AUTHOR}]
+        }, ensure_ascii=False, indent=1)
+        # Open the items array where the head object closes
+        yield f'{head[:-2]},\n "items": [\n'.encode('utf-8')
+        for number, entry in enumerate(self.entries):
+            item = {
+                'id': entry.url,
+                'url': entry.url,
+                'title': entry.title,
+                'content_html': entry.content_html(),
+                'authors': [{'name': entry.author}]
+            }
+            if entry.excerpt:
+                item['summary'] = entry.excerpt
+            if entry.date is not None:
+                item['date_published'] = rfc3339(entry.date)
+            if entry.tags:
+                item['tags'] = entry.tags
+            separator = ',\n' if number else ''
+            yield f"{separator}  {json.dumps(item, ensure_ascii=False)}".encode('utf-8')
+        yield b'\n ]\n}\n'
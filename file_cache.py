@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+In-memory cache of the files serve.py hands out.
+
+Every file served gets an entry holding a strong ETag (a hash of its
+contents) and, for files up to max_file_bytes, the contents themselves, so
+hot pages, stylesheets and thumbnails are answered without touching the
+disk. Larger files (full-size images) are opened per response and sent with
+sendfile(). Entries are checked against the file's current (inode, size,
+mtime) on every lookup, so a rebuild - or an in-place edit of a hardlinked
+asset (--link-assets) - is picked up by the very next request. Cached
+contents are evicted least recently used first once they exceed max_bytes.
+
+Small files are read into bytes rather than memory-mapped: a map keeps its
+file descriptor open for as long as the entry lives, and an LRU of
+thousands of small files would run the server out of descriptors.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_signature(stat):
+    """What must stay the same for a cached entry to still describe the file"""
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+class CachedFile:
+    """The ETag, metadata and (for small files) contents of one file"""
+
+    def __init__(self, path, stat, etag, data=None):
+        self.path = path
+        self.signature = file_signature(stat)
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.etag = etag
+        self.data = data
+
+
+class FileBody:
+    """A byte range of a served file, written to the socket without copying"""
+
+    def __init__(self, entry, file=None, start=0, length=None):
+        self.entry = entry
+        self.file = file
+        self.start = start
+        self.length = entry.size - start if length is None else length
+
+    def write_to(self, connection, wfile):
+        if self.entry.data is not None:
+            wfile.write(memoryview(self.entry.data)[self.start:self.start + self.length])
+        elif self.length:
+            connection.sendfile(self.file, self.start, self.length)
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+
+
+class FileCache:
+    """Thread-safe LRU of CachedFile entries, bounded by the bytes of contents held"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_file_bytes=1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.entries = OrderedDict()
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def open(self, path):
+        """Return (CachedFile, open file or None) for the current contents of path
+
+        Small files come back with their contents and no file; larger ones come with an
+        open file whose contents are exactly what the entry's ETag describes,
+        ready for sendfile(). Raises OSError if the file can't be read.
+        """
+        entry = self.lookup(path, file_signature(os.stat(path)))
+        if entry is not None and entry.data is not None:
+            return entry, None
+
+        f = open(path, 'rb')
+        try:
+            # fstat the open file, so a rename between stat() and open() can't
+            # pair this file with another version's entry
+            stat = os.fstat(f.fileno())
+            entry = self.lookup(path, file_signature(stat))
+            if entry is None:
+                # Load outside the lock so one slow file doesn't stall every other request
+                entry = self.store(self.load(path, f, stat))
+            if entry.data is not None:
+                f.close()
+                return entry, None
+            return entry, f
+        except BaseException:
+            f.close()
+            raise
+
+    def lookup(self, path, signature):
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is None or entry.signature != signature:
+                return None
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return entry
+
+    def store(self, entry):
+        with self.lock:
+            self.misses += 1
+            old = self.entries.pop(entry.path, None)
+            if old is not None and old.data is not None:
+                self.cached_bytes -= len(old.data)
+            self.entries[entry.path] = entry
+            if entry.data is not None:
+                self.cached_bytes += len(entry.data)
+            while self.cached_bytes > self.max_bytes and len(self.entries) > 1:
+                _, evicted = self.entries.popitem(last=False)
+                if evicted.data is not None:
+                    self.cached_bytes -= len(evicted.data)
+        return entry
+
+    def load(self, path, f, stat):
+        """Hash (and, if small enough, keep) the contents of an open file"""
+        if stat.st_size <= self.max_file_bytes:
+            data = f.read()
+            return CachedFile(path, stat, make_etag(hashlib.sha256(data)), data)
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+        # sendfile() takes explicit offsets, but leave the file where a reader expects it
+        f.seek(0)
+        return CachedFile(path, stat, make_etag(digest))
+
+    def stats(self):
+        with self.lock:
+            return {'entries': len(self.entries), 'cached_bytes': self.cached_bytes,
+                    'hits': self.hits, 'misses': self.misses}
+
+
+def make_etag(digest):
+    """A strong ETag from a content hash"""
+    return f'"{digest.hexdigest()[:32]}"'
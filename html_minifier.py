@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+HTML minification for the QRTick blog's generated pages.
+
+minify_html() strips comments, collapses runs of whitespace in text and tags
+to a single character, and swaps known inline style="..." attributes for
+classes. The contents of <pre>, <textarea>, <script> and <style> elements are
+copied verbatim, so code blocks render exactly as before.
+
+Only whitespace that HTML itself collapses is touched (a run always keeps one
+space or newline), and hoisted declarations are marked !important so the
+class still beats the stylesheet rules the inline style used to override.
+"""
+
+import re
+
+from build_manifest import hash_text
+
+# HTML's whitespace characters (unlike \s, this leaves &nbsp; as U+00A0 alone)
+WHITESPACE = re.compile(r'[ \t\n\r\f]+')
+
+TOKEN = re.compile(r"""
+    (?P<comment><!--.*?-->)
+  | (?P<raw><(?P<raw_name>pre|textarea|script|style)\b(?:[^>"']|"[^"]*"|'[^']*')*>.*?</(?P=raw_name)[ \t\n\r\f]*>)
+  | (?P<tag><[!/?a-zA-Z](?:[^>"']|"[^"]*"|'[^']*')*>)
+""", re.S | re.I | re.X)
+
+TAG_WHITESPACE = re.compile(r"""("[^"]*"|'[^']*')|[ \t\n\r\f]+""")
+STYLE_ATTRIBUTE = re.compile(r'[ \t\n\r\f]+style="([^"]*)"')
+CLASS_ATTRIBUTE = re.compile(r'([ \t\n\r\f]class=")([^"]*)(")')
+
+
+def collapse_whitespace(text):
+    """Collapse each whitespace run to a newline (if it had one) or a single space"""
+    return WHITESPACE.sub(lambda m: '\n' if '\n' in m.group() else ' ', text)
+
+
+def inline_styles(html):
+    """Return the distinct style attribute values in html, in document order"""
+    styles = []
+    for match in STYLE_ATTRIBUTE.finditer(html):
+        if match.group(1) not in styles:
+            styles.append(match.group(1))
+    return styles
+
+
+def style_class_name(style):
+    """A stable class name for an inline style"""
+    return f"st-{hash_text(style)[:8]}"
+
+
+def split_declarations(style):
+    """Split a style attribute into declarations, ignoring ';' inside () and quotes"""
+    declarations = []
+    current = []
+    depth = 0
+    quote = None
+    for char in style:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth = max(0, depth - 1)
+        elif char == ';' and depth == 0:
+            declarations.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    declarations.append(''.join(current).strip())
+    return [declaration for declaration in declarations if declaration]
+
+
+def hoisted_css(style_classes):
+    """CSS rules for {inline style: class name}, one per line"""
+    rules = []
+    for style, class_name in style_classes.items():
+        declarations = ';'.join(f"{declaration} !important" for declaration in split_declarations(style))
+        rules.append(f".{class_name}{{{declarations}}}\n")
+    return ''.join(rules)
+
+
+def minify_tag(tag, style_classes):
+    if style_classes:
+        match = STYLE_ATTRIBUTE.search(tag)
+        if match and match.group(1) in style_classes:
+            class_name = style_classes[match.group(1)]
+            tag = tag[:match.start()] + tag[match.end():]
+            if CLASS_ATTRIBUTE.search(tag):
+                tag = CLASS_ATTRIBUTE.sub(lambda m: f"{m.group(1)}{m.group(2)} {class_name}{m.group(3)}", tag, count=1)
+            else:
+                tag = f"{tag[:match.start()]} class=\"{class_name}\"{tag[match.start():]}"
+    tag = TAG_WHITESPACE.sub(lambda m: m.group(1) or ' ', tag)
+    return re.sub(r' (?=/?>$)', '', tag)
+
+
+def minify_html(html, style_classes=None):
+    """Minify an HTML document, replacing the inline styles in style_classes with classes"""
+    parts = []
+    text = []
+    position = 0
+    for match in TOKEN.finditer(html):
+        text.append(html[position:match.start()])
+        position = match.end()
+        comment = match.group('comment')
+        # Drop comments (keeping conditional ones), merging the text around them
+        if comment and not comment.startswith('<!--['):
+            continue
+        parts.append(collapse_whitespace(''.join(text)))
+        text = []
+        if comment or match.group('raw'):
+            parts.append(match.group())
+        else:
+            parts.append(minify_tag(match.group('tag'), style_classes))
+    text.append(html[position:])
+    parts.append(collapse_whitespace(''.join(text)))
+    return ''.join(parts).strip() + '\n'
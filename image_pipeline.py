@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Responsive image variants for the QRTick blog generator.
+
+For every raster image under images/ this produces resized copies at a few
+standard widths plus WebP versions, caches them by the source image's hash
+so each is only ever produced once, and records the intrinsic size of every
+image so rendered <img> tags can carry srcset/sizes and width/height.
+
+Requires Pillow; without it images are published unchanged.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from asset_sync import SyncResult, sync_file
+from build_manifest import file_signature, hash_file
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+RESPONSIVE_WIDTHS = (480, 800, 1200)
+RASTER_SUFFIXES = {'.jpg', '.jpeg', '.png', '.webp'}
+
+# Rendered width of the post content column (800px container minus 2rem padding)
+CONTENT_SIZES = "(max-width: 800px) 100vw, 736px"
+
+IMG_TAG = re.compile(r'<img\b[^>]*>')
+IMG_ATTR = re.compile(r'([\w-]+)="([^"]*)"')
+
+
+def variant_name(relative_path, width, suffix):
+    """Published path of a variant, e.g. dir/photo-800w.webp"""
+    relative_path = Path(relative_path)
+    return str(relative_path.with_name(f"{relative_path.stem}-{width}w{suffix}"))
+
+
+def _render_variants(source, cache_dir, source_hash, widths):
+    """Produce any missing variants for one image; runs in a worker process"""
+    variants = []
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        width, height = image.size
+        suffix = Path(source).suffix.lower()
+        targets = [w for w in widths if w < width]
+
+        for target in targets + [width]:
+            for variant_suffix in ([suffix] if target != width else []) + (['.webp'] if suffix != '.webp' else []):
+                cache_file = Path(cache_dir) / f"{source_hash}-{target}w{variant_suffix}"
+                if not cache_file.exists():
+                    if target == width:
+                        resized = image
+                    else:
+                        resized = image.resize((target, max(1, round(height * target / width))), Image.LANCZOS)
+                    save_image(resized, cache_file, variant_suffix)
+                variants.append({'width': target, 'suffix': variant_suffix, 'file': cache_file.name})
+
+    return {'width': width, 'height': height, 'variants': variants}
+
+
+def save_image(image, path, suffix):
+    """Write an image variant atomically in a web-friendly encoding"""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    if suffix in ('.jpg', '.jpeg'):
+        image.convert('RGB').save(tmp, 'JPEG', quality=82, optimize=True, progressive=True)
+    elif suffix == '.png':
+        image.save(tmp, 'PNG', optimize=True)
+    else:
+        image.save(tmp, 'WEBP', quality=80, method=4)
+    os.replace(tmp, path)
+
+
+class ImagePipeline:
+    """Builds, caches and publishes responsive variants of the blog's images"""
+
+    def __init__(self, source_dir, cache_dir, widths=RESPONSIVE_WIDTHS):
+        self.source_dir = Path(source_dir)
+        self.cache_dir = Path(cache_dir)
+        self.widths = tuple(widths)
+        self.index_path = self.cache_dir / "index.json"
+        # relative path -> {'signature', 'hash', 'width', 'height', 'variants'}
+        self.images = {}
+
+    @property
+    def enabled(self):
+        return Image is not None
+
+    def load(self):
+        """Load the image metadata recorded by the last build without rebuilding"""
+        if self.enabled:
+            self.images = self._load_index()
+        return self.images
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_index(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(self.index_path.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.images, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.index_path)
+
+    def build(self, jobs=1):
+        """Make sure every raster image has its variants in the cache
+
+        Variants are produced in a pool of `jobs` worker processes, with at
+        most two images in flight per worker so memory use stays bounded.
+        """
+        if not self.enabled:
+            return self.images
+
+        previous = self._load_index()
+        images = {}
+        work = []
+        for source in sorted(self.source_dir.rglob("*")):
+            if not source.is_file() or source.suffix.lower() not in RASTER_SUFFIXES:
+                continue
+            relative = source.relative_to(self.source_dir).as_posix()
+            signature = file_signature(source)
+            entry = previous.get(relative)
+            if entry and entry['signature'] == signature and all(
+                    (self.cache_dir / variant['file']).exists() for variant in entry['variants']):
+                images[relative] = entry
+                continue
+            source_hash = hash_file(source)
+            if entry and entry['hash'] == source_hash and all(
+                    (self.cache_dir / variant['file']).exists() for variant in entry['variants']):
+                images[relative] = dict(entry, signature=signature)
+                continue
+            work.append((relative, source, signature, source_hash))
+
+        if work:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for (relative, _, signature, source_hash), info in zip(work, self._run(work, jobs)):
+                if isinstance(info, Exception):
+                    print(f"⚠️  Could not create variants for {relative}: {info}")
+                    continue
+                images[relative] = dict(info, signature=signature, hash=source_hash)
+            print(f"🖼️  Created responsive variants for {len(work)} image(s)")
+
+        self.images = images
+        self._save_index()
+        self._remove_unused_variants()
+        return images
+
+    def _run(self, work, jobs):
+        args = [(str(source), str(self.cache_dir), source_hash, self.widths)
+                for _, source, _, source_hash in work]
+        if jobs <= 1 or len(work) == 1:
+            results = []
+            for arg in args:
+                try:
+                    results.append(_render_variants(*arg))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        results = [None] * len(args)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            in_flight = {}
+            position = 0
+            while position < len(args) or in_flight:
+                while position < len(args) and len(in_flight) < jobs * 2:
+                    in_flight[pool.submit(_render_variants, *args[position])] = position
+                    position += 1
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    try:
+                        results[index] = future.result()
+                    except Exception as e:
+                        results[index] = e
+        return results
+
+    def _remove_unused_variants(self):
+        """Drop cached variants that no current image refers to"""
+        if not self.cache_dir.exists():
+            return
+        used = {variant['file'] for entry in self.images.values() for variant in entry['variants']}
+        for path in self.cache_dir.iterdir():
+            if path.name != self.index_path.name and path.name not in used:
+                path.unlink()
+
+    def published_variants(self):
+        """Return {published relative path: cached variant file}"""
+        published = {}
+        for relative, entry in self.images.items():
+            for variant in entry['variants']:
+                name = variant_name(relative, variant['width'], variant['suffix'])
+                published[name] = self.cache_dir / variant['file']
+        return published
+
+    def publish(self, output_dir, link=False):
+        """Copy the cached variants next to the published originals"""
+        result = SyncResult()
+        for name, cache_file in sorted(self.published_variants().items()):
+            existed = (Path(output_dir) / name).exists()
+            copied = sync_file(cache_file, Path(output_dir) / name, link=link)
+            if copied is None:
+                result.unchanged += 1
+            else:
+                result.copied.append(name)
+                if not existed:
+                    result.added.append(name)
+                result.bytes_copied += copied
+        return result
+
+    def dependencies(self, relative_paths):
+        """Return {relative path: source hash} for the given images"""
+        return {path: self.images[path]['hash'] for path in relative_paths if path in self.images}
+
+    def rewrite_images(self, html, url_prefix):
+        """Add srcset/sizes, intrinsic size and lazy loading to <img> tags
+
+        Returns (html, [relative paths of the local images referenced]).
+        """
+        referenced = []
+
+        def rewrite(match):
+            attrs = dict(IMG_ATTR.findall(match.group(0)))
+            src = attrs.get('src', '')
+            attrs.setdefault('loading', 'lazy')
+            attrs.setdefault('decoding', 'async')
+
+            relative = src[len(url_prefix):] if src.startswith(url_prefix) else None
+            entry = self.images.get(relative) if relative else None
+            if relative:
+                referenced.append(relative)
+            if not entry:
+                return _img_tag(attrs)
+
+            suffix = Path(relative).suffix.lower()
+            widths = {}
+            for variant in entry['variants']:
+                widths.setdefault(variant['suffix'], []).append(variant['width'])
+
+            def srcset(variant_suffix):
+                candidates = [f"{url_prefix}{variant_name(relative, w, variant_suffix)} {w}w"
+                              for w in sorted(widths.get(variant_suffix, []))]
+                if variant_suffix == suffix:
+                    candidates.append(f"{src} {entry['width']}w")
+                return ', '.join(candidates)
+
+            attrs['srcset'] = srcset(suffix)
+            attrs['sizes'] = CONTENT_SIZES
+            attrs['width'] = str(entry['width'])
+            attrs['height'] = str(entry['height'])
+            img = _img_tag(attrs)
+            if '.webp' not in widths or suffix == '.webp':
+                return img
+            return (f'<picture><source type="image/webp" srcset="{srcset(".webp")}" '
+                    f'sizes="{CONTENT_SIZES}">{img}</picture>')
+
+        return IMG_TAG.sub(rewrite, html), referenced
+
+
+def _img_tag(attrs):
+    return '<img ' + ' '.join(f'{name}="{value}"' for name, value in attrs.items()) + '>'
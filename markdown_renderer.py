@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Shared markdown rendering for the QRTick blog generators.
+
+Building a markdown.Markdown instance loads and configures every extension,
+which costs far more than converting a typical post. MarkdownRenderer builds
+one processor per extension configuration, resets it before every document
+so toc/footnote/abbr state can't leak from one post into the next, and goes
+through the on-disk render cache when one is given.
+"""
+
+import html
+import re
+
+import markdown
+
+HEADING = re.compile(r'<h([1-6])([^>]*)>(.*?)</h\1>', re.DOTALL)
+HEADING_ID = re.compile(r'\sid="([^"]*)"')
+TAG = re.compile(r'<[^>]+>')
+
+
+def extract_headings(content_html):
+    """Return [{'level', 'id', 'name'}] for every heading in an HTML fragment"""
+    headings = []
+    for level, attrs, inner in HEADING.findall(content_html):
+        anchor = HEADING_ID.search(attrs)
+        headings.append({
+            'level': int(level),
+            'id': anchor.group(1) if anchor else None,
+            'name': html.unescape(TAG.sub('', inner)).strip()
+        })
+    return headings
+
+
+class MarkdownRenderer:
+    """Converts markdown documents with reusable, per-configuration processors"""
+
+    def __init__(self, render_cache=None):
+        self.render_cache = render_cache
+        # tuple(extensions) -> markdown.Markdown, built on first use
+        self._processors = {}
+
+    def processor(self, extensions=()):
+        """Return the shared processor for an extension list, building it once"""
+        key = tuple(extensions)
+        processor = self._processors.get(key)
+        if processor is None:
+            processor = self._processors[key] = markdown.Markdown(extensions=list(key))
+        return processor
+
+    def convert(self, markdown_text, extensions=()):
+        """Convert one document without the cache, returning its render artifacts"""
+        processor = self.processor(extensions)
+        processor.reset()
+        content_html = processor.convert(markdown_text)
+        return {
+            'html': content_html,
+            'toc': getattr(processor, 'toc', ''),
+            'toc_tokens': getattr(processor, 'toc_tokens', []),
+            'headings': extract_headings(content_html),
+            'word_count': len(markdown_text.split())
+        }
+
+    def render(self, markdown_text, extensions=()):
+        """Render one document, converting it only on a render cache miss
+
+        Returns a dict with 'html', 'toc', 'toc_tokens', 'headings' and
+        'word_count'.
+        """
+        cache = self.render_cache
+        if cache is None:
+            return self.convert(markdown_text, extensions)
+
+        key = cache.key(markdown_text, extensions)
+        entry = cache.get(key)
+        if entry is not None:
+            cache.hits += 1
+            return entry
+
+        cache.misses += 1
+        entry = self.convert(markdown_text, extensions)
+        cache.put(key, entry)
+        return entry
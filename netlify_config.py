@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Netlify header and redirect rules, applied locally by serve.py.
+
+Reads the same files Netlify does: `_headers` and `_redirects` from the
+publish directory (falling back to the repo's own `_headers` before the
+generator has published one) plus the [[headers]] and [[redirects]] tables
+of netlify.toml. Paths use Netlify's syntax: `*` is a splat matching
+anything, `:name` matches one path segment.
+
+Like Netlify, every header rule whose path matches applies. When several
+rules set the same header, their values are joined with ", " - which is how
+a `/*` max-age=31536000 rule and a `/*.html` max-age=3600 rule end up both in
+the Cache-Control of every HTML page.
+"""
+
+import json
+import re
+import threading
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+# HTML cached for longer than this (the max-age the repo's rules intend) gets a warning
+HTML_MAX_AGE_LIMIT = 3600
+
+MAX_AGE = re.compile(r'(?:^|[,\s])(?:s-)?max-age=(\d+)', re.I)
+
+
+def path_pattern(path):
+    """Compile a Netlify path (with * splats and :placeholders) into a regex"""
+    parts = []
+    for token in re.split(r'(\*|:[A-Za-z_][A-Za-z0-9_]*)', path):
+        if token == '*':
+            parts.append('(?P<splat>.*)' if '(?P<splat>' not in ''.join(parts) else '.*')
+        elif token.startswith(':') and len(token) > 1:
+            parts.append(f'(?P<{token[1:]}>[^/]+)')
+        else:
+            parts.append(re.escape(token))
+    pattern = ''.join(parts)
+    # "/blog/*" also matches "/blog", as it does on Netlify
+    pattern = re.sub(r'/\(\?P<splat>\.\*\)$', '(?:/(?P<splat>.*))?', pattern)
+    return re.compile(pattern + '$')
+
+
+class HeaderRule:
+    """Headers to add to every response whose path matches"""
+
+    def __init__(self, path, headers, source):
+        self.path = path
+        self.pattern = path_pattern(path)
+        self.headers = headers
+        self.source = source
+
+    def __str__(self):
+        return f"{self.source} {self.path}"
+
+
+class RedirectRule:
+    """A redirect (3xx) or rewrite (200) from one path pattern to another"""
+
+    def __init__(self, path, to, status=301, force=False, source='netlify.toml'):
+        self.path = path
+        self.pattern = path_pattern(path)
+        self.to = to
+        self.status = status
+        self.force = force
+        self.source = source
+
+    def target(self, match):
+        """The destination for a matched path, with :splat and :placeholders filled in"""
+        values = {name: value or '' for name, value in match.groupdict().items()}
+        return re.sub(r':([A-Za-z_][A-Za-z0-9_]*)', lambda m: values.get(m.group(1), m.group()), self.to) or '/'
+
+    def __str__(self):
+        return f"{self.source} {self.path} -> {self.to} {self.status}{'!' if self.force else ''}"
+
+
+def parse_headers_file(text, source='_headers'):
+    """Parse Netlify's _headers format: a path line, then indented 'Name: value' lines"""
+    rules = []
+    current = None
+    for number, line in enumerate(text.splitlines(), start=1):
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if not line[0].isspace():
+            current = HeaderRule(stripped, [], source)
+            rules.append(current)
+        elif current is not None and ':' in stripped:
+            name, _, value = stripped.partition(':')
+            current.headers.append((name.strip(), value.strip()))
+        else:
+            raise ValueError(f"{source}:{number}: expected 'Name: value' under a path")
+    return rules
+
+
+def parse_redirects_file(text, source='_redirects'):
+    """Parse Netlify's _redirects format: 'from to [status][!]' per line"""
+    rules = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        fields = line.split('#', 1)[0].split()
+        if not fields:
+            continue
+        if len(fields) < 2:
+            raise ValueError(f"{source}:{number}: expected 'from to [status]'")
+        status, force = 301, False
+        if len(fields) > 2 and fields[2].rstrip('!').isdigit():
+            status = int(fields[2].rstrip('!'))
+            force = fields[2].endswith('!')
+        rules.append(RedirectRule(fields[0], fields[1], status, force, source))
+    return rules
+
+
+def parse_netlify_toml(text, source='netlify.toml'):
+    """Return (header rules, redirect rules) from netlify.toml"""
+    config = tomllib.loads(text) if tomllib is not None else parse_minimal_toml(text)
+    headers = [HeaderRule(entry['for'], [(name, str(value)) for name, value in entry.get('values', {}).items()],
+                          f"{source} [[headers]]")
+               for entry in config.get('headers', [])]
+    redirects = [RedirectRule(entry['from'], entry['to'], int(entry.get('status', 301)),
+                              bool(entry.get('force', False)), f"{source} [[redirects]]")
+                 for entry in config.get('redirects', [])]
+    return headers, redirects
+
+
+def parse_minimal_toml(text):
+    """Parse the subset of TOML netlify.toml uses, for Pythons without tomllib or tomli
+
+    Handles [tables], [[arrays of tables]], dotted table names, and key =
+    value pairs holding strings, integers, booleans or one-line arrays.
+    """
+    root = {}
+    table = root
+    for number, raw_line in enumerate(text.splitlines(), start=1):
+        line = _strip_toml_comment(raw_line).strip()
+        if not line:
+            continue
+        header = re.match(r'^(\[\[?)\s*([^\]]+?)\s*(\]\]?)$', line)
+        if header:
+            names = [name.strip().strip('"') for name in header.group(2).split('.')]
+            table = root
+            for name in names[:-1]:
+                table = table.setdefault(name, {})
+                if isinstance(table, list):
+                    table = table[-1]
+            if header.group(1) == '[[':
+                table = table.setdefault(names[-1], [])
+                table.append({})
+                table = table[-1]
+            else:
+                table = table.setdefault(names[-1], {})
+                if isinstance(table, list):
+                    table = table[-1]
+            continue
+        key, separator, value = line.partition('=')
+        if not separator:
+            raise ValueError(f"netlify.toml:{number}: expected 'key = value'")
+        table[key.strip().strip('"')] = _parse_toml_value(value.strip(), number)
+    return root
+
+
+def _strip_toml_comment(line):
+    quote = None
+    for index, char in enumerate(line):
+        if quote:
+            if char == '\\' and quote == '"':
+                continue
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '#':
+            return line[:index]
+    return line
+
+
+def _parse_toml_value(value, number):
+    if value.startswith('"'):
+        return json.loads(value)
+    if value.startswith("'") and value.endswith("'"):
+        return value[1:-1]
+    if value in ('true', 'false'):
+        return value == 'true'
+    if re.match(r'^[+-]?\d[\d_]*$', value):
+        return int(value.replace('_', ''))
+    if value.startswith('[') and value.endswith(']'):
+        items = re.findall(r'"(?:[^"\\]|\\.)*"|\'[^\']*\'|[^,\s][^,]*', value[1:-1])
+        return [_parse_toml_value(item.strip(), number) for item in items]
+    raise ValueError(f"netlify.toml:{number}: unsupported value {value!r}")
+
+
+def max_age(cache_control):
+    """The longest max-age/s-max-age in a Cache-Control value, or None"""
+    ages = [int(age) for age in MAX_AGE.findall(cache_control or '')]
+    return max(ages) if ages else None
+
+
+class NetlifyRules:
+    """The header and redirect rules for a publish directory, reloaded when their files change"""
+
+    def __init__(self, publish_dir, root='.'):
+        self.publish_dir = Path(publish_dir)
+        self.root = Path(root)
+        self.header_rules = []
+        self.redirect_rules = []
+        self.sources = []
+        self._signature = None
+        self.lock = threading.Lock()
+        self.refresh()
+
+    def files(self):
+        """The (kind, path) of every rule file, in the order Netlify applies them"""
+        headers = self.publish_dir / "_headers"
+        if not headers.exists():
+            headers = self.root / "_headers"
+        return [('headers', headers),
+                ('redirects', self.publish_dir / "_redirects"),
+                ('toml', self.root / "netlify.toml")]
+
+    def refresh(self):
+        """Reload the rules if any of their files changed; returns True if reloaded"""
+        files = self.files()
+        signature = []
+        for _, path in files:
+            try:
+                stat = path.stat()
+                signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((str(path), None, None))
+        with self.lock:
+            if signature == self._signature:
+                return False
+            header_rules, redirect_rules, sources = [], [], []
+            for kind, path in files:
+                if not path.exists():
+                    continue
+                text = path.read_text(encoding='utf-8')
+                if kind == 'headers':
+                    header_rules += parse_headers_file(text, str(path))
+                elif kind == 'redirects':
+                    redirect_rules += parse_redirects_file(text, str(path))
+                else:
+                    toml_headers, toml_redirects = parse_netlify_toml(text, str(path))
+                    header_rules += toml_headers
+                    redirect_rules += toml_redirects
+                sources.append(str(path))
+            self.header_rules, self.redirect_rules, self.sources = header_rules, redirect_rules, sources
+            self._signature = signature
+            return True
+
+    def headers_for(self, path):
+        """Return ([(name, value)], [matching rules]) for a URL path, merging repeated headers"""
+        merged = {}
+        names = {}
+        matched = []
+        for rule in self.header_rules:
+            if not rule.pattern.match(path):
+                continue
+            matched.append(rule)
+            for name, value in rule.headers:
+                key = name.lower()
+                names.setdefault(key, name)
+                values = merged.setdefault(key, [])
+                if value not in values:
+                    values.append(value)
+        return [(names[key], ', '.join(values)) for key, values in merged.items()], matched
+
+    def redirect_for(self, path, exists):
+        """Return (rule, target) for the first redirect that applies to path, or None
+
+        exists(path) says whether a file is published there; as on Netlify,
+        an existing file shadows the rule unless it is forced ('!').
+        """
+        for rule in self.redirect_rules:
+            match = rule.pattern.match(path)
+            if match and (rule.force or not exists(path)):
+                return rule, rule.target(match)
+        return None
+
+    def long_cached_html(self, paths):
+        """Return [(path, max-age, Cache-Control)] for HTML paths cached longer than HTML_MAX_AGE_LIMIT"""
+        results = []
+        for path in paths:
+            headers, _ = self.headers_for(path)
+            cache_control = dict((name.lower(), value) for name, value in headers).get('cache-control')
+            age = max_age(cache_control)
+            if age is not None and age > HTML_MAX_AGE_LIMIT:
+                results.append((path, age, cache_control))
+        return results
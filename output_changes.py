@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Change tracking for the QRTick blog output directory.
+
+Every file the generator publishes goes through OutputChanges, which writes
+atomically (temp file + rename), leaves files that already hold the same
+bytes untouched so their mtimes survive, and records what was added,
+modified and deleted. The resulting list is saved after each build so the
+deploy step can upload and purge only what actually changed.
+"""
+
+import filecmp
+import hashlib
+import json
+import os
+from pathlib import Path
+
+
+def write_atomic(path, data):
+    """Replace path with data via a temp file and rename, so readers never see a partial file"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+class OutputChanges:
+    """Files added, modified and deleted in the output directory by one build"""
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.added = set()
+        self.modified = set()
+        self.deleted = set()
+
+    def _relative(self, path):
+        return Path(path).relative_to(self.output_dir).as_posix()
+
+    def record(self, path, existed):
+        """Note that path was just written; existed says whether it was there before"""
+        relative = self._relative(path)
+        if relative in self.deleted:
+            self.deleted.discard(relative)
+            self.modified.add(relative)
+        elif existed and relative not in self.added:
+            self.modified.add(relative)
+        else:
+            self.added.add(relative)
+
+    def write(self, path, data):
+        """Write bytes to path unless it already holds exactly them; True if written"""
+        path = Path(path)
+        try:
+            existed = True
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            existed = False
+        write_atomic(path, data)
+        self.record(path, existed)
+        return True
+
+    def write_stream(self, path, chunks):
+        """Write an iterable of byte chunks to path unless it already holds exactly them
+
+        The chunks go straight to a temp file, so the output is never held in
+        memory whole. Returns (True if written, SHA-256 hex digest of the bytes).
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        digest = hashlib.sha256()
+        try:
+            with open(tmp, 'wb') as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+            existed = path.exists()
+            if existed and filecmp.cmp(tmp, path, shallow=False):
+                return False, digest.hexdigest()
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self.record(path, existed)
+        return True, digest.hexdigest()
+
+    def remove(self, path):
+        """Delete an output file and record the deletion"""
+        path = Path(path)
+        path.unlink()
+        relative = self._relative(path)
+        if relative in self.added:
+            # Created and deleted within the same build: nothing to deploy
+            self.added.discard(relative)
+        else:
+            self.modified.discard(relative)
+            self.deleted.add(relative)
+
+    def record_sync(self, result, directory):
+        """Record the files copied and removed by an asset_sync.SyncResult for directory"""
+        directory = Path(directory)
+        added = set(result.added)
+        for name in result.copied:
+            self.record(directory / name, existed=name not in added)
+        for name in result.removed:
+            relative = self._relative(directory / name)
+            self.added.discard(relative)
+            self.modified.discard(relative)
+            self.deleted.add(relative)
+
+    def __bool__(self):
+        return bool(self.added or self.modified or self.deleted)
+
+    def as_dict(self):
+        return {
+            'added': sorted(self.added),
+            'modified': sorted(self.modified),
+            'deleted': sorted(self.deleted)
+        }
+
+    def summary(self):
+        return f"{len(self.added)} added, {len(self.modified)} modified, {len(self.deleted)} deleted"
+
+    def save(self, directory):
+        """Write changed-files.json and changed-files.txt (one 'A|M|D<tab>path' per line)"""
+        directory = Path(directory)
+        changes = self.as_dict()
+        write_atomic(directory / "changed-files.json", (json.dumps(changes, indent=2) + '\n').encode('utf-8'))
+        lines = [f"{status}\t{path}\n"
+                 for status, key in (('A', 'added'), ('M', 'modified'), ('D', 'deleted'))
+                 for path in changes[key]]
+        write_atomic(directory / "changed-files.txt", ''.join(lines).encode('utf-8'))
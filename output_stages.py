@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Pluggable output stages for the QRTick blog pipeline.
+
+BlogGenerator reads, parses and renders every post once, and writes the post
+pages and the index itself. Output stages hook into that single pass to add
+extra markup to the pages it writes (AI/SEO meta tags, JSON-LD structured
+data, ...), so no second generator has to re-read blog/ and overwrite
+blog_html/ with its own copies of the same pages.
+"""
+
+
+class OutputStage:
+    """Base class for output stages; every hook returns markup to add to a page"""
+
+    name = None
+    # True if the stage emits its own <meta name="description"> in the <head>
+    replaces_description = False
+
+    def __init__(self, generator):
+        self.generator = generator
+
+    def fingerprint(self):
+        """A string that changes whenever the stage's output could change"""
+        return self.name
+
+    def post_head(self, post_data):
+        """Markup for the <head> of a post page"""
+        return ''
+
+    def index_head(self, posts):
+        """Markup for the <head> of the blog index"""
+        return ''
+
+    def listing_head(self, posts, title, path):
+        """Markup for the <head> of another listing page (path is relative to the blog root)"""
+        return ''
+
+
+def available_stages():
+    """Return {stage name: stage class} for every known stage"""
+    # Imported lazily: the AI stages' module builds on the generator itself
+    from blog_generator_ai_optimized import AIMetaTagsStage, StructuredDataStage
+    return {stage.name: stage for stage in (AIMetaTagsStage, StructuredDataStage)}
+
+
+def load_stages(names, generator):
+    """Instantiate the named stages, in order, for a generator"""
+    if not names:
+        return []
+    stages = available_stages()
+    unknown = [name for name in names if name not in stages]
+    if unknown:
+        raise ValueError(f"Unknown output stage(s): {', '.join(unknown)}")
+    return [stages[name](generator) for name in names]
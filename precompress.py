@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Precompressed siblings for the QRTick blog's text outputs.
+
+Writes page.html.br and page.html.gz next to every HTML, CSS, SVG, JSON and
+XML output at maximum compression, so a server can send the smallest
+encoding a client accepts without compressing on the fly. Each sibling gets
+its source's mtime, so a file whose mtime still matches its siblings (the
+generator leaves unchanged outputs untouched) is skipped on the next build.
+Encodings that would not make a file smaller are not written; they are
+recorded, with the file's mtime, in a state file outside the output so the
+file doesn't count as stale for lacking them. A sibling whose compressed
+bytes are already on disk is left alone.
+
+gzip output is deterministic (no embedded name or timestamp). Brotli needs
+the optional Brotli package; without it only .gz siblings are written.
+"""
+
+import gzip
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from output_changes import write_atomic
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = {'.html', '.css', '.svg', '.json', '.xml', '.js', '.txt'}
+PRECOMPRESSED_SUFFIXES = ('.br', '.gz')
+
+
+def encodings():
+    """Return [(sibling suffix, compress function)] for the available encoders"""
+    available = [('.gz', gzip_bytes)]
+    if brotli is not None:
+        available.insert(0, ('.br', brotli_bytes))
+    return available
+
+
+def gzip_bytes(data):
+    buffer = io.BytesIO()
+    # mtime=0 and an empty filename keep the output identical across builds
+    with gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=buffer, mtime=0) as f:
+        f.write(data)
+    return buffer.getvalue()
+
+
+def brotli_bytes(data):
+    return brotli.compress(data, quality=11)
+
+
+def compress_file(path):
+    """Write the compressed siblings of one file
+
+    Returns (original size, {suffix: (compressed size, sibling existed before,
+    sibling written)}). A sibling that would not be smaller than the file
+    itself is not written (and any old one is deleted); its size is reported
+    as None. A sibling that already holds the compressed bytes only gets its
+    mtime brought in line, and is not reported as written.
+    """
+    path = Path(path)
+    data = path.read_bytes()
+    stat = path.stat()
+    siblings = {}
+    for suffix, compress in encodings():
+        sibling = path.with_name(path.name + suffix)
+        compressed = compress(data)
+        existed = sibling.exists()
+        if len(compressed) >= len(data):
+            if existed:
+                sibling.unlink()
+            siblings[suffix] = (None, existed, False)
+            continue
+        written = not (existed and sibling.stat().st_size == len(compressed)
+                       and sibling.read_bytes() == compressed)
+        if written:
+            write_atomic(sibling, compressed)
+        if written or sibling.stat().st_mtime_ns != stat.st_mtime_ns:
+            os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        siblings[suffix] = (len(compressed), existed, written)
+    return len(data), siblings
+
+
+def is_current(path, skipped=None):
+    """True if every sibling of path was made from its current contents
+
+    skipped is the file's state entry, if any: {'mtime_ns', 'skipped'}, the
+    encodings left out when the file last had that mtime.
+    """
+    mtime = path.stat().st_mtime_ns
+    skipped_suffixes = skipped['skipped'] if skipped and skipped['mtime_ns'] == mtime else ()
+    for suffix, _ in encodings():
+        if suffix in skipped_suffixes:
+            if path.with_name(path.name + suffix).exists():
+                return False
+            continue
+        try:
+            if path.with_name(path.name + suffix).stat().st_mtime_ns != mtime:
+                return False
+        except FileNotFoundError:
+            return False
+    return True
+
+
+def load_state(state_path):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, TypeError, ValueError):
+        return {}
+
+
+def precompress_tree(output_dir, jobs=1, state_path=None):
+    """Compress every stale text output under output_dir
+
+    state_path is where to remember the encodings skipped for each file (see
+    is_current); without one, such files are recompressed on every call.
+    Returns ({relative path: compress_file() result}, [orphaned siblings
+    removed]), with paths relative to output_dir.
+    """
+    output_dir = Path(output_dir)
+    state = load_state(state_path)
+    stale = []
+    removed = []
+    sources = set()
+    active_suffixes = {suffix for suffix, _ in encodings()}
+
+    for path in sorted(output_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        if path.suffix in PRECOMPRESSED_SUFFIXES:
+            # Drop siblings whose source is gone (or whose encoder is no longer available)
+            source = path.with_name(path.name[:-len(path.suffix)])
+            if not source.exists() or path.suffix not in active_suffixes:
+                path.unlink()
+                removed.append(path.relative_to(output_dir).as_posix())
+            continue
+        if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+            relative = path.relative_to(output_dir).as_posix()
+            sources.add(relative)
+            if not is_current(path, state.get(relative)):
+                stale.append(path)
+
+    if jobs <= 1 or len(stale) <= 1:
+        results = [compress_file(path) for path in stale]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(stale))) as pool:
+            results = list(pool.map(compress_file, stale, chunksize=8))
+
+    compressed = {path.relative_to(output_dir).as_posix(): sizes for path, sizes in zip(stale, results)}
+
+    if state_path is not None:
+        new_state = {relative: entry for relative, entry in state.items()
+                     if relative in sources and relative not in compressed}
+        for path in stale:
+            relative = path.relative_to(output_dir).as_posix()
+            skipped = [suffix for suffix, (size, _, _) in compressed[relative][1].items() if size is None]
+            if skipped:
+                new_state[relative] = {'mtime_ns': path.stat().st_mtime_ns, 'skipped': skipped}
+        if new_state != state:
+            write_atomic(state_path, json.dumps(new_state, indent=1, sort_keys=True).encode('utf-8'))
+    return compressed, removed
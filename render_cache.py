@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache of rendered markdown for the QRTick blog generators.
+
+Entries are keyed by the markdown body, the extension list and the installed
+Python-Markdown and Pygments versions (codehilite's output depends on both),
+and hold the render artifacts produced by markdown_renderer.MarkdownRenderer
+(HTML fragment, table of contents, headings and a word count). The cache is
+bounded in size; the least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+import markdown
+
+try:
+    import pygments
+except ImportError:
+    # codehilite falls back to plain <pre><code> blocks without Pygments
+    pygments = None
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# Bump when the shape of cached entries changes so stale entries are never read
+ENTRY_VERSION = 2
+
+
+class RenderCache:
+    """On-disk LRU cache of markdown render results"""
+
+    def __init__(self, cache_dir, max_bytes=DEFAULT_MAX_BYTES, enabled=True):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, markdown_text, extensions):
+        """Return the cache key for a markdown body rendered with the given extensions"""
+        digest = hashlib.sha256()
+        pygments_version = pygments.__version__ if pygments is not None else ''
+        digest.update(f"{ENTRY_VERSION}\0{markdown.__version__}\0{pygments_version}".encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(json.dumps(list(extensions)).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(markdown_text.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached entry for key, or None on a miss"""
+        if not self.enabled:
+            return None
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+        # Bump the mtime so eviction treats this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key, entry):
+        """Store an entry under key"""
+        if not self.enabled:
+            return
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Workers may write concurrently, so give each writer its own temp file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        if not self.cache_dir.exists():
+            return 0
+        entries = []
+        total = 0
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Remove every cached entry"""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
@@ -0,0 +1,199 @@
+/*
+ * Client-side search for the QRTick blog.
+ *
+ * Loads search/index.json, then only the term shards a query's words fall in
+ * and the doc chunks holding its top results (see search_index.py). Words are
+ * folded and split the same way the index was built; the last word also
+ * matches as a prefix, so results update while typing.
+ */
+(function () {
+    'use strict';
+
+    var form = document.querySelector('.search-form');
+    if (!form || !window.fetch || !String.prototype.normalize) {
+        return;
+    }
+    var input = form.querySelector('input[name="q"]');
+    var results = document.querySelector('.search-results');
+    var base = form.getAttribute('data-search');
+    var siteRoot = form.getAttribute('data-root');
+    var requests = {};
+    var latest = 0;
+    var timer = null;
+
+    function load(name) {
+        if (!requests[name]) {
+            requests[name] = fetch(base + name).then(function (response) {
+                if (!response.ok) {
+                    throw new Error(response.status + ' ' + name);
+                }
+                return response.json();
+            });
+            // Let a failed request be retried by the next query
+            requests[name].catch(function () {
+                delete requests[name];
+            });
+        }
+        return requests[name];
+    }
+
+    function tokenize(text) {
+        var words = text.normalize('NFKD').replace(/[\u0300-\u036f]/g, '').toLowerCase().match(/[a-z0-9]+/g) || [];
+        return words.filter(function (word) {
+            return word.length > 1 && word.length <= 32;
+        });
+    }
+
+    function shardFor(index, word) {
+        for (var length = Math.min(word.length, 3); length > 0; length--) {
+            var prefix = word.slice(0, length);
+            if (index.terms[prefix]) {
+                return 'terms-' + prefix + '.' + index.terms[prefix] + '.json';
+            }
+        }
+        return null;
+    }
+
+    function score(index, words, shards) {
+        var docs = {};
+        words.forEach(function (word, position) {
+            var shard = shards[position];
+            if (!shard) {
+                return;
+            }
+            // The last word also matches longer terms while it is being typed
+            var prefix = position === words.length - 1 && word.length > 2;
+            Object.keys(shard).forEach(function (term) {
+                var exact = term === word;
+                if (!exact && !(prefix && term.lastIndexOf(word, 0) === 0)) {
+                    return;
+                }
+                var postings = shard[term];
+                var df = postings.length / 2;
+                var idf = Math.log(1 + (index.docs - df + 0.5) / (df + 0.5)) * (exact ? 1 : 0.5);
+                var id = 0;
+                for (var i = 0; i < postings.length; i += 2) {
+                    // Ids are stored as gaps from the previous id
+                    id += postings[i];
+                    var tf = postings[i + 1];
+                    var doc = docs[id] || (docs[id] = {id: id, score: 0, words: {}});
+                    doc.score += idf * tf * 2.2 / (tf + 1.2);
+                    doc.words[position] = true;
+                }
+            });
+        });
+        // Posts matching more of the query's words come first
+        return Object.keys(docs).map(function (id) {
+            docs[id].matched = Object.keys(docs[id].words).length;
+            return docs[id];
+        }).sort(function (a, b) {
+            return b.matched - a.matched || b.score - a.score || a.id - b.id;
+        });
+    }
+
+    function render(query, hits, chunks, index) {
+        results.textContent = '';
+        var heading = document.createElement('h2');
+        heading.className = 'listing-title';
+        heading.textContent = hits.length ? 'Results for “' + query + '”' : 'No posts found for “' + query + '”';
+        results.appendChild(heading);
+        hits.forEach(function (hit) {
+            var chunk = chunks[Math.floor(hit.id / index.chunk_size)];
+            var doc = chunk && chunk[hit.id];
+            if (!doc) {
+                return;
+            }
+            var article = document.createElement('article');
+            article.className = 'blog-post search-result';
+            var title = document.createElement('h2');
+            var link = document.createElement('a');
+            link.href = siteRoot + doc[0] + '.html';
+            link.textContent = doc[1];
+            title.appendChild(link);
+            var meta = document.createElement('div');
+            meta.className = 'blog-meta';
+            meta.textContent = doc[2];
+            var excerpt = document.createElement('div');
+            excerpt.className = 'blog-excerpt';
+            excerpt.textContent = doc[3];
+            article.appendChild(title);
+            article.appendChild(meta);
+            article.appendChild(excerpt);
+            results.appendChild(article);
+        });
+        results.hidden = false;
+    }
+
+    function search(query) {
+        var request = ++latest;
+        var words = tokenize(query);
+        if (!words.length) {
+            results.hidden = true;
+            results.textContent = '';
+            return;
+        }
+        load('index.json').then(function (index) {
+            var names = words.map(function (word) {
+                return shardFor(index, word);
+            });
+            return Promise.all(names.map(function (name) {
+                return name ? load(name) : null;
+            })).then(function (shards) {
+                var hits = score(index, words, shards).slice(0, 10);
+                var chunkNumbers = [];
+                hits.forEach(function (hit) {
+                    var number = Math.floor(hit.id / index.chunk_size);
+                    if (chunkNumbers.indexOf(number) < 0 && index.chunks[number]) {
+                        chunkNumbers.push(number);
+                    }
+                });
+                return Promise.all(chunkNumbers.map(function (number) {
+                    return load('docs-' + number + '.' + index.chunks[number] + '.json');
+                })).then(function (loaded) {
+                    var chunks = {};
+                    chunkNumbers.forEach(function (number, i) {
+                        chunks[number] = loaded[i];
+                    });
+                    if (request === latest) {
+                        render(query, hits, chunks, index);
+                    }
+                });
+            });
+        }).catch(function () {
+            if (request === latest) {
+                results.textContent = 'Search is unavailable right now.';
+                results.hidden = false;
+            }
+        });
+    }
+
+    function update() {
+        var query = input.value.trim();
+        if (window.history && history.replaceState) {
+            var url = new URL(window.location.href);
+            if (query) {
+                url.searchParams.set('q', query);
+            } else {
+                url.searchParams.delete('q');
+            }
+            history.replaceState(null, '', url);
+        }
+        search(query);
+    }
+
+    input.addEventListener('input', function () {
+        clearTimeout(timer);
+        timer = setTimeout(update, 150);
+    });
+    form.addEventListener('submit', function (event) {
+        event.preventDefault();
+        clearTimeout(timer);
+        update();
+    });
+
+    var initial = new URLSearchParams(window.location.search).get('q');
+    if (initial) {
+        input.value = initial;
+        search(initial.trim());
+    }
+})();
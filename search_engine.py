@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+In-memory BM25 search over the QRTick blog's markdown posts, for serve.py.
+
+The index is built from blog/*.md when the server starts, using the same
+tokenizer as the prebuilt client-side index (search_index.py), and kept
+current by refresh(): only files whose (size, mtime) changed are re-read,
+and only their postings are replaced.
+
+Each posting holds its precomputed BM25 term weight (the tf and length part
+of the score), and every term's postings are kept sorted by that weight, so
+a query takes the top results with Fagin's threshold algorithm: it walks the
+query terms' lists in step and stops as soon as no unseen post could beat
+the current top k, usually after a few dozen postings rather than all of
+them. The weights use the average post length as of the last reweighting,
+which is redone whenever the real average drifts more than AVERAGE_DRIFT
+from it, so scores are never more than that far from exact BM25; idf is
+always computed from the current document counts. Reweighting builds the new
+postings outside the lock and swaps them in, so queries aren't held up.
+"""
+
+import bisect
+import functools
+import heapq
+import html
+import json
+import math
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+
+import yaml
+
+from search_index import COMBINING_MARKS, fold, html_text, text_terms, tokenize
+
+# Standard Okapi BM25 parameters
+K1 = 1.2
+B = 0.75
+AVERAGE_DRIFT = 0.02
+
+SNIPPET_CHARS = 200
+SNIPPET_MATCHES = 20
+MAX_RESULTS = 50
+
+# The C loader is much faster, and startup parses every post's frontmatter
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+MARKDOWN_LINK = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+MARKDOWN_SYNTAX = re.compile(r'[#*_`>|~]+|-{2,}|={2,}')
+NON_ASCII = re.compile(r'[^\x00-\x7f]+')
+
+# Posts repeat the same few accented letters and emoji, so their folds are cached
+fold_character = functools.lru_cache(maxsize=4096)(fold)
+
+
+def split_frontmatter(content):
+    """Return (frontmatter dict, markdown body), parsed the way blog_generator.py does"""
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            try:
+                frontmatter = yaml.load(parts[1], Loader=YAML_LOADER)
+            except yaml.YAMLError:
+                frontmatter = None
+            if isinstance(frontmatter, dict):
+                # Round-trip through JSON so dates come out as strings, as in the generator
+                return json.loads(json.dumps(frontmatter, default=str)), parts[2].strip()
+    return {}, content
+
+
+def markdown_text(body):
+    """The readable text of a markdown post: link text kept, URLs, tags and syntax dropped"""
+    text = html_text(MARKDOWN_LINK.sub(r'\1', body))
+    return ' '.join(MARKDOWN_SYNTAX.sub(' ', text).split())
+
+
+def fold_offsets(text):
+    """Return (folded text, shifts): text folded as tokenize() sees it, and how to map back
+
+    Most characters fold to exactly one character ("É" -> "e"), keeping their
+    offsets. Those that don't (a lone combining accent, "ﬁ") are recorded in
+    shifts as ([folded index], [amount to add from there on]), or None if there
+    are none.
+    """
+    # Emoji and other characters with no decomposition just lowercase in place
+    if text.isascii() or (unicodedata.is_normalized('NFKD', text) and not COMBINING_MARKS.search(text)):
+        return text.lower(), None
+    parts, positions, offsets = [], [], []
+    position = length = 0
+    for match in NON_ASCII.finditer(text):
+        plain = text[position:match.start()].lower()
+        parts.append(plain)
+        length += len(plain)
+        for index, char in enumerate(match.group(), match.start()):
+            folded = fold_character(char)
+            parts.append(folded)
+            length += len(folded)
+            if len(folded) != 1:
+                positions.append(length)
+                offsets.append(index + 1 - length)
+        position = match.end()
+    parts.append(text[position:].lower())
+    return ''.join(parts), (positions, offsets) if positions else None
+
+
+def unfold(index, shifts):
+    """The offset in the original text of an offset in its folded text"""
+    positions, offsets = shifts
+    slot = bisect.bisect_right(positions, index)
+    return index + offsets[slot - 1] if slot else index
+
+
+def term_matches(folded, terms, limit=SNIPPET_MATCHES):
+    """The first limit whole-word matches of any of the (folded) terms in folded text, as (start, end, term)
+
+    Each term is looked for with str.find, which skips through text far faster
+    than a regex alternation, most of all for terms the post rarely uses.
+    """
+    matches = []
+    for term in terms:
+        found = 0
+        start = folded.find(term)
+        while start != -1 and found < limit:
+            end = start + len(term)
+            if not folded[start - 1:start].isalnum() and not folded[end:end + 1].isalnum():
+                matches.append((start, end, term))
+                found += 1
+            start = folded.find(term, start + 1)
+    matches.sort()
+    return matches[:limit]
+
+
+def highlight(text, terms, width=SNIPPET_CHARS):
+    """An HTML snippet of about width characters of text, around the densest run of the terms
+
+    The terms are found in the folded text, so "cafe" marks "Café"; matches
+    are wrapped in <mark> and everything else is escaped.
+    """
+    folded, shifts = fold_offsets(text)
+    # The snippet comes from the first SNIPPET_MATCHES matches, which bounds the work on long posts
+    matches = term_matches(folded, terms)
+    if shifts:
+        matches = [(unfold(first, shifts), unfold(last, shifts), term) for first, last, term in matches]
+    start = 0
+    if matches:
+        best = -1
+        # The window opening at each match; keep the one covering the most distinct terms
+        for i, (first, _, _) in enumerate(matches):
+            covered = {term for position, _, term in matches[i:i + 10] if position < first + width}
+            if len(covered) > best:
+                best, start = len(covered), first
+        # Back up to the start of a word a little before the first match
+        start = text.rfind(' ', 0, max(0, start - 30)) + 1
+    end = text.find(' ', start + width)
+    end = len(text) if end == -1 else end
+
+    parts = ['…' if start else '']
+    position = start
+    for first, last, _ in matches:
+        if first < start or last > end:
+            continue
+        parts.append(html.escape(text[position:first]))
+        parts.append(f"<mark>{html.escape(text[first:last])}</mark>")
+        position = last
+    parts.append(html.escape(text[position:end]))
+    if end < len(text):
+        parts.append('…')
+    return ''.join(parts)
+
+
+class Document:
+    """One indexed post"""
+
+    __slots__ = ('id', 'signature', 'slug', 'title', 'date', 'excerpt', 'text', 'terms', 'length')
+
+    def __init__(self, doc_id, signature, frontmatter, text, terms, length, stem):
+        self.id = doc_id
+        self.signature = signature
+        self.slug = frontmatter.get('slug') or re.sub(
+            r'[^a-zA-Z0-9\-_]', '-', str(frontmatter.get('title', stem)).lower()).strip('-')
+        self.title = str(frontmatter.get('title', 'Untitled'))
+        self.date = str(frontmatter.get('date', ''))
+        self.excerpt = str(frontmatter.get('excerpt', ''))
+        self.text = text
+        self.terms = terms
+        self.length = length
+
+
+class SearchEngine:
+    """A BM25 index over blog/*.md, updated in place as posts are added, edited or deleted"""
+
+    def __init__(self, blog_dir="blog", site_root="/blog/"):
+        self.blog_dir = Path(blog_dir)
+        self.site_root = site_root
+        self.documents = {}
+        self.by_id = {}
+        self.total_length = 0
+        self.next_id = 0
+        # {term: {doc id: BM25 term weight}} and {term: [doc ids, highest weight first]}
+        self.weights = {}
+        self.ranked = {}
+        # The average post length the weights were computed with
+        self.average_length = None
+        self.lock = threading.Lock()
+        # Set once the first refresh() has indexed every post
+        self.ready = threading.Event()
+
+    def scan(self):
+        """{file name: (size, mtime_ns)} for every markdown post"""
+        signatures = {}
+        try:
+            entries = os.scandir(self.blog_dir)
+        except FileNotFoundError:
+            return signatures
+        with entries:
+            for entry in entries:
+                if entry.name.endswith('.md') and entry.is_file():
+                    stat = entry.stat()
+                    signatures[entry.name] = (stat.st_size, stat.st_mtime_ns)
+        return signatures
+
+    def refresh(self):
+        """Re-index posts that were added or changed and drop deleted ones; returns (updated, removed)
+
+        Only one thread may call refresh() at a time (watch() is the only caller in serve.py).
+        """
+        signatures = self.scan()
+        with self.lock:
+            changed = sorted(name for name, signature in signatures.items()
+                             if name not in self.documents or self.documents[name].signature != signature)
+            removed = [name for name in self.documents if name not in signatures]
+
+        # Parse outside the lock so searches carry on while files are read
+        parsed = {}
+        for name in changed:
+            try:
+                content = (self.blog_dir / name).read_text(encoding='utf-8')
+            except (FileNotFoundError, UnicodeDecodeError):
+                continue
+            frontmatter, body = split_frontmatter(content)
+            text = markdown_text(body)
+            terms, length = text_terms(frontmatter, text)
+            parsed[name] = Document(None, signatures[name], frontmatter, text, terms, length, name[:-3])
+        if not parsed and not removed:
+            self.ready.set()
+            return 0, 0
+
+        with self.lock:
+            for name in removed + [name for name in parsed if name in self.documents]:
+                document = self.documents.pop(name)
+                del self.by_id[document.id]
+                self.total_length -= document.length
+                self._unpost(document)
+            added = []
+            for name, document in parsed.items():
+                document.id = self.next_id
+                self.next_id += 1
+                self.documents[name] = self.by_id[document.id] = document
+                self.total_length += document.length
+                added.append(document)
+
+            average = self.total_length / len(self.documents) if self.documents else 0
+            drifted = (self.average_length is None
+                       or abs(average - self.average_length) > AVERAGE_DRIFT * self.average_length)
+            if not drifted:
+                for document in added:
+                    self._post(document)
+                self.ready.set()
+                return len(parsed), len(removed)
+            documents = list(self.by_id.values())
+
+        # Documents are immutable and this is the only writer, so the snapshot stays
+        # current; until the swap, queries see the old weights minus the new posts
+        weights, ranked = self._weigh(documents, average or 1.0)
+        with self.lock:
+            self.weights, self.ranked, self.average_length = weights, ranked, average or 1.0
+        self.ready.set()
+        return len(parsed), len(removed)
+
+    def weight(self, tf, length, average_length=None):
+        """The tf and length-normalisation part of a term's BM25 score in one post"""
+        average_length = average_length or self.average_length
+        return tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average_length))
+
+    def _weigh(self, documents, average_length):
+        """Return (weights, ranked) postings for documents against an average post length"""
+        weights = {}
+        for document in documents:
+            for term, tf in document.terms.items():
+                weights.setdefault(term, {})[document.id] = self.weight(tf, document.length, average_length)
+        ranked = {term: sorted(term_weights,
+                               key=lambda doc_id, term_weights=term_weights: (-term_weights[doc_id], doc_id))
+                  for term, term_weights in weights.items()}
+        return weights, ranked
+
+    def _post(self, document):
+        for term, tf in document.terms.items():
+            weights = self.weights.setdefault(term, {})
+            weight = weights[document.id] = self.weight(tf, document.length)
+            ranked = self.ranked.setdefault(term, [])
+            # Binary search for the slot keeping (-weight, id) order
+            low, high = 0, len(ranked)
+            while low < high:
+                middle = (low + high) // 2
+                if (-weights[ranked[middle]], ranked[middle]) < (-weight, document.id):
+                    low = middle + 1
+                else:
+                    high = middle
+            ranked.insert(low, document.id)
+
+    def _unpost(self, document):
+        for term in document.terms:
+            weights = self.weights[term]
+            del weights[document.id]
+            if weights:
+                self.ranked[term].remove(document.id)
+            else:
+                del self.weights[term]
+                del self.ranked[term]
+
+    def watch(self, interval=1.0, stop_event=None):
+        """Call refresh() every interval seconds until stop_event is set"""
+        stop_event = stop_event or threading.Event()
+        while not stop_event.wait(interval):
+            try:
+                updated, removed = self.refresh()
+            except OSError as e:
+                print(f"⚠️  Search index refresh failed: {e}")
+                continue
+            if updated or removed:
+                print(f"🔎 Search index: {updated} post(s) re-indexed, {removed} removed")
+
+    def top(self, terms, limit):
+        """Return (total matches, [(score, doc id)]) for the best BM25 matches of the terms
+
+        Fagin's threshold algorithm over the weight-ordered postings: after
+        each step down the lists, no post not yet seen can score more than the
+        sum of the weights just read, so the walk stops once the k-th best
+        score reaches that sum.
+        """
+        count = len(self.documents)
+        lists = []
+        for term in terms:
+            weights = self.weights.get(term)
+            if weights:
+                df = len(weights)
+                lists.append((math.log(1 + (count - df + 0.5) / (df + 0.5)), weights, self.ranked[term]))
+        if not lists:
+            return 0, []
+        total = max(len(weights) for _, weights, _ in lists)
+        if len(lists) > 1 and total < count:
+            total = len(set().union(*(weights for _, weights, _ in lists)))
+
+        # A min-heap of (score, -id), so ties go to the lower id
+        heap = []
+        seen = set()
+        pairs = [(idf, weights) for idf, weights, _ in lists]
+        depth = 0
+        deepest = max(len(ranked) for _, _, ranked in lists)
+        while depth < deepest and limit:
+            threshold = 0.0
+            for idf, weights, ranked in lists:
+                if depth >= len(ranked):
+                    continue
+                doc_id = ranked[depth]
+                threshold += idf * weights[doc_id]
+                if doc_id in seen:
+                    continue
+                seen.add(doc_id)
+                score = 0.0
+                for other_idf, other in pairs:
+                    weight = other.get(doc_id)
+                    if weight is not None:
+                        score += other_idf * weight
+                if len(heap) < limit:
+                    heapq.heappush(heap, (score, -doc_id))
+                elif (score, -doc_id) > heap[0]:
+                    heapq.heapreplace(heap, (score, -doc_id))
+            if len(heap) == limit and heap[0][0] >= threshold:
+                break
+            depth += 1
+        return total, [(score, -negative_id) for score, negative_id in sorted(heap, reverse=True)]
+
+    def search(self, query, limit=10):
+        """Return (total matches, [result dicts]) for the best BM25 matches of query"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, []
+        with self.lock:
+            total, top = self.top(terms, min(limit, MAX_RESULTS))
+            hits = [(self.by_id[doc_id], score) for score, doc_id in top]
+
+        # Documents are never modified once indexed, so snippets can be cut outside the lock
+        return total, [{
+            'title': document.title,
+            'url': f"{self.site_root}{document.slug}.html",
+            'date': document.date,
+            'excerpt': document.excerpt,
+            'score': round(score, 4),
+            'snippet': highlight(document.text, terms)
+        } for document, score in hits]
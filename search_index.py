@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Prebuilt client-side search index for the QRTick blog.
+
+Every post's rendered text is tokenized once, when the post is rendered, and
+its term frequencies are cached by source hash in .blog_cache, so a build
+only tokenizes the posts that changed. From the cached terms the index is
+written to blog_html/search/ as:
+
+- terms-<prefix>.<hash>.json: {term: [doc id, tf, doc id, tf, ...]} for every
+  term starting with prefix, ids ascending and each stored as the difference
+  from the one before it. Shards start at one character and are split on
+  the next character while they are larger than SHARD_TARGET_BYTES, so a
+  query only downloads a few small files whatever the size of the blog.
+- docs-<n>.<hash>.json: {doc id: [slug, title, date, excerpt]} for DOC_CHUNK_SIZE
+  ids at a time; a query only fetches the chunks holding its top results.
+- index.json: the document count and the hashes naming every shard and chunk.
+
+Doc ids are handed out once per source file and kept across builds, so a
+changed post only changes the shards holding its terms and its own doc chunk.
+Hashed files never change contents and can be cached forever.
+"""
+
+import html
+import json
+import os
+import re
+import unicodedata
+from pathlib import Path
+
+from build_manifest import hash_bytes
+
+SEARCH_INDEX_VERSION = 1
+SHARD_TARGET_BYTES = 8 * 1024
+MAX_PREFIX_LENGTH = 3
+DOC_CHUNK_SIZE = 16
+EXCERPT_LENGTH = 200
+
+# Title and tag words count as this many occurrences
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 2
+
+STOPWORDS = frozenset("""
+    a an and are as at be but by can do for from has have how i if in into is it its
+    of on or our so than that the their them then there these they this to was we
+    were what when where which who will with you your
+""".split())
+
+WORD = re.compile(r'[a-z0-9]+')
+# The combining diacritics NFKD splits off accented letters (the range search.js strips too)
+COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+MARKUP = re.compile(r'<(script|style)\b.*?</\1\s*>|<!--.*?-->|<[^>]*>', re.S | re.I)
+
+
+def fold(text):
+    """Lowercase text and strip its accents ("Café" -> "cafe")"""
+    if text.isascii():
+        return text.lower()
+    return COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', text)).lower()
+
+
+def tokenize(text):
+    """Split text into index terms: folded ASCII words of 2-32 characters, minus stopwords
+
+    search.js applies the same folding and word split to queries.
+    """
+    return [word for word in WORD.findall(fold(text))
+            if 1 < len(word) <= 32 and word not in STOPWORDS]
+
+
+def html_text(content_html):
+    """The visible text of an HTML fragment"""
+    return html.unescape(MARKUP.sub(' ', content_html))
+
+
+def document_terms(post_data, content_html):
+    """Return ({term: weighted frequency}, word count) for a rendered post"""
+    return text_terms(post_data, html_text(content_html))
+
+
+def text_terms(post_data, text):
+    """Return ({term: weighted frequency}, word count) for a post's plain text and frontmatter"""
+    terms = {}
+    words = tokenize(text)
+    for word in words:
+        terms[word] = terms.get(word, 0) + 1
+    for word in tokenize(str(post_data.get('title', ''))):
+        terms[word] = terms.get(word, 0) + TITLE_WEIGHT
+    for tag in post_data.get('tags') or []:
+        for word in tokenize(str(tag)):
+            terms[word] = terms.get(word, 0) + TAG_WEIGHT
+    return terms, len(words)
+
+
+def document_entry(post_data):
+    """The doc table row for a post: [slug, title, date, excerpt]"""
+    excerpt = ' '.join(str(post_data.get('excerpt', '')).split())
+    if len(excerpt) > EXCERPT_LENGTH:
+        excerpt = excerpt[:EXCERPT_LENGTH].rsplit(' ', 1)[0] + '…'
+    return [post_data.get('slug', ''), str(post_data.get('title', 'Untitled')),
+            str(post_data.get('date', '')), excerpt]
+
+
+def compact_json(value):
+    return json.dumps(value, separators=(',', ':'), sort_keys=True, ensure_ascii=False).encode('utf-8')
+
+
+def shard_terms(postings, prefix='', target_bytes=SHARD_TARGET_BYTES):
+    """Split {term: postings} (terms sharing prefix) into [(shard prefix, JSON bytes)]
+
+    A shard over target_bytes is split on the next character of its terms;
+    terms no longer than the current prefix stay behind in the parent shard.
+    """
+    data = compact_json(postings)
+    if prefix and (len(data) <= target_bytes or len(prefix) >= MAX_PREFIX_LENGTH):
+        return [(prefix, data)]
+    groups = {}
+    for term, term_postings in postings.items():
+        key = term[:len(prefix) + 1]
+        groups.setdefault(key, {})[term] = term_postings
+    shards = []
+    for key in sorted(groups):
+        if key == prefix:
+            shards.append((prefix, compact_json(groups[key])))
+        else:
+            shards.extend(shard_terms(groups[key], key, target_bytes))
+    return shards
+
+
+class SearchIndex:
+    """Cached per-post terms plus the sharded index files built from them"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.data = None
+        self.dirty = False
+
+    def _empty(self):
+        return {'version': SEARCH_INDEX_VERSION, 'next_id': 0, 'posts': {}, 'index_hash': None}
+
+    def load(self):
+        """Load the cached terms, starting fresh if they are missing or stale"""
+        if self.data is not None:
+            return self
+        self.data = self._empty()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return self
+        if data.get('version') == SEARCH_INDEX_VERSION:
+            self.data = data
+        return self
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f, sort_keys=True, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def is_current(self, name, source_hash):
+        """True if the cached terms for a source file came from these contents"""
+        entry = self.load().data['posts'].get(name)
+        return entry is not None and entry['source_hash'] == source_hash
+
+    def update(self, name, source_hash, post_data, terms, length):
+        """Store the terms of a freshly rendered post, keeping its doc id"""
+        posts = self.load().data['posts']
+        entry = posts.get(name)
+        if entry is None:
+            entry = {'id': self.data['next_id']}
+            self.data['next_id'] += 1
+        entry = dict(entry, source_hash=source_hash, doc=document_entry(post_data), terms=terms, length=length)
+        if posts.get(name) != entry:
+            posts[name] = entry
+            self.dirty = True
+
+    def retain(self, names):
+        """Forget posts whose source files are gone"""
+        posts = self.load().data['posts']
+        for name in set(posts) - set(names):
+            del posts[name]
+            self.dirty = True
+
+    def build_files(self):
+        """Return {path relative to the search directory: bytes} for the whole index"""
+        entries = sorted(self.load().data['posts'].values(), key=lambda entry: entry['id'])
+        postings = {}
+        last_ids = {}
+        chunks = {}
+        for entry in entries:
+            for term, tf in entry['terms'].items():
+                postings.setdefault(term, []).extend((entry['id'] - last_ids.get(term, 0), tf))
+                last_ids[term] = entry['id']
+            chunks.setdefault(entry['id'] // DOC_CHUNK_SIZE, {})[entry['id']] = entry['doc']
+
+        files = {}
+        manifest = {'version': SEARCH_INDEX_VERSION, 'docs': len(entries), 'chunk_size': DOC_CHUNK_SIZE,
+                    'terms': {}, 'chunks': [None] * (self.data['next_id'] // DOC_CHUNK_SIZE + 1)}
+        for prefix, data in shard_terms(postings):
+            digest = hash_bytes(data)[:10]
+            files[f"terms-{prefix}.{digest}.json"] = data
+            manifest['terms'][prefix] = digest
+        for number, docs in sorted(chunks.items()):
+            data = compact_json(docs)
+            digest = hash_bytes(data)[:10]
+            files[f"docs-{number}.{digest}.json"] = data
+            manifest['chunks'][number] = digest
+        files['index.json'] = compact_json(manifest)
+        return files
+
+    def write(self, search_dir, changes):
+        """Write the index files that changed and delete old ones; returns (written, removed)
+
+        Does nothing if no post changed since the index was last written.
+        """
+        search_dir = Path(search_dir)
+        index_file = search_dir / "index.json"
+        if (not self.dirty and self.data['index_hash']
+                and index_file.exists() and hash_bytes(index_file.read_bytes()) == self.data['index_hash']):
+            return 0, 0
+
+        files = self.build_files()
+        written = sum(changes.write(search_dir / name, data) for name, data in sorted(files.items()))
+        removed = 0
+        for path in sorted(search_dir.glob("*.json")):
+            if path.name not in files:
+                changes.remove(path)
+                removed += 1
+        self.data['index_hash'] = hash_bytes(files['index.json'])
+        self.save()
+        return written, removed
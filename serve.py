@@ -1,45 +1,599 @@
 #!/usr/bin/env python3
 """
 Simple HTTP server for viewing the QRTick blog locally
+
+Run with --watch to rebuild the blog as posts, images, the logo or the
+footer config change, and live-reload any open browser tabs via
+Server-Sent Events.
+
+Files built with --precompress are served from their .br/.gz siblings
+when the browser accepts that encoding, just as in production.
+
+The server speaks HTTP/1.1 with keep-alive, handles each connection in its
+own thread, answers conditional requests (strong ETags from a content hash,
+If-None-Match and If-Modified-Since) with 304s, and keeps hot files in an
+in-memory LRU, so it holds up when load-testing the blog locally. Cached
+files are written from memory and large ones with sendfile(); byte
+ranges (Range/If-Range) are supported for every file.
+
+Headers and redirects follow the same _headers, _redirects and netlify.toml
+rules as production (see netlify_config.py), and every logged request lists
+the rules that matched it.
+
+/search?q=...&limit=... answers from an in-memory BM25 index of the markdown
+in blog/ (see search_engine.py), built in the background once the server is
+listening (503 until then) and refreshed as posts change, with JSON results
+and highlighted snippets.
 """
 
+import argparse
+import email.utils
+import errno
+import functools
 import http.server
-import socketserver
+import json
 import os
+import posixpath
+import re
+import threading
+import time
+import urllib.parse
 import webbrowser
+from datetime import datetime, timezone
 from pathlib import Path
 
+from file_cache import FileBody, FileCache
+from netlify_config import HTML_MAX_AGE_LIMIT, NetlifyRules, max_age
+from search_engine import MAX_RESULTS, SearchEngine
+
+LIVERELOAD_PATH = "/__livereload"
+SEARCH_PATH = "/search"
+
+# Precompressed siblings in order of preference: (Content-Encoding, file suffix)
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+LIVERELOAD_SCRIPT = f"""<script>
+(function () {{
+    var source = new EventSource("{LIVERELOAD_PATH}");
+    source.addEventListener("reload", function () {{ window.location.reload(); }});
+}})();
+</script>
+"""
+
+
+class LiveReload:
+    """Tracks rebuilds and wakes up every connected live-reload client"""
+
+    def __init__(self):
+        self.condition = threading.Condition()
+        self.version = 0
+
+    def notify(self, changed_paths=None):
+        with self.condition:
+            self.version += 1
+            self.condition.notify_all()
+
+    def wait(self, seen_version, timeout):
+        """Block until a rebuild newer than seen_version happens or timeout expires"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != seen_version, timeout)
+            return self.version
+
+
+def accepted_encodings(header):
+    """Return the set of content codings an Accept-Encoding header allows"""
+    accepted = set()
+    rejected = set()
+    for item in (header or "").split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        (accepted if quality > 0 else rejected).add(coding)
+    if "*" in accepted:
+        accepted |= {coding for coding, _ in PRECOMPRESSED} - rejected
+    return accepted - rejected
+
+
+BYTE_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header, size):
+    """Return (start, end) for a single-range Range header, None to ignore it, or 'unsatisfiable'
+
+    Multiple ranges and malformed headers are ignored, which RFC 7233 allows:
+    the client simply gets the whole file.
+    """
+    match = BYTE_RANGE.match(header.replace(" ", ""))
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            return "unsatisfiable"
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        return "unsatisfiable"
+    return start, end
+
+
+def etag_matches(header, etag):
+    """True if an If-None-Match header lists etag (weak comparison) or is '*'"""
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.replace("W/", "", 1) == etag:
+            return True
+    return False
+
+
+class BlogRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler with an optional live-reload event stream"""
+
+    protocol_version = "HTTP/1.1"
+    # Headers and small bodies go out in separate writes; don't let Nagle hold them back
+    disable_nagle_algorithm = True
+    livereload = None
+    file_cache = None
+    netlify_rules = None
+    search_engine = None
+    quiet = False
+
+    def parse_request(self):
+        # Per-request state; the connection (and handler) outlives each request
+        self.rule_headers = []
+        self.matched_rules = []
+        self.sent_headers = set()
+        return super().parse_request()
+
+    def do_GET(self):
+        if self.livereload is not None and self.path == LIVERELOAD_PATH:
+            self.stream_reload_events()
+            return
+        if self.apply_netlify_rules():
+            return
+        if self.search_engine is not None and urllib.parse.urlsplit(self.path).path == SEARCH_PATH:
+            self.answer_search()
+            return
+        if self.livereload is not None and self.inject_livereload():
+            return
+        super().do_GET()
+
+    def do_HEAD(self):
+        if self.apply_netlify_rules():
+            return
+        super().do_HEAD()
+
+    def apply_netlify_rules(self):
+        """Answer redirects and pick the custom headers for this request; True if it was answered
+
+        A 200 rule rewrites the request to its target; any other status
+        redirects to it.
+        """
+        if self.netlify_rules is None:
+            return False
+        self.netlify_rules.refresh()
+        parts = urllib.parse.urlsplit(self.path)
+        path = urllib.parse.unquote(parts.path)
+        if posixpath.basename(path) in ("_headers", "_redirects"):
+            # Netlify reads these from the publish directory but never serves them
+            self.send_error(404, "File not found")
+            return True
+
+        redirect = self.netlify_rules.redirect_for(path, self.is_published)
+        if redirect is not None:
+            rule, target = redirect
+            self.matched_rules.append(f"redirect {rule}")
+            if parts.query and "?" not in target:
+                target += "?" + parts.query
+            if rule.status != 200:
+                self.send_response(rule.status)
+                self.send_header("Location", target)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return True
+            self.path = target
+
+        self.rule_headers, matched = self.netlify_rules.headers_for(path)
+        self.matched_rules += [str(rule) for rule in matched]
+        cache_control = dict((name.lower(), value) for name, value in self.rule_headers).get("cache-control")
+        age = max_age(cache_control)
+        if age is not None and age > HTML_MAX_AGE_LIMIT and self.is_html(self.path):
+            self.matched_rules.append(f"⚠️ HTML cached for {age}s")
+        return False
+
+    def rule_header(self, name):
+        """The value the header rules give this request for a header, or None"""
+        for rule_name, value in self.rule_headers:
+            if rule_name.lower() == name.lower():
+                return value
+        return None
+
+    def is_published(self, path):
+        """True if a file (or a directory with an index.html) is published at a URL path"""
+        local = self.translate_path(path)
+        return os.path.isfile(local) or os.path.isfile(os.path.join(local, "index.html"))
+
+    def is_html(self, path):
+        local = self.translate_path(path)
+        if os.path.isdir(local):
+            local = os.path.join(local, "index.html")
+        return self.guess_type(local) == "text/html"
+
+    def send_response(self, code, message=None):
+        self.sent_headers = set()
+        super().send_response(code, message)
+
+    def send_header(self, keyword, value):
+        self.sent_headers.add(keyword.lower())
+        super().send_header(keyword, value)
+
+    def end_headers(self):
+        # Headers the server set itself (e.g. live reload's no-cache) win over the rules
+        for name, value in getattr(self, "rule_headers", ()):
+            if name.lower() not in self.sent_headers:
+                super().send_header(name, value)
+        self.rule_headers = []
+        super().end_headers()
+
+    def log_request(self, code="-", size="-"):
+        code = getattr(code, "value", code)
+        rules = getattr(self, "matched_rules", None)
+        self.log_message('"%s" %s %s%s', self.requestline, str(code), str(size),
+                         f"  [{'; '.join(rules)}]" if rules else "")
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not urllib.parse.urlsplit(self.path).path.endswith("/") or not os.path.isfile(index):
+                # Trailing-slash redirects and directory listings
+                return super().send_head()
+            path = index
+        if path.endswith("/") or not os.path.isfile(path):
+            return super().send_head()
+
+        served_path, encoding, negotiated = self.negotiate_encoding(path)
+        try:
+            entry, f = self.file_cache.open(served_path)
+        except OSError as e:
+            if e.errno in (errno.ENOENT, errno.ENOTDIR):
+                self.send_error(404, "File not found")
+            else:
+                # e.g. EMFILE: the file is there, the server just can't open it right now
+                self.send_error(500, f"Could not open file: {e.strerror}")
+            return None
+
+        try:
+            status, byte_range = 200, None
+            if self.is_not_modified(entry):
+                status = 304
+            elif "Range" in self.headers and self.range_applies(entry):
+                byte_range = parse_range(self.headers["Range"], entry.size)
+                if byte_range == "unsatisfiable":
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{entry.size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    if f is not None:
+                        f.close()
+                    return None
+                if byte_range is not None:
+                    status = 206
+
+            self.send_response(status)
+            # A Content-Type from the header rules (e.g. the feeds') wins, as on Netlify
+            self.send_header("Content-Type", self.rule_header("Content-Type") or self.guess_type(path))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if negotiated:
+                self.send_header("Vary", "Accept-Encoding")
+            self.send_header("ETag", entry.etag)
+            self.send_header("Last-Modified", self.date_time_string(entry.mtime))
+            self.send_header("Accept-Ranges", "bytes")
+            if status == 304:
+                self.end_headers()
+                if f is not None:
+                    f.close()
+                return None
+
+            body = FileBody(entry, f)
+            if byte_range is not None:
+                start, end = byte_range
+                body = FileBody(entry, f, start, end - start + 1)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{entry.size}")
+            self.send_header("Content-Length", str(body.length))
+            self.end_headers()
+            return body
+        except BaseException:
+            if f is not None:
+                f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        if isinstance(source, FileBody):
+            source.write_to(self.connection, outputfile)
+        else:
+            super().copyfile(source, outputfile)
+
+    def negotiate_encoding(self, path):
+        """Return (path to serve, Content-Encoding or None, whether a sibling was considered)
+
+        A .br/.gz sibling only counts while it carries its source's mtime,
+        i.e. was compressed from the current contents.
+        """
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        negotiated = False
+        mtime = None
+        for encoding, suffix in PRECOMPRESSED:
+            sibling = path + suffix
+            try:
+                sibling_mtime = os.stat(sibling).st_mtime_ns
+            except OSError:
+                continue
+            if mtime is None:
+                mtime = os.stat(path).st_mtime_ns
+            if sibling_mtime != mtime:
+                continue
+            negotiated = True
+            if encoding in accepted:
+                return sibling, encoding, True
+        return path, None, negotiated
+
+    def range_applies(self, entry):
+        """False if an If-Range header says the client's partial copy is outdated"""
+        if_range = self.headers.get("If-Range")
+        if if_range is None:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith("W/"):
+            # Strong comparison: a weak validator never matches
+            return if_range == entry.etag
+        return if_range == self.date_time_string(entry.mtime)
+
+    def is_not_modified(self, entry):
+        """True if the request's validators say the client's copy is current"""
+        if "If-None-Match" in self.headers:
+            # If-None-Match wins over If-Modified-Since (RFC 7232, section 6)
+            return etag_matches(self.headers["If-None-Match"], entry.etag)
+        if "If-Modified-Since" not in self.headers:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(self.headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        modified = datetime.fromtimestamp(entry.mtime, timezone.utc).replace(microsecond=0)
+        return modified <= since
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def answer_search(self):
+        """Answer /search?q=&limit= with the best matching posts as JSON"""
+        params = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        query = params.get("q", [""])[0].strip()
+        try:
+            limit = min(max(int(params.get("limit", ["10"])[0]), 1), MAX_RESULTS)
+        except ValueError:
+            limit = 10
+        if not query:
+            self.send_json(400, {"error": "missing query: use /search?q=words"})
+            return
+        if not self.search_engine.ready.is_set():
+            self.send_json(503, {"error": "the search index is still being built, try again shortly"},
+                           {"Retry-After": "1"})
+            return
+
+        started = time.perf_counter()
+        total, results = self.search_engine.search(query, limit)
+        self.send_json(200, {"query": query, "total": total,
+                             "took_ms": round((time.perf_counter() - started) * 1000, 3),
+                             "results": results})
+
+    def send_json(self, status, value, headers=None):
+        body = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        for keyword, header_value in (headers or {}).items():
+            self.send_header(keyword, header_value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def inject_livereload(self):
+        """Serve HTML pages with the live-reload script appended; False if not HTML"""
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+        if path.suffix != ".html" or not path.is_file():
+            return False
+
+        body = path.read_bytes()
+        marker = body.rfind(b"</body>")
+        if marker == -1:
+            marker = len(body)
+        body = body[:marker] + LIVERELOAD_SCRIPT.encode("utf-8") + body[marker:]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+        return True
+
+    def stream_reload_events(self):
+        """Hold the connection open and push a reload event after every rebuild"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        # The stream has no length, so it ends the keep-alive connection
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        seen = self.livereload.version
+        try:
+            while True:
+                version = self.livereload.wait(seen, timeout=15)
+                if version == seen:
+                    # Heartbeat comment so dead connections get noticed
+                    self.wfile.write(b": ping\n\n")
+                else:
+                    seen = version
+                    self.wfile.write(f"event: reload\ndata: {version}\n\n".encode("utf-8"))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def start_watcher(livereload, cache_dir=".blog_cache"):
+    """Build the blog once, then rebuild in the background as inputs change
+
+    The generator is created with the options of the last build (e.g.
+    --search from the Netlify command), so watching doesn't undo them.
+    """
+    from blog_generator import BlogGenerator
+    from build_manifest import BuildManifest
+
+    options = BuildManifest(Path(cache_dir) / "manifest.json").load().data.get("options", {})
+    if options:
+        flags = ", ".join(f"{name}={value}" for name, value in sorted(options.items())
+                          if name not in ("blog_dir", "output_dir", "cache_dir"))
+        print(f"🔧 Rebuilding with the last build's options: {flags}")
+    generator = BlogGenerator(**options)
+    generator.generate_blog()
+    thread = threading.Thread(target=generator.watch, kwargs={"on_rebuild": livereload.notify}, daemon=True)
+    thread.start()
+    return thread
+
+
+def start_search_engine(source_dir="blog"):
+    """Index the markdown posts in the background, then keep the index current
+
+    Indexing a large blog takes seconds, so it runs on the watch thread rather
+    than before the server binds; /search answers 503 until it is done.
+    """
+    engine = SearchEngine(source_dir)
+
+    def index_then_watch():
+        started = time.perf_counter()
+        try:
+            engine.refresh()
+        except OSError as e:
+            print(f"⚠️  Search indexing failed, retrying: {e}")
+        else:
+            print(f"🔎 Indexed {len(engine.documents)} post(s) for /search in "
+                  f"{(time.perf_counter() - started) * 1000:.0f} ms")
+        engine.watch()
+
+    threading.Thread(target=index_then_watch, daemon=True).start()
+    return engine
+
+
+def report_netlify_rules(rules, blog_dir):
+    """Print the rule files in use and warn about HTML pages that would be cached too long"""
+    if not rules.sources:
+        print("⚠️  No _headers or netlify.toml found - serving without production headers")
+        return
+    print(f"📜 Applying {len(rules.header_rules)} header and {len(rules.redirect_rules)} redirect "
+          f"rule(s) from {', '.join(rules.sources)}")
+    pages = sorted("/" + page.relative_to(blog_dir).as_posix() for page in blog_dir.rglob("*.html"))
+    long_cached = rules.long_cached_html(pages)
+    if long_cached:
+        path, age, cache_control = long_cached[0]
+        print(f"⚠️  {len(long_cached)} of {len(pages)} HTML page(s) would be cached for more than "
+              f"{HTML_MAX_AGE_LIMIT}s, e.g. {path}: Cache-Control: {cache_control} (max-age {age}s)")
+        _, matched = rules.headers_for(path)
+        print(f"   matching rules: {'; '.join(str(rule) for rule in matched)}")
+
+
 def main():
-    # Change to the blog_html directory
+    parser = argparse.ArgumentParser(description="Serve the generated QRTick blog locally")
+    parser.add_argument("--watch", action="store_true",
+                        help="rebuild on changes and live-reload open browser tabs")
+    parser.add_argument("--no-browser", action="store_true",
+                        help="don't open a browser window")
+    parser.add_argument("--cache-mb", type=int, default=64, metavar="MB",
+                        help="memory for caching hot files (default 64 MB)")
+    parser.add_argument("--quiet", action="store_true",
+                        help="don't log every request (e.g. when load-testing)")
+    parser.add_argument("--no-search", action="store_true",
+                        help="don't index blog/ for the /search endpoint")
+    args = parser.parse_args()
+
     blog_dir = Path("blog_html")
+
+    livereload = None
+    if args.watch:
+        livereload = LiveReload()
+        start_watcher(livereload)
+
     if not blog_dir.exists():
         print("❌ blog_html directory not found. Run 'python blog_generator.py' first.")
         return
-    
-    os.chdir(blog_dir)
-    
+
+    handler = functools.partial(BlogRequestHandler, directory=str(blog_dir))
+    netlify_rules = NetlifyRules(blog_dir)
+    report_netlify_rules(netlify_rules, blog_dir)
+    BlogRequestHandler.netlify_rules = netlify_rules
+    BlogRequestHandler.livereload = livereload
+    BlogRequestHandler.file_cache = FileCache(max_bytes=args.cache_mb * 1024 * 1024)
+    BlogRequestHandler.quiet = args.quiet
+
     PORT = 8000
-    
+
     # Find an available port
+    httpd = None
     while PORT < 8010:
         try:
-            with socketserver.TCPServer(("", PORT), http.server.SimpleHTTPRequestHandler) as httpd:
-                print(f"🚀 Starting server at http://localhost:{PORT}")
-                print(f"📝 Serving blog from: {blog_dir.absolute()}")
-                print(f"🌐 Open http://localhost:{PORT} in your browser")
-                print("📊 Press Ctrl+C to stop the server")
-                
-                # Try to open browser automatically
-                try:
-                    webbrowser.open(f"http://localhost:{PORT}")
-                except:
-                    pass
-                
-                httpd.serve_forever()
+            httpd = http.server.ThreadingHTTPServer(("", PORT), handler)
+            break
         except OSError:
             PORT += 1
-    
-    print("❌ Could not find an available port between 8000-8009")
+
+    if httpd is None:
+        print("❌ Could not find an available port between 8000-8009")
+        return
+
+    # Bound first, so the port answers while the search index is built
+    BlogRequestHandler.search_engine = None if args.no_search else start_search_engine()
+
+    with httpd:
+        print(f"🚀 Starting server at http://localhost:{PORT}")
+        print(f"📝 Serving blog from: {blog_dir.absolute()}")
+        print(f"🌐 Open http://localhost:{PORT} in your browser")
+        if livereload is not None:
+            print("🔄 Live reload enabled")
+        print("📊 Press Ctrl+C to stop the server")
+
+        # Try to open browser automatically
+        if not args.no_browser:
+            try:
+                webbrowser.open(f"http://localhost:{PORT}")
+            except Exception:
+                pass
+
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Server stopped")
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Content-derived timestamps for reproducible builds of the QRTick blog.
+
+Pages must never carry the time of the build itself, or every build would
+change every page. Dates come from the sources instead: the time of the last
+git commit that touched a post, clamped to SOURCE_DATE_EPOCH when that is
+set (https://reproducible-builds.org/specs/source-date-epoch/), falling back
+to SOURCE_DATE_EPOCH alone and finally to the post's frontmatter date.
+"""
+
+import os
+import subprocess
+from datetime import datetime, timezone
+
+
+def source_date_epoch():
+    """The SOURCE_DATE_EPOCH environment variable as a UTC datetime, or None"""
+    value = os.environ.get('SOURCE_DATE_EPOCH')
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(int(value), tz=timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        print(f"⚠️  Ignoring invalid SOURCE_DATE_EPOCH: {value!r}")
+        return None
+
+
+def git_commit_times(directory):
+    """Return {path relative to directory: UTC datetime of its last commit}
+
+    Files git doesn't track (or a directory outside any repository) are
+    simply missing from the result.
+    """
+    try:
+        output = subprocess.run(
+            ['git', 'log', '--format=%x00%ct', '--name-only', '--relative', '--', '.'],
+            cwd=str(directory), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    times = {}
+    commit_time = None
+    # Newest commit first, so the first time a path shows up is its latest change
+    for line in output.splitlines():
+        if line.startswith('\0'):
+            commit_time = datetime.fromtimestamp(int(line[1:]), tz=timezone.utc)
+        elif line and commit_time is not None:
+            times.setdefault(line, commit_time)
+    return times
+
+
+def modified_dates(directory, names):
+    """Return {name: 'YYYY-MM-DD' or None}, the last-modified date of each source"""
+    epoch = source_date_epoch()
+    commits = git_commit_times(directory)
+    dates = {}
+    for name in names:
+        moment = commits.get(name)
+        if moment is None:
+            moment = epoch
+        elif epoch is not None:
+            moment = min(moment, epoch)
+        dates[name] = moment.strftime('%Y-%m-%d') if moment else None
+    return dates
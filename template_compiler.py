@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Precompiled page templates for the QRTick blog generator.
+
+The page templates are str.format strings carrying several kilobytes of
+escaped CSS. CompiledTemplate parses such a template once into pre-encoded
+static byte chunks and named slots, so rendering a page is a single join
+instead of a fresh scan and unescape of the whole template.
+"""
+
+import string
+
+
+class CompiledTemplate:
+    """A str.format-style template compiled into static chunks and named slots"""
+
+    def __init__(self, source, encoding='utf-8'):
+        self.encoding = encoding
+        self.slots = []
+        parts = []
+        pending = []
+
+        for literal, field_name, format_spec, conversion in string.Formatter().parse(source):
+            pending.append(literal)
+            if field_name is None:
+                continue
+            if not field_name.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{field_name}}}")
+            parts.append(''.join(pending).encode(encoding))
+            pending = []
+            parts.append(None)
+            self.slots.append((len(parts) - 1, field_name))
+
+        parts.append(''.join(pending).encode(encoding))
+        # Even positions hold static chunks, odd positions are filled per render
+        self.parts = parts
+
+    @property
+    def slot_names(self):
+        return [name for _, name in self.slots]
+
+    def render(self, **values):
+        """Render the template to bytes"""
+        parts = list(self.parts)
+        encoding = self.encoding
+        for position, name in self.slots:
+            value = values[name]
+            if not isinstance(value, str):
+                value = str(value)
+            parts[position] = value.encode(encoding)
+        return b''.join(parts)